@@ -1,11 +1,25 @@
-from tensorflow import Tensor, float64, random, stack, fill
+from typing import Optional
+
+from tensorflow import (
+    Tensor,
+    cast,
+    concat,
+    constant,
+    exp,
+    fill,
+    float64,
+    random,
+    stack,
+    transpose,
+    zeros,
+)
 
-from dateutil.relativedelta import relativedelta
 from ..models.stochasticprocess import StochasticProcess
 from ..models.hullwhite import HullWhiteProcess
+from ..models.g2 import G2PlusPlusProcess
 from ..timehandles.grid import DateGrid
-from ..timehandles.daycounter import DayCounter, DayCounterConvention
-from ..markethandles.ircurve import RateCurve
+from ..markethandles.simulatedcurves import SimulatedCurveSet
+from ..numericalhandles.randomsource import RandomSource
 
 
 class GaussianPathGenerator:
@@ -15,44 +29,66 @@ class GaussianPathGenerator:
     Attributes:
         _process (StochasticProcess): The stochastic process being simulated.
         _date_grid (DateGrid): Grid of time points for the simulation.
-        _generator: Pseudo-random number generator (currently not implemented).
+        _generator (RandomSource): Source of the Gaussian increments, or None for
+            ``tensorflow.random.normal`` draws.
         _state_variable: The generated paths from the simulation (initialized to None).
     """
 
-    def __init__(self, process: StochasticProcess, date_grid: DateGrid) -> None:
+    def __init__(
+        self,
+        process: StochasticProcess,
+        date_grid: DateGrid,
+        generator: Optional[RandomSource] = None,
+    ) -> None:
         """
         Initializes the GaussianPathGenerator with a stochastic process and a date grid.
 
         Args:
             process (StochasticProcess): The stochastic process to be simulated.
             date_grid (DateGrid): The grid of dates over which the simulation will be performed.
+            generator (Optional[RandomSource]): Source of the Gaussian increments
+                (e.g. a SobolRandomSource). Defaults to ``tensorflow.random.normal``.
         """
         self._process = process
         self._date_grid = date_grid
-        self._generator = None  # TODO implementation of pseudo-random number generator
+        self._generator = generator
         self._state_variable = None
 
     def simulate(self, n_paths: int) -> Tensor:
         """
         Simulates paths for the given number of paths using the underlying stochastic process.
 
+        Processes with an exact whole-path simulation (``evolve_paths``, e.g.
+        :class:`HullWhiteProcess`) are simulated on all dates at once from one
+        ``[n_paths, n_dates - 1]`` draw; other processes are evolved date by date.
+
         Args:
             n_paths (int): Number of paths to simulate.
 
         Returns:
             Tensor: Tensor containing the simulated paths.
         """
-        path = []
-        path.append(fill((n_paths,), value=self._process.initial_values()))
+        dtype = self._process.dtype
         time_grid = self._date_grid.times
+        steps = [t - time_grid[0] for t in time_grid[1:]]
+        if self._generator is None:
+            dw = random.normal(shape=(n_paths, len(steps)), dtype=dtype)
+        else:
+            dw = self._generator.increments(n_paths, steps, dtype)
+        x0 = fill((n_paths,), value=cast(self._process.initial_values(), dtype))
+        if hasattr(self._process, "evolve_paths"):
+            paths = self._process.evolve_paths(time_grid[1:], dw)
+            self._state_variable = concat([x0[:, None], paths], axis=1)
+            return self._state_variable
+        path = [x0]
         for i in range(1, len(time_grid)):
-            w = random.normal(shape=(n_paths,), mean=0, stddev=1, dtype=float64)
             s = time_grid[i - 1]
             t = time_grid[i]
             dt = t - s
-            x_t = self._process.evolve(s, path[i - 1], dt, w)
+            x_t = self._process.evolve(s, path[i - 1], dt, dw[:, i - 1])
             path.append(x_t)
         self._state_variable = stack(path, axis=1)
+        return self._state_variable
 
     @property
     def process(self) -> StochasticProcess:
@@ -75,14 +111,14 @@ class GaussianPathGenerator:
         return self._date_grid
 
     @property
-    def generator(self):
+    def generator(self) -> Optional[RandomSource]:
         """
-        Placeholder for a pseudo-random number generator.
+        Returns the source of the Gaussian increments.
 
         Returns:
-            None: The generator is not implemented yet.
+            Optional[RandomSource]: The random source, or None for ``tensorflow.random.normal`` draws.
         """
-        return None
+        return self._generator
 
     @property
     def state_variable(self) -> Tensor:
@@ -110,61 +146,170 @@ class HullWhiteShortRateGenerator(GaussianPathGenerator):
         _process (HullWhiteProcess): The Hull-White process used for short-rate simulation.
     """
 
-    def __init__(self, process: HullWhiteProcess, date_grid: DateGrid) -> None:
+    #: Default curve tenors: 1-4 days, 1-2 weeks, 1-11 months, 1-14 years and
+    #: 20, 25, 30 and 40 years.
+    DEFAULT_TENORS = (
+        [d / 365.0 for d in range(1, 5)]
+        + [7.0 * w / 365.0 for w in range(1, 3)]
+        + [m / 12.0 for m in range(1, 12)]
+        + [float(y) for y in list(range(1, 15)) + [20, 25, 30, 40]]
+    )
+
+    def __init__(
+        self,
+        process: HullWhiteProcess,
+        date_grid: DateGrid,
+        generator: Optional[RandomSource] = None,
+    ) -> None:
         """
         Initializes the GaussianShortRateGenerator with a Hull-White process and a date grid.
 
         Args:
             process (HullWhiteProcess): The Hull-White process to be used for short-rate simulation.
             date_grid (DateGrid): The grid of dates over which the short-rate curves will be simulated.
+            generator (Optional[RandomSource]): Source of the Gaussian increments.
         """
-        super().__init__(process, date_grid)
+        super().__init__(process, date_grid, generator)
 
-    def simulate_curves(self, n_paths: int) -> Tensor:
+    def simulate_curves(
+        self, n_paths: int, tenors: Optional[list[float]] = None
+    ) -> SimulatedCurveSet:
         """
         Simulates yield curves for the given number of paths using the Hull-White process.
 
+        The discount factors ``P(t_i, t_i + tau_j)`` of every grid date, tenor and
+        path come from one broadcasted evaluation of the affine bond formula
+        ``A(t_i, t_i + tau_j) exp(-B(t_i, t_i + tau_j) r(t_i))``.
+
         Args:
             n_paths (int): Number of paths to simulate.
+            tenors (Optional[list[float]]): Increasing year fractions of the curve
+                tenors. Defaults to ``DEFAULT_TENORS`` (1 day to 40 years).
 
         Returns:
-            tensorflow.Tensor: Tensor containing the simulated yield curves.
-        """
-        self.simulate(n_paths)
-        curve_tensor = []
-        for i in range(len(self._date_grid.dates)):
-            curve_date = self._date_grid.dates[i]
-
-            curve_dates = [curve_date]
-            curve_dates += [curve_date + relativedelta(days=i) for i in range(1, 5)]
-            curve_dates += [curve_date + relativedelta(weeks=i) for i in range(1, 3)]
-            curve_dates += [curve_date + relativedelta(months=i) for i in range(1, 12)]
-            curve_dates += [curve_date + relativedelta(years=i) for i in range(1, 15)]
-            curve_dates += [
-                curve_date + relativedelta(years=i) for i in [20, 25, 30, 40]
-            ]
-            curve_taus = [
-                DayCounter(DayCounterConvention.ActualActual).year_fraction(
-                    curve_date, d
-                )
-                for d in curve_dates
-            ]
-            bonds_tmp = stack(
-                [
-                    self._process.zero_bond(
-                        self._date_grid.times[i],
-                        self._date_grid.times[i] + tau,
-                        self.state_variable[:, i],
-                    )
-                    for tau in curve_taus
-                ]
-            )  # TODO too slow, should be optimized
-            curve_tensor_tmp = RateCurve.from_zcb(
-                curve_date,
-                curve_taus,
-                bonds_tmp,
-                "LINEAR",
-                DayCounterConvention.ActualActual,
-            )
-            curve_tensor.append(curve_tensor_tmp)
-        return curve_tensor
+            SimulatedCurveSet: The simulated curves ``[n_dates, n_tenors, n_paths]``.
+        """
+        short_rate = self.simulate(n_paths)
+        dtype = self._process.dtype
+        tenors = self.DEFAULT_TENORS if tenors is None else tenors
+        S = constant(self._date_grid.times, dtype=float64)[:, None]
+        T = S + constant(tenors, dtype=float64)[None, :]
+        A, B = self._process.A_B(S, T)
+        rates = transpose(short_rate)[:, None, :]
+        bonds = A[:, :, None] * exp(-B[:, :, None] * rates)
+        return SimulatedCurveSet(
+            self._date_grid.dates,
+            self._date_grid.times,
+            cast(tenors, dtype),
+            bonds,
+            self._date_grid.daycounter_convention,
+        )
+
+
+class G2PlusPlusShortRateGenerator(GaussianPathGenerator):
+    """
+    A generator for simulating the factors and curves of the G2++ two-factor model.
+
+    Both factors are simulated on all dates at once with their exact joint
+    transition (:meth:`G2PlusPlusProcess.evolve_paths`), so a two-factor run
+    costs about as much as a Hull-White one.
+
+    Attributes:
+        _process (G2PlusPlusProcess): The G2++ process.
+        _state_variable: The simulated factors ``[n_paths, n_dates, 2]``.
+    """
+
+    DEFAULT_TENORS = HullWhiteShortRateGenerator.DEFAULT_TENORS
+
+    def __init__(
+        self,
+        process: G2PlusPlusProcess,
+        date_grid: DateGrid,
+        generator: Optional[RandomSource] = None,
+    ) -> None:
+        """
+        Initializes the generator with a G2++ process and a date grid.
+
+        Args:
+            process (G2PlusPlusProcess): The G2++ process to be simulated.
+            date_grid (DateGrid): The grid of dates over which the factors will be simulated.
+            generator (Optional[RandomSource]): Source of the Gaussian increments.
+        """
+        super().__init__(process, date_grid, generator)
+
+    def simulate(self, n_paths: int) -> Tensor:
+        """
+        Simulates the two factors for the given number of paths.
+
+        The independent normals of the two factors are drawn together as a
+        ``[n_paths, n_dates - 1, 2]`` block, one Brownian motion per factor
+        (e.g. one Brownian bridge each with a Sobol source).
+
+        Args:
+            n_paths (int): Number of paths to simulate.
+
+        Returns:
+            Tensor: The factors (x, y) on every grid date ``[n_paths, n_dates, 2]``.
+        """
+        dtype = self._process.dtype
+        time_grid = self._date_grid.times
+        steps = [t - time_grid[0] for t in time_grid[1:]]
+        if self._generator is None:
+            dw = random.normal(shape=(n_paths, len(steps), 2), dtype=dtype)
+        else:
+            dw = self._generator.increments(n_paths, steps, dtype, factors=2)
+        factors = self._process.evolve_paths(steps, dw)
+        self._state_variable = concat(
+            [zeros([n_paths, 1, 2], dtype=dtype), factors], axis=1
+        )
+        return self._state_variable
+
+    @property
+    def short_rate(self) -> Tensor:
+        """
+        Returns the short rate ``r(t) = x(t) + y(t) + phi(t)`` on the simulated paths.
+
+        Raises:
+            ValueError: If `simulate` method has not been called before accessing this property.
+
+        Returns:
+            tensorflow.Tensor: The short rate ``[n_paths, n_dates]``.
+        """
+        factors = self.state_variable
+        times = constant(self._date_grid.times, dtype=float64)
+        return factors[..., 0] + factors[..., 1] + self._process.phi(times)[None, :]
+
+    def simulate_curves(
+        self, n_paths: int, tenors: Optional[list[float]] = None
+    ) -> SimulatedCurveSet:
+        """
+        Simulates yield curves for the given number of paths using the G2++ process.
+
+        The discount factors ``P(t_i, t_i + tau_j)`` of every grid date, tenor and
+        path come from one broadcasted evaluation of the affine bond formula
+        ``A exp(-B_x x(t_i) - B_y y(t_i))``.
+
+        Args:
+            n_paths (int): Number of paths to simulate.
+            tenors (Optional[list[float]]): Increasing year fractions of the curve
+                tenors. Defaults to ``DEFAULT_TENORS`` (1 day to 40 years).
+
+        Returns:
+            SimulatedCurveSet: The simulated curves ``[n_dates, n_tenors, n_paths]``.
+        """
+        factors = self.simulate(n_paths)
+        dtype = self._process.dtype
+        tenors = self.DEFAULT_TENORS if tenors is None else tenors
+        S = constant(self._date_grid.times, dtype=float64)[:, None]
+        T = S + constant(tenors, dtype=float64)[None, :]
+        A, Bx, By = self._process.A_Bx_By(S, T)
+        x = transpose(factors[..., 0])[:, None, :]
+        y = transpose(factors[..., 1])[:, None, :]
+        bonds = A[:, :, None] * exp(-Bx[:, :, None] * x - By[:, :, None] * y)
+        return SimulatedCurveSet(
+            self._date_grid.dates,
+            self._date_grid.times,
+            cast(tenors, dtype),
+            bonds,
+            self._date_grid.daycounter_convention,
+        )
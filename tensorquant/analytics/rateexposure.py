@@ -1,39 +1,70 @@
+from bisect import bisect_right
+from typing import Optional, Union
+
 import numpy
-from tensorflow import Tensor, float64, reduce_mean, stack, zeros
+from tensorflow import (
+    Tensor,
+    constant,
+    maximum,
+    minimum,
+    reduce_mean,
+    reduce_sum,
+    stack,
+    where,
+)
 
 
 from ..models.hullwhite import HullWhiteProcess
+from ..models.g2 import G2PlusPlusProcess
 from ..timehandles.grid import DateGrid
 from ..instruments.swap import Swap
-from ..pricers.swapdiscounting import SwapPricer
-from .gaussiankernel import HullWhiteShortRateGenerator
-from ..timehandles.utils import Settings
-from ..markethandles.utils import market_map
+from .gaussiankernel import G2PlusPlusShortRateGenerator, HullWhiteShortRateGenerator
+from ..markethandles.simulatedcurves import SimulatedCurveSet
+from ..markethandles.utils import SwapType
+from ..numericalhandles.randomsource import RandomSource
 
 
 class SwapExposureGenerator:
     """
-    A class for simulating exposure and expected exposure of a swap using the Hull-White short rate model.
+    A class for simulating exposure and expected exposure of a swap using the Hull-White
+    or the G2++ short rate model.
+
+    The swap is valued on every grid date and path at once from the simulated
+    curves (:class:`SimulatedCurveSet`), which both discount and project the
+    floating leg. Coupons fixing between two grid dates take their fixing on
+    each path from the curve simulated on the last grid date before the
+    fixing; adding the fixing dates to the grid makes the fixings exact.
 
     Attributes:
-        _model (HullWhiteProcess): The Hull-White process model for simulating interest rates.
+        _model (Union[HullWhiteProcess, G2PlusPlusProcess]): The short rate model for simulating interest rates.
         _date_grid (DateGrid): A grid of dates over which the exposure is evaluated.
-        _kernel (HullWhiteShortRateGenerator): A kernel for simulating short rates using the Hull-White model.
-        _exposure (tf.Tensor): Simulated exposure of the swap (initialized to None).
+        _kernel (Union[HullWhiteShortRateGenerator, G2PlusPlusShortRateGenerator]): A kernel
+            for simulating the curves of the model.
+        _exposure (tf.Tensor): Simulated exposure of the swap ``[n_dates, n_paths]`` (initialized to None).
         _expected_exposure (tf.Tensor): Expected exposure of the swap (initialized to None).
     """
 
-    def __init__(self, model: HullWhiteProcess, date_grid: DateGrid) -> None:
+    def __init__(
+        self,
+        model: Union[HullWhiteProcess, G2PlusPlusProcess],
+        date_grid: DateGrid,
+        generator: Optional[RandomSource] = None,
+    ) -> None:
         """
-        Initializes the SwapExposureGenerator with a Hull-White model and a date grid.
+        Initializes the SwapExposureGenerator with a short rate model and a date grid.
 
         Args:
-            model (HullWhiteProcess): The Hull-White model to be used for interest rate simulation.
+            model (Union[HullWhiteProcess, G2PlusPlusProcess]): The model to be used for
+                interest rate simulation.
             date_grid (DateGrid): The grid of dates over which the exposure will be simulated.
+            generator (Optional[RandomSource]): Source of the Gaussian increments of the kernel.
         """
         self._model = model
         self._date_grid = date_grid
-        self._kernel = HullWhiteShortRateGenerator(model, date_grid)
+        if isinstance(model, G2PlusPlusProcess):
+            self._kernel = G2PlusPlusShortRateGenerator(model, date_grid, generator)
+        else:
+            self._kernel = HullWhiteShortRateGenerator(model, date_grid, generator)
         self._exposure = None
         self._expected_exposure = None
 
@@ -48,22 +79,25 @@ class SwapExposureGenerator:
         return self._date_grid
 
     @property
-    def model(self) -> HullWhiteProcess:
+    def model(self) -> Union[HullWhiteProcess, G2PlusPlusProcess]:
         """
-        Returns the Hull-White model used for rate simulation.
+        Returns the short rate model used for rate simulation.
 
         Returns:
-            HullWhiteProcess: The Hull-White interest rate model.
+            Union[HullWhiteProcess, G2PlusPlusProcess]: The interest rate model.
         """
         return self._model
 
     @property
-    def kernel(self) -> HullWhiteShortRateGenerator:
+    def kernel(
+        self,
+    ) -> Union[HullWhiteShortRateGenerator, G2PlusPlusShortRateGenerator]:
         """
         Returns the short rate kernel for simulating interest rates.
 
         Returns:
-            HullWhiteShortRateGenerator: The kernel for generating short rates.
+            Union[HullWhiteShortRateGenerator, G2PlusPlusShortRateGenerator]: The kernel
+                for generating short rates.
         """
         return self._kernel
 
@@ -91,78 +125,166 @@ class SwapExposureGenerator:
             ValueError: If the simulate method has not been called before accessing the exposure.
 
         Returns:
-            tf.Tensor: The simulated exposure of the swap.
+            tf.Tensor: The simulated exposure of the swap ``[n_dates, n_paths]``.
         """
         if self._exposure is None:
             raise ValueError("Must call simulate()")
         return self._exposure
 
-    def simulate(self, n_path: float, product: Swap, last_fixing: float) -> None:
+    @property
+    def expected_positive_exposure(self) -> Tensor:
+        """
+        Returns the expected positive exposure profile ``E[max(V(t), 0)]``.
+
+        Raises:
+            ValueError: If the simulate method has not been called before.
+
+        Returns:
+            tf.Tensor: The expected positive exposure on each grid date.
+        """
+        return reduce_mean(maximum(self.exposure, 0.0), axis=1)
+
+    @property
+    def expected_negative_exposure(self) -> Tensor:
+        """
+        Returns the expected negative exposure profile ``E[min(V(t), 0)]``.
+
+        Raises:
+            ValueError: If the simulate method has not been called before.
+
+        Returns:
+            tf.Tensor: The expected negative exposure on each grid date.
+        """
+        return reduce_mean(minimum(self.exposure, 0.0), axis=1)
+
+    def potential_future_exposure(self, quantile: float = 0.95) -> Tensor:
+        """
+        Returns the potential future exposure profile, the ``quantile`` of ``max(V(t), 0)``.
+
+        Args:
+            quantile (float): The confidence level. Defaults to 0.95.
+
+        Raises:
+            ValueError: If the simulate method has not been called before.
+
+        Returns:
+            tf.Tensor: The potential future exposure on each grid date.
+        """
+        positive = numpy.maximum(self.exposure.numpy(), 0.0)
+        return constant(
+            numpy.quantile(positive, quantile, axis=1), dtype=self.exposure.dtype
+        )
+
+    def simulate(
+        self, n_path: int, product: Swap, last_fixing: Optional[float] = None
+    ) -> None:
         """
         Simulates swap exposure and expected exposure for the given number of paths and swap product.
 
         Args:
-            n_path (float): Number of paths to simulate.
+            n_path (int): Number of paths to simulate.
             product (Swap): The swap instrument for which exposure is being calculated.
-            last_fixing (float): The last fixing rate for the floating leg of the swap.
+            last_fixing (Optional[float]): The fixing of the floating coupons fixed on
+                or before the first grid date. Defaults to the historical fixings
+                of the swap index.
 
         Raises:
-            ValueError: If invalid inputs are provided or simulation encounters an issue.
+            ValueError: If a historical fixing is missing from the index.
 
         Simulates the exposure and stores the results in `_exposure` and `_expected_exposure`.
         """
+        curves = self._kernel.simulate_curves(n_path)
+        dates = numpy.array(self._date_grid.dates, dtype="datetime64[D]")
+        times = curves.times.numpy()
+        sign = 1.0 if product.swap_type == SwapType.Payer else -1.0
 
-        simulated_curves = self._kernel.simulate_curves(n_path)
-
-        transaction_fixing_dates = product.floating_leg.display_flows()[
-            "fixing_date"
-        ].values
-        transaction_fixing_rates = numpy.zeros(shape=transaction_fixing_dates.shape[0])
-        simulated_fixing_dates = [
-            product.floating_leg.index.fixing_date(d) for d in self._date_grid.dates
-        ]
-        simulated_fixing_rates = reduce_mean(
-            self._kernel.state_variable, axis=0
-        ).numpy()
-        simulated_fixing_rates[0] = last_fixing
-        # create fixings lookup table
-        fixings_lookup_table = {}
-        for i in range(len(simulated_fixing_dates)):
-            fixings_lookup_table[simulated_fixing_dates[i]] = simulated_fixing_rates[i]
-        # # add transaction fixing rates for a given date from fixings lookup table
-        for i in range(len(transaction_fixing_dates)):
-            if transaction_fixing_dates[i] in fixings_lookup_table:
-                transaction_fixing_rates[i] = fixings_lookup_table[
-                    transaction_fixing_dates[i]
-                ]
-            else:
-                # find the nearest fixing from lookup table
-                transaction_fixing_rates[i] = fixings_lookup_table.get(
-                    transaction_fixing_dates[i],
-                    fixings_lookup_table[
-                        min(
-                            fixings_lookup_table.keys(),
-                            key=lambda d: abs(d - transaction_fixing_dates[i]),
-                        )
-                    ],
-                )
-        for i, d in enumerate(transaction_fixing_dates):
-            product.floating_leg.index.add_fixing(d, transaction_fixing_rates[i])
-
-        exposure = []
-        swap_engine = SwapPricer(market_map)
-
-        for i in range(len(self._date_grid.dates)):
-            market_simulated = {}
-            market_simulated[product.discount_curve] = simulated_curves[i]
-            market_simulated[product.estimation_curve] = simulated_curves[i]
-            val_date = self._date_grid.dates[i]
-            Settings.evaluation_date = val_date
-            if self._date_grid.dates[i] > product.end_date:
-                pv = zeros(shape=(n_path,), dtype=float64)
+        fixed_leg = self._fixed_leg_values(curves, dates, times, product)
+        floating_leg = self._floating_leg_values(
+            curves, dates, times, product, last_fixing
+        )
+        self._exposure = sign * (floating_leg - fixed_leg)
+        self._expected_exposure = reduce_mean(self._exposure, axis=1)
+
+    def _flow_times(self, flow_dates: list) -> numpy.ndarray:
+        """Year fractions of dates from the first grid date, on the grid's day count."""
+        return self._date_grid.daycounter.year_fraction_array(
+            self._date_grid.dates[0], flow_dates
+        )
+
+    @staticmethod
+    def _discount_flows(
+        curves: SimulatedCurveSet,
+        times: numpy.ndarray,
+        flow_times: numpy.ndarray,
+        alive: numpy.ndarray,
+    ) -> Tensor:
+        """Discount factors ``[n_dates, n_flows, n_paths]`` of flows seen from each grid date."""
+        tau = numpy.where(alive, flow_times[None, :] - times[:, None], 0.0)
+        return curves.discount(tau)
+
+    def _fixed_leg_values(self, curves, dates, times, product: Swap) -> Tensor:
+        """Values ``[n_dates, n_paths]`` of the fixed leg on every grid date and path."""
+        flows = product.fixed_leg.leg_flows
+        pay_dates = numpy.array([cf.date for cf in flows], dtype="datetime64[D]")
+        alive = pay_dates[None, :] > dates[:, None]
+        amounts = numpy.array([float(cf.amount) for cf in flows])
+        weights = constant(
+            numpy.where(alive, amounts[None, :], 0.0), dtype=curves.dtype
+        )
+        discount = self._discount_flows(
+            curves, times, self._flow_times([cf.date for cf in flows]), alive
+        )
+        return reduce_sum(weights[:, :, None] * discount, axis=1)
+
+    def _floating_leg_values(
+        self, curves, dates, times, product: Swap, last_fixing: Optional[float]
+    ) -> Tensor:
+        """Values ``[n_dates, n_paths]`` of the floating leg with pathwise fixings."""
+        flows = product.floating_leg.leg_flows
+        index = product.floating_leg.index
+        dtype = curves.dtype
+        pay_dates = numpy.array([cf.date for cf in flows], dtype="datetime64[D]")
+        fixing_dates = [cf.fixing_date for cf in flows]
+        alive = pay_dates[None, :] > dates[:, None]
+        forecast = (
+            numpy.array(fixing_dates, dtype="datetime64[D]")[None, :] > dates[:, None]
+        )
+
+        starts = self._flow_times([cf.ref_period_start for cf in flows])
+        ends = self._flow_times([cf.ref_period_end for cf in flows])
+        taus = index.daycounter.year_fraction_array(
+            [cf.ref_period_start for cf in flows], [cf.ref_period_end for cf in flows]
+        )
+        # forwards of the reference periods not started yet, seen from each grid date
+        started = starts[None, :] < times[:, None]
+        forwards = (
+            self._discount_flows(curves, times, starts, ~started)
+            / self._discount_flows(curves, times, ends, ~started)
+            - 1.0
+        ) / constant(taus, dtype=dtype)[None, :, None]
+
+        # pathwise fixings: the forward on the last grid date before each fixing
+        grid_dates = self._date_grid.dates
+        fixings = []
+        for k, fixing_date in enumerate(fixing_dates):
+            if fixing_date <= grid_dates[0]:
+                rate = index.fixing(fixing_date) if last_fixing is None else last_fixing
+                fixings.append(constant(rate, dtype=dtype, shape=[curves.n_paths]))
             else:
-                swap_engine.price(product, market_simulated)
-                pv = product.price
-            exposure.append(pv)
-        self._exposure = stack(exposure, axis=0)
-        self._expected_exposure = reduce_mean(exposure, axis=1)
+                j = bisect_right(grid_dates, fixing_date) - 1
+                fixings.append(forwards[j, k])
+        rates = where(constant(forecast)[:, :, None], forwards, stack(fixings)[None])
+
+        accruals = numpy.array([cf.accrual_period for cf in flows])
+        nominals = numpy.array([cf.nominal for cf in flows], dtype=numpy.float64)
+        gearings = numpy.array([cf.gearing for cf in flows], dtype=numpy.float64)
+        spreads = numpy.array([cf.spread for cf in flows], dtype=numpy.float64)
+        scale = numpy.where(alive, (nominals * accruals)[None, :], 0.0)
+        amounts = constant(scale, dtype=dtype)[:, :, None] * (
+            constant(gearings, dtype=dtype)[None, :, None] * rates
+            + constant(spreads, dtype=dtype)[None, :, None]
+        )
+        discount = self._discount_flows(
+            curves, times, self._flow_times([cf.date for cf in flows]), alive
+        )
+        return reduce_sum(amounts * discount, axis=1)
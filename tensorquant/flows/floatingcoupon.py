@@ -124,6 +124,30 @@ class FloatingCoupon(Coupon):
         """
         return self._index
 
+    @property
+    def gearing(self) -> float:
+        """
+        Returns the gearing (multiplier) applied to the index fixing.
+
+        Returns:
+        -------
+        float
+            The gearing of the coupon.
+        """
+        return self._gearing
+
+    @property
+    def spread(self) -> float:
+        """
+        Returns the spread added to the geared index fixing.
+
+        Returns:
+        -------
+        float
+            The spread of the coupon.
+        """
+        return self._spread
+
     @property
     def is_in_arrears(self) -> bool:
         """
@@ -1,8 +1,8 @@
 import datetime
 from typing import Callable, List, Optional, Sequence
 
-import numpy as np
 import pandas as pd
+import tensorflow as tf
 
 from .product import Product
 from ..markethandles.utils import Currency
@@ -175,5 +175,7 @@ class AutocallableOption(Product):
 
             put_redemption(S_T, K, partecipation)
                 = -max(K - S_T, 0) / K * partecipation
+
+        Accetta array NumPy o tensori TensorFlow (tracciabile in ``tf.function``).
         """
-        return np.maximum(strike - S_T, 0) / strike * partecipation
+        return tf.maximum(strike - S_T, 0.0) / strike * partecipation
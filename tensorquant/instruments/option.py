@@ -20,7 +20,9 @@ class Option(Product, ABC):
     ):
         super().__init__(ccy, start_date, end_date)
         self._option_type = option_type
-        self._strike = tf.Variable(strike, dtype=tf.float32)
+        # contract data: independent of the precision policy, pricers cast it
+        # to their working dtype
+        self._strike = tf.Variable(strike, dtype=tf.float64)
         self._underlying = underlying
         self._exercise_type = exercise_type
         self._implied_volatility = None
@@ -105,6 +105,16 @@ class Swap(Product):
         """
         return self._floating_leg
 
+    @property
+    def index(self) -> Index:
+        """
+        Get the index of the floating leg of the swap.
+
+        Returns:
+            The index fixing the floating coupons.
+        """
+        return self._index
+
     @property
     def fixed_rate(self):
         return self._fixed_rate
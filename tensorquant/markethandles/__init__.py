@@ -1,5 +1,6 @@
 from .interestrate import *
 from .ircurve import *
+from .simulatedcurves import *
 from .utils import *
 from .bootstrapping import *
 from .volatilitysurface import *
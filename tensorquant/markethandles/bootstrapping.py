@@ -1,4 +1,7 @@
 import datetime
+import functools
+from typing import Optional
+
 import numpy
 import tensorflow as tf
 import pandas as pd
@@ -17,7 +20,7 @@ from ..instruments.helpers import (
     SwapGenerator,
 )
 from ..pricers.factory import PricerAssignment
-from ..numericalhandles.newton import newton
+from ..numericalhandles.newton import newton, newton_1d
 from ..markethandles.utils import Currency
 from ..index.curverateindex import OvernightIndex, IborIndex
 
@@ -117,6 +120,11 @@ class CurveBootstrap:
         interpolation: str = "LINEAR",
         is_spread_curve: bool = False,
         daycounter_convention=DayCounterConvention.ActualActual,
+        full_jacobian: bool = False,
+        use_pfor: bool = True,
+        method: str = "global",
+        warm_start: Optional[RateCurve] = None,
+        broyden: bool = False,
     ):
         """
         Bootstraps an interest rate curve from market quotes and instrument generators.
@@ -124,6 +132,21 @@ class CurveBootstrap:
         The bootstrapped curve is registered in the market environment under ``curve_name``
         so that subsequent ``strip()`` calls can reference it as a discount / forward curve.
 
+        With ``method="global"`` all pillars are solved together by a multi-dimensional
+        Newton method that reprices every instrument at each iteration. With
+        ``method="sequential"`` the pillars are solved one at a time with ``newton_1d``,
+        repricing only instrument *i* while solving pillar *i*; this relies on the
+        instruments being triangular (instrument *i* depends only on pillars ≤ *i*) and
+        falls back to the global solve, warm-started from the sequential pillars, when
+        that structure is violated.
+
+        When re-stripping after a small quote move, pass the previous curve as
+        ``warm_start``: its rates replace the flat initial guess and its Jacobian seeds
+        the first Newton step. Combined with ``broyden=True`` the Jacobian is then only
+        refreshed by rank-1 updates during the solve, so a re-strip costs one or two
+        residual evaluations and a single autodiff pass for the exact Jacobian at the
+        solution.
+
         Args:
             generators (list[str]): A list of instrument generators (e.g., "Dp" for deposit, "Os" for OIS).
             maturities (list[str]): A list of instrument maturities (e.g., "1M", "6M", "1Y").
@@ -133,13 +156,35 @@ class CurveBootstrap:
             interpolation (str, optional): The type of interpolation (default is "LINEAR").
             is_spread_curve (bool, optional): Whether the curve is a spread curve (default is False).
             daycounter_convention (DayCounterConvention, optional): The day count convention for the curve (default is ActualActual).
+            full_jacobian (bool, optional): Whether to build the whole Jacobian from a single
+                compiled NPV vector with ``tape.jacobian`` (default is False, i.e. one eager
+                tape per instrument). The compiled system is traced once per strip.
+            use_pfor (bool, optional): Whether ``tape.jacobian`` vectorizes the reverse
+                sweeps with ``pfor`` (default is True). Only used when ``full_jacobian`` is True.
+            method (str, optional): The solution method, "global" or "sequential"
+                (default is "global").
+            warm_start (Optional[RateCurve], optional): A previously bootstrapped curve on
+                the same instruments whose rates (and Jacobian, if set) are used as the
+                starting point (default is None).
+            broyden (bool, optional): Whether the global Newton solve uses Broyden rank-1
+                Jacobian updates after the first iteration (default is False). The stored
+                ``jacobian`` is still the exact one, evaluated once at the solution.
 
         Returns:
             RateCurve: The bootstrapped interest rate curve.
 
         Raises:
             KeyError: If the generator key does not exist in the generator map.
+            ValueError: If the solution method is unsupported or the warm start curve
+                does not have one rate per instrument.
         """
+        if method not in ("global", "sequential"):
+            raise ValueError(f"Unsupported bootstrap method: {method}")
+        if warm_start is not None and len(warm_start.rates) != len(maturities):
+            raise ValueError(
+                f"Warm start curve has {len(warm_start.rates)} rates, "
+                f"expected {len(maturities)}"
+            )
         if currency == Currency.EUR:
             generator_map = self.eur_generator_map
         products = []
@@ -150,15 +195,15 @@ class CurveBootstrap:
             products.append(product)
             pricer = PricerAssignment.create(product)
             pricers.append(pricer)
-        pillars = []
-        zero_rates = []
-        for i in range(len(maturities)):
-            pillars.append(
-                self.day_counter.year_fraction(
-                    Settings.evaluation_date, products[i].end_date
-                )
-            )
-            zero_rates.append(0.01)
+        pillars = self.day_counter.year_fraction_array(
+            Settings.evaluation_date, [product.end_date for product in products]
+        ).tolist()
+        zero_rates = [0.01] * len(maturities)
+        jac0 = None
+        if warm_start is not None:
+            zero_rates = list(warm_start.rates)
+            if warm_start.jacobian is not None:
+                jac0 = numpy.asarray(warm_start.jacobian, dtype=numpy.float64)
         if is_spread_curve:  # TODO basis curve bootstrapping
             # bootstrapping_curve = SpreadCurve(pillars, zero_rates, base_curve)
             pass
@@ -171,9 +216,26 @@ class CurveBootstrap:
                 daycounter_convention,
             )
         self.market_env._market[curve_name] = bootstrapping_curve
-        func = ObjectiveFunction(bootstrapping_curve, products, pricers, self.market_env)
+        func = ObjectiveFunction(
+            bootstrapping_curve,
+            products,
+            pricers,
+            self.market_env,
+            full_jacobian=full_jacobian,
+            use_pfor=use_pfor,
+        )
         x = numpy.array(zero_rates, dtype=numpy.float64)
-        bootstrapped_rates, jac = newton(func, x)
+        solver = functools.partial(
+            newton, jac0=jac0, broyden=broyden, residual=func.residuals
+        )
+        if method == "sequential":
+            bootstrapped_rates, jac = self._sequential_solve(func, x, solver)
+        else:
+            bootstrapped_rates, jac = solver(func, x)
+        if broyden:
+            # the secant approximation only drives the solve: par risk and the next
+            # warm start need the exact Jacobian at the solution
+            _, jac = func(bootstrapped_rates)
         bootstrapping_curve._set_rates(bootstrapped_rates)
         instrument_labels = [f"{gen}_{mat}" for gen, mat in zip(generators, maturities)]
         bootstrapping_curve.jacobian = pd.DataFrame(
@@ -199,6 +261,48 @@ class CurveBootstrap:
         )
         return bootstrapping_curve
 
+    @staticmethod
+    def _sequential_solve(
+        func: "ObjectiveFunction",
+        x0: numpy.ndarray,
+        solver=newton,
+        tol: float = 1e-8,
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Solves the bootstrap pillar by pillar, falling back to the global Newton solve.
+
+        Pillar *i* is solved with ``newton_1d`` on instrument *i* alone, starting from the
+        previously solved pillar. If the pillars are not increasing the global solve is used
+        directly; if an instrument turns out to depend on later pillars (e.g. through a
+        payment lag), the global solve polishes the result of the sequential pass.
+
+        Args:
+            func (ObjectiveFunction): The objective function of the bootstrap.
+            x0 (numpy.ndarray): Initial rate vector.
+            solver (callable, optional): The global solver, called as ``solver(func, x)``.
+                Defaults to ``newton``.
+            tol (float, optional): Residual tolerance of the final check. Defaults to 1e-8.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: The bootstrapped rates and the Jacobian
+            of all instruments at the solution.
+        """
+        pillars = func.rate_curve.pillars
+        if any(p1 <= p0 for p0, p1 in zip(pillars[:-1], pillars[1:])):
+            return solver(func, x0)
+        x = x0.copy()
+        triangular = True
+        for i in range(len(x)):
+            x[i:] = newton_1d(func.pillar, i, x[i - 1] if i > 0 else x[0])
+            triangular = triangular and func.is_triangular(i)
+        if not triangular:
+            # the sequential pass is still a close warm start for the global solve
+            return solver(func, x)
+        res, jac = func(x)
+        if numpy.linalg.norm(res) > tol:
+            return solver(func, x)
+        return x, jac
+
 
 class ObjectiveFunction:
     """
@@ -209,11 +313,20 @@ class ObjectiveFunction:
     autodiff (GradientTape).  None gradients (rates not used by a given
     instrument) are treated as zero.
 
+    With ``full_jacobian=True`` all NPVs are stacked into one vector recorded
+    on a single tape and the Jacobian is taken with ``tape.jacobian``
+    (vectorized with ``pfor`` by default) inside a ``tf.function``. The graph
+    is traced once, since the curve rates are a variable updated in place, so
+    each Newton step then costs one compiled pass and one device-to-host copy
+    instead of N eager tapes and N² scalar conversions.
+
     Attributes:
         rate_curve (RateCurve): The rate curve being bootstrapped.
         products (list[Product]): A list of products to price during the bootstrap.
         pricers (list[Pricer]): A list of pricers for the given products.
         market_env (MarketEnvironment): The market environment used for pricing.
+        full_jacobian (bool): Whether the Jacobian is built in one ``tape.jacobian`` call.
+        use_pfor (bool): Whether ``tape.jacobian`` is vectorized with ``pfor``.
     """
 
     def __init__(
@@ -222,6 +335,8 @@ class ObjectiveFunction:
         products: list[Product],
         pricers: list[Pricer],
         market_env: MarketEnvironment,
+        full_jacobian: bool = False,
+        use_pfor: bool = True,
     ):
         """
         Initializes the ObjectiveFunction with rate curve, products, pricers, and market environment.
@@ -232,11 +347,21 @@ class ObjectiveFunction:
             pricers (list[Pricer]): A list of pricers corresponding to the products.
             market_env (MarketEnvironment): The market environment providing access
                 to market data (curves, spots, volatilities).
+            full_jacobian (bool, optional): Whether to price all instruments into one
+                compiled NPV vector and take the whole Jacobian with ``tape.jacobian``.
+                Defaults to False, i.e. one eager tape per instrument.
+            use_pfor (bool, optional): Whether ``tape.jacobian`` vectorizes the
+                reverse sweeps with ``pfor``; otherwise a ``tf.while_loop`` over the
+                rows is used. Defaults to True.
         """
         self.rate_curve = rate_curve
         self.products = products
         self.pricers = pricers
         self.market_env = market_env
+        self.full_jacobian = full_jacobian
+        self.use_pfor = use_pfor
+        self._system = None
+        self._pillar_gradients = {}
 
     def __call__(self, x: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
         """Price all instruments at rates *x* and return NPVs and their Jacobian.
@@ -252,17 +377,115 @@ class ObjectiveFunction:
                   unused rates (None autodiff gradients) are set to zero.
         """
         self.rate_curve._set_rates(x)
+        if self.full_jacobian:
+            return self._full_jacobian()
         n = len(self.pricers)
         res = numpy.zeros(n)
         jac = numpy.zeros((n, n))
         for i, (pricer, product) in enumerate(zip(self.pricers, self.products)):
             with tf.GradientTape() as tape:
                 npv = pricer.calculate_price(product, self.market_env)
-            # tape.gradient returns one gradient per watched variable;
-            # None means that variable did not contribute to NPV_i → treat as 0
-            gradients = tape.gradient(npv, self.rate_curve._rates)
+            # the curve rates are a single vector variable, so the gradient is
+            # the whole Jacobian row; None means NPV_i does not use the curve
+            gradient = tape.gradient(npv, self.rate_curve._rates)
             res[i] = float(npv)
-            jac[i, :] = [
-                float(g.numpy()) if g is not None else 0.0 for g in gradients
-            ]
+            if gradient is not None:
+                jac[i, :] = tf.convert_to_tensor(gradient).numpy()
         return res, jac
+
+    def residuals(self, x: numpy.ndarray) -> numpy.ndarray:
+        """Price all instruments at rates *x* without recording any gradient.
+
+        Used by quasi-Newton iterations, which only need the NPV vector.
+
+        Args:
+            x (numpy.ndarray): Current rate vector (one entry per pillar).
+
+        Returns:
+            numpy.ndarray: NPV vector of shape ``(N,)``.
+        """
+        self.rate_curve._set_rates(x)
+        return numpy.array(
+            [
+                float(pricer.calculate_price(product, self.market_env))
+                for pricer, product in zip(self.pricers, self.products)
+            ]
+        )
+
+    def pillar(self, i: int, r: float) -> tuple[float, float]:
+        """Price instrument *i* alone with pillar *i* (and all later pillars) set to *r*.
+
+        Pillars before *i* keep their current (already solved) rates, and the later
+        pillars follow *r* so that the curve stays flat beyond the pillar being solved.
+        The full gradient row is stored for :meth:`is_triangular`.
+
+        Args:
+            i (int): Index of the pillar and of the instrument being solved.
+            r (float): Trial rate for pillar *i*.
+
+        Returns:
+            tuple[float, float]: NPV of instrument *i* and its derivative w.r.t. pillar *i*.
+        """
+        rates = self.rate_curve._rates.numpy()
+        rates[i:] = r
+        self.rate_curve._set_rates(rates)
+        with tf.GradientTape() as tape:
+            npv = self.pricers[i].calculate_price(self.products[i], self.market_env)
+        gradient = tape.gradient(npv, self.rate_curve._rates)
+        if gradient is None:
+            row = numpy.zeros(len(rates))
+        else:
+            row = tf.convert_to_tensor(gradient).numpy()
+        self._pillar_gradients[i] = row
+        return float(npv), float(row[i])
+
+    def is_triangular(self, i: int, tol: float = 1e-12) -> bool:
+        """Check that instrument *i* does not depend on pillars after *i*.
+
+        Args:
+            i (int): Index of the instrument, as last evaluated by :meth:`pillar`.
+            tol (float, optional): Relative threshold below which a sensitivity
+                is treated as zero. Defaults to 1e-12.
+
+        Returns:
+            bool: True if the last gradient row of instrument *i* vanishes beyond *i*.
+        """
+        row = numpy.abs(self._pillar_gradients[i])
+        return not numpy.any(row[i + 1 :] > tol * max(1.0, row.max()))
+
+    def _full_jacobian(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Evaluate the compiled NPV/Jacobian system at the current curve rates.
+
+        The system is traced once on the first call; later Newton iterations only
+        update the curve variable in place and re-run the compiled graph.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: The NPV vector of shape ``(N,)``
+            and the Jacobian of shape ``(N, N)``.
+        """
+        if self._system is None:
+            self._system = tf.function(self._npv_and_jacobian)
+        npvs, jac = self._system()
+        return npvs.numpy(), jac.numpy()
+
+    def _npv_and_jacobian(self) -> tuple[tf.Tensor, tf.Tensor]:
+        """Price all instruments into one NPV vector and take its Jacobian.
+
+        Returns:
+            tuple[tf.Tensor, tf.Tensor]: The NPV vector and the ``(N, N)`` Jacobian
+            with respect to the curve rate variable.
+        """
+        with tf.GradientTape() as tape:
+            npvs = tf.stack(
+                [
+                    tf.cast(pricer.calculate_price(product, self.market_env), tf.float64)
+                    for pricer, product in zip(self.pricers, self.products)
+                ]
+            )
+        jac = tape.jacobian(
+            npvs,
+            self.rate_curve._rates,
+            unconnected_gradients=tf.UnconnectedGradients.ZERO,
+            experimental_use_pfor=self.use_pfor,
+        )
+        return npvs, jac
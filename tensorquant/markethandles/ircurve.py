@@ -1,11 +1,13 @@
+import tensorflow as tf
 from tensorflow import Variable, exp
 from math import log
 from tensorflow.python.framework import dtypes
 import numpy
+from collections import OrderedDict
 from datetime import date, timedelta
 from typing import Union, Optional
 
-from ..numericalhandles.interpolation import LinearInterp
+from ..numericalhandles.interpolation import LinearInterp, FlatForwardInterp
 from ..timehandles.daycounter import DayCounter, DayCounterConvention
 
 
@@ -19,13 +21,20 @@ class RateCurve:
         _dates (list[date]): Dates that represent the curve's pillars.
         _pillars (list[float]): Year fractions corresponding to the pillar dates.
         _pillar_days (list[int]): Day counts between the reference date and the pillars.
-        __rates (list[float]): Interest rates associated with the pillars.
-        _rates (list[Tensor]): Interest rates stored as TensorFlow variables.
-        interpolation_type (str): Type of interpolation used (e.g., 'LINEAR').
-        interp (LinearInterp): Interpolation object used for rate calculations.
+        _rates (Variable): Interest rates stored as a single rank-1 TensorFlow variable,
+            updated in place so that it is a stable handle for tapes and compiled graphs.
+        interpolation_type (str): Type of interpolation used: 'LINEAR' on zero rates,
+            or 'FLAT_FORWARD' / 'LOG_LINEAR' (piecewise-flat forwards, i.e. log-linear
+            discount factors).
+        interp (Union[LinearInterp, FlatForwardInterp]): Interpolation object used for rate calculations.
         _jacobian (numpy.ndarray): Jacobian matrix of the curve, if applicable.
+        _grid_maps_cache (OrderedDict): Linear maps of the curve on recently used
+            time grids (see :meth:`discount_on_grid`).
     """
 
+    #: Maximum number of time grids whose linear maps are kept.
+    GRID_CACHE_SIZE = 32
+
     def __init__(
         self,
         reference_date: date,
@@ -40,7 +49,8 @@ class RateCurve:
             reference_date (date): The reference date for the curve.
             pillars (Union[list[date], list[float]]): A list of dates or year fractions.
             rates (list[float]): A list of interest rates corresponding to the pillars.
-            interp (str): The interpolation method to use (e.g., 'LINEAR').
+            interp (str): The interpolation method to use: 'LINEAR', 'FLAT_FORWARD'
+                or its equivalent 'LOG_LINEAR'.
             daycounter_convention (DayCounterConvention): The day count convention to use for calculating time differences.
 
         Raises:
@@ -52,12 +62,12 @@ class RateCurve:
         self._daycounter = DayCounter(daycounter_convention)
         if all(isinstance(d, date) for d in pillars):
             self._dates = pillars
-            self._pillars = [
-                self._daycounter.year_fraction(reference_date, d) for d in pillars
-            ]
-            self._pillar_days = [
-                self._daycounter.day_count(reference_date, d) for d in self._dates
-            ]
+            self._pillars = self._daycounter.year_fraction_array(
+                reference_date, pillars
+            ).tolist()
+            self._pillar_days = self._daycounter.day_count_array(
+                reference_date, pillars
+            ).tolist()
         elif all(isinstance(d, float) for d in pillars):
             self._dates = [reference_date + timedelta(days=d * 365) for d in pillars]
             self._pillars = pillars
@@ -66,16 +76,20 @@ class RateCurve:
             ]
         else:
             raise TypeError("Pillars must be a list of either date or float types")
-        self.__rates = rates  # float
-        self._rates = [Variable(r, dtype=dtypes.float64) for r in rates]  # tensor
+        self._rates = Variable(
+            numpy.asarray(rates, dtype=numpy.float64), dtype=dtypes.float64
+        )
         self.interpolation_type = interp
         if self.interpolation_type == "LINEAR":
             self.interp = LinearInterp(self._pillars, self._rates)
+        elif self.interpolation_type in ("FLAT_FORWARD", "LOG_LINEAR"):
+            self.interp = FlatForwardInterp(self._pillars, self._rates)
         else:
             raise ValueError("Unsupported interpolation type")
 
         self._jacobian = None
         self._name = None
+        self._grid_maps_cache = OrderedDict()
 
     @classmethod
     def from_zcb(
@@ -101,14 +115,14 @@ class RateCurve:
         daycounter = DayCounter(daycounter_convention)
         if all(isinstance(d, date) for d in pillars):
             dates = pillars
-            pillars = [daycounter.year_fraction(reference_date, d) for d in pillars]
+            pillars = daycounter.year_fraction_array(reference_date, pillars).tolist()
         elif all(isinstance(d, float) for d in pillars):
             dates = [reference_date + timedelta(days=d * 365) for d in pillars]
             pillars = [daycounter.year_fraction(reference_date, d) for d in dates]
         else:
             raise TypeError("dates must be a list of either date or float types")
         rates = [
-            -numpy.log(df) / tau if tau > 0 else 0
+            -numpy.log(df) / tau if tau > 0 else numpy.zeros_like(numpy.asarray(df))
             for df, tau in zip(discount_factors, pillars)
         ]
         return cls(reference_date, dates, rates, interp, daycounter_convention)
@@ -120,7 +134,7 @@ class RateCurve:
         Returns:
             list[tuple]: A list of tuples, where each tuple contains a date and the corresponding rate.
         """
-        return [(t, r) for t, r in zip(self._dates, self.__rates)]
+        return [(t, r) for t, r in zip(self._dates, self.rates)]
 
     @property
     def reference_date(self):
@@ -183,7 +197,20 @@ class RateCurve:
         Returns:
             list[float]: The rates corresponding to the pillars.
         """
-        return self.__rates
+        return self._rates.numpy().tolist()
+
+    @property
+    def rate_variable(self) -> tf.Variable:
+        """Returns the variable holding the rates of the curve.
+
+        The variable is updated in place when the curve is re-bootstrapped, so
+        it can be watched by tapes and forward accumulators for sensitivities
+        to the pillar rates.
+
+        Returns:
+            tf.Variable: The rates corresponding to the pillars.
+        """
+        return self._rates
 
     @property
     def jacobian(self) -> numpy.ndarray:
@@ -222,9 +249,82 @@ class RateCurve:
         """
         self._name = value
 
+    @staticmethod
+    def _is_array(term) -> bool:
+        """Checks whether a term is an array of terms rather than a single one.
+
+        Args:
+            term: A date, a float, or a list/array/tensor of them.
+
+        Returns:
+            bool: True if the term should be evaluated on the vectorized path.
+        """
+        return isinstance(term, (list, tuple, numpy.ndarray, tf.Tensor, tf.Variable))
+
+    @staticmethod
+    def _is_date_array(terms) -> bool:
+        """Checks whether an array of terms holds dates rather than year fractions.
+
+        Args:
+            terms: A list/array/tensor of terms.
+
+        Returns:
+            bool: True for a non-empty sequence of dates or a ``datetime64`` array.
+        """
+        if isinstance(terms, numpy.ndarray) and numpy.issubdtype(
+            terms.dtype, numpy.datetime64
+        ):
+            return True
+        return (
+            isinstance(terms, (list, tuple, numpy.ndarray))
+            and len(terms) > 0
+            and all(isinstance(d, date) for d in terms)
+        )
+
+    def _to_times(self, terms, start: Optional[date] = None) -> tf.Tensor:
+        """Converts an array of dates or year fractions into a float64 tensor of times.
+
+        Args:
+            terms: A list/array of dates or year fractions, a ``datetime64`` array,
+                or a tensor of year fractions.
+            start (Optional[date]): The date from which year fractions are measured.
+                Defaults to the curve reference date.
+
+        Returns:
+            tf.Tensor: The year fractions as a float64 tensor.
+
+        Raises:
+            TypeError: If a list mixes dates with other types.
+        """
+        start = self._reference_date if start is None else start
+        if self._is_date_array(terms):
+            return tf.constant(self._daycounter.year_fraction_array(start, terms))
+        if isinstance(terms, (list, tuple, numpy.ndarray)) and len(terms) > 0:
+            if any(isinstance(d, date) for d in terms):
+                raise TypeError("terms must be either all dates or all floats")
+            return tf.constant(numpy.asarray(terms, dtype=numpy.float64))
+        return tf.cast(terms, dtypes.float64)
+
+    def _discount_tensor(self, times: tf.Tensor) -> tf.Tensor:
+        """Calculates discount factors for a tensor of year fractions in one pass.
+
+        Args:
+            times (tf.Tensor): Year fractions from the reference date.
+
+        Returns:
+            tf.Tensor: The discount factors, with the same shape as ``times``.
+        """
+        if isinstance(self.interp, FlatForwardInterp):
+            return exp(-self.interp.integral_tensor(times))
+        return exp(-times * self.interp.interpolate_tensor(times))
+
     def discount(self, term: Union[date, float]) -> float:
         """Calculates the discount factor for a given term.
 
+        The term may also be a list, array or 1-D tensor of dates or year
+        fractions, in which case all discount factors are evaluated in a
+        single vectorized pass and returned as a tensor.
+
         Args:
             term (Union[date, float]): The term for which to calculate the discount factor. Can be a date or year fraction.
 
@@ -234,6 +334,8 @@ class RateCurve:
         Raises:
             TypeError: If the term is not a date or float.
         """
+        if self._is_array(term):
+            return self._discount_tensor(self._to_times(term))
         if isinstance(term, date):
             term = self._daycounter.year_fraction(self._reference_date, term)
         elif isinstance(term, float):
@@ -244,6 +346,8 @@ class RateCurve:
         if term == 0.0:
             return 1
 
+        if isinstance(self.interp, FlatForwardInterp):
+            return exp(-self.interp.integral(term))
         if term <= self._pillars[0]:
             nrt = -term * self._rates[0]
             df = exp(nrt)
@@ -260,6 +364,8 @@ class RateCurve:
     def zero_rate(self, term: Union[date, float]) -> float:
         """Calculates the zero rate for a given term.
 
+        Arrays of terms are evaluated in a single vectorized pass (see :meth:`discount`).
+
         Args:
             term (Union[date, float]): The term for which to calculate the zero rate. Can be a date or year fraction.
 
@@ -269,7 +375,9 @@ class RateCurve:
         Raises:
             TypeError: If the term is not a date or float.
         """
-        if isinstance(term, date):
+        if self._is_array(term):
+            term = self._to_times(term)
+        elif isinstance(term, date):
             term = self._daycounter.year_fraction(self._reference_date, term)
         elif isinstance(term, float):
             pass
@@ -281,6 +389,9 @@ class RateCurve:
     def forward_rate(self, d1: Union[date, float], d2: Union[date, float]) -> float:
         """Calculates the forward rate between two dates or year fractions.
 
+        ``d1`` and ``d2`` may also be equally sized arrays of dates or year
+        fractions, in which case all forwards are returned as a tensor.
+
         Args:
             d1 (Union[date, float]): The start of the period.
             d2 (Union[date, float]): The end of the period.
@@ -291,7 +402,18 @@ class RateCurve:
         Raises:
             TypeError: If d1 and d2 are not both dates or both floats.
         """
-        if isinstance(d1, date) and isinstance(d2, date):
+        if self._is_array(d1) and self._is_array(d2):
+            if self._is_date_array(d1):
+                tau = tf.constant(self._daycounter.year_fraction_array(d1, d2))
+                t1 = self._to_times(d1)
+                t2 = self._to_times(d2)
+            else:
+                t1 = self._to_times(d1)
+                t2 = self._to_times(d2)
+                tau = t2 - t1
+            df1 = self._discount_tensor(t1)
+            df2 = self._discount_tensor(t2)
+        elif isinstance(d1, date) and isinstance(d2, date):
             tau = self._daycounter.year_fraction(d1, d2)
             df1 = self.discount(
                 self._daycounter.year_fraction(self._reference_date, d1)
@@ -311,26 +433,125 @@ class RateCurve:
     def inst_fwd(self, t: float):
         """Calculates the instantaneous forward rate at a specific time.
 
+        Piecewise-flat forward curves return the forward analytically; linear
+        zero-rate curves use a central finite difference.
+
         Args:
             t (float): The time (in year fractions) to calculate the instantaneous forward rate.
+                An array or tensor of times is evaluated in a single vectorized pass.
 
         Returns:
             float: The instantaneous forward rate.
         """
+        if isinstance(self.interp, FlatForwardInterp):
+            if self._is_array(t):
+                return self.interp.forward_tensor(self._to_times(t))
+            return self.interp.forward(t)
         # time-step needed for differentiation
         dt = 0.01
+        if self._is_array(t):
+            t = self._to_times(t)
+            return -(
+                tf.math.log(self._discount_tensor(t + dt))
+                - tf.math.log(self._discount_tensor(t - dt))
+            ) / (2 * dt)
         expr = -(log(self.discount(t + dt)) - log(self.discount(t - dt))) / (2 * dt)
         return expr
 
+    def _grid_maps(self, times: tf.Tensor) -> tuple:
+        """Returns the linear maps from the rates to ``-log P(0, t)`` and ``f(0, t)`` on a grid.
+
+        With either interpolation the integrated and instantaneous forwards are
+        linear in the zero rates at the pillars, so the maps are the Jacobians
+        of the vectorized evaluation. They depend only on the grid and the
+        pillars and are kept for the ``GRID_CACHE_SIZE`` latest grids.
+
+        Args:
+            times (tf.Tensor): Year fractions from the reference date (float64, eager).
+
+        Returns:
+            tuple: The maps of shape ``[n_times, n_pillars]``, as constants.
+        """
+        flat = tf.reshape(times, [-1])
+        key = flat.numpy().tobytes()
+        maps = self._grid_maps_cache.get(key)
+        if maps is None:
+            # forward mode: one pass per pillar rather than one per grid time
+            n_pillars = self._rates.shape[0]
+            columns = []
+            for j in range(n_pillars):
+                tangent = tf.one_hot(j, n_pillars, dtype=dtypes.float64)
+                with tf.autodiff.ForwardAccumulator(self._rates, tangent) as acc:
+                    values = tf.stack(
+                        [-tf.math.log(self._discount_tensor(flat)), self.inst_fwd(flat)]
+                    )
+                columns.append(
+                    acc.jvp(values, unconnected_gradients=tf.UnconnectedGradients.ZERO)
+                )
+            jacobian = tf.stack(columns, axis=-1)
+            maps = (tf.constant(jacobian[0]), tf.constant(jacobian[1]))
+            self._grid_maps_cache[key] = maps
+            while len(self._grid_maps_cache) > self.GRID_CACHE_SIZE:
+                self._grid_maps_cache.popitem(last=False)
+        else:
+            self._grid_maps_cache.move_to_end(key)
+        return maps
+
+    def discount_on_grid(self, times) -> tf.Tensor:
+        """Calculates discount factors on a time grid that is evaluated repeatedly.
+
+        Equivalent to ``discount(times)`` for year fractions, but after the
+        first call on a grid only a matrix-vector product with the current
+        rates remains: the interpolation is precomputed once per grid, while
+        in-place rate updates are still observed and differentiable.
+
+        Args:
+            times: An array or tensor (of any shape) of year fractions.
+
+        Returns:
+            tf.Tensor: The discount factors, with the same shape as ``times``.
+        """
+        times = self._to_times(times)
+        if not tf.executing_eagerly():
+            return self._discount_tensor(times)
+        integrated = tf.linalg.matvec(self._grid_maps(times)[0], self._rates)
+        return tf.reshape(exp(-integrated), tf.shape(times))
+
+    def inst_fwd_on_grid(self, times) -> tf.Tensor:
+        """Calculates instantaneous forwards on a time grid that is evaluated repeatedly.
+
+        The grid counterpart of :meth:`inst_fwd` (see :meth:`discount_on_grid`).
+
+        Args:
+            times: An array or tensor (of any shape) of year fractions.
+
+        Returns:
+            tf.Tensor: The instantaneous forwards, with the same shape as ``times``.
+        """
+        times = self._to_times(times)
+        if not tf.executing_eagerly():
+            return self.inst_fwd(times)
+        forwards = tf.linalg.matvec(self._grid_maps(times)[1], self._rates)
+        return tf.reshape(forwards, tf.shape(times))
+
     def _set_rates(self, rates: list[float]) -> None:
-        """Sets the rates for the curve and updates the interpolation.
+        """Sets the rates for the curve in place.
+
+        The rate variable is updated with ``assign``, so tapes and compiled
+        functions that captured ``_rates`` keep observing the current curve.
 
         Args:
             rates (list[float]): The new rates to set.
+
+        Raises:
+            ValueError: If the number of rates does not match the number of pillars.
         """
-        self.__rates = rates
-        self._rates = [Variable(r, dtype=dtypes.float64) for r in rates]
-        self.interp.y = self._rates
+        rates = numpy.asarray(rates, dtype=numpy.float64)
+        if rates.shape != tuple(self._rates.shape):
+            raise ValueError(
+                f"Expected rates of shape {tuple(self._rates.shape)}, got {rates.shape}"
+            )
+        self._rates.assign(rates)
 
 
 class DefaultCurve:
@@ -546,12 +767,9 @@ class FlatCurve(RateCurve):
     def rate(self) -> float:
         """Returns the flat rate of the curve."""
         # All rates are identical by construction; return the first one.
-        return self._RateCurve__rates[0]
+        return self.rates[0]
 
     @rate.setter
     def rate(self, value: float) -> None:
         """Sets the flat rate and updates the underlying curve representation."""
-        # Keep both internal representations (float list and Tensor list) consistent.
-        self._RateCurve__rates = [value, value]
-        self._rates = [Variable(value, dtype=dtypes.float64) for _ in range(2)]
-        self.interp.y = self._rates
\ No newline at end of file
+        self._set_rates([value, value])
\ No newline at end of file
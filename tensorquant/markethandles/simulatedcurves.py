@@ -0,0 +1,186 @@
+from datetime import date
+from typing import Optional, Union
+
+import numpy
+import tensorflow as tf
+
+from ..numericalhandles.interpolation import LinearInterp
+from ..timehandles.daycounter import DayCounterConvention
+
+
+class SimulatedCurveSet:
+    """
+    Discount curves simulated on every date and path of a Monte Carlo run.
+
+    The curves share a single tenor grid and are stored as one tensor of
+    discount factors ``P(t_i, t_i + tau_j)`` of shape ``[n_dates, n_tenors,
+    n_paths]``, so that the curves seen on all dates and paths are queried
+    in a single vectorized pass instead of one curve object per date.
+    As for a 'LINEAR' :class:`RateCurve`, the continuously compounded zero
+    rates are interpolated linearly between tenors and extrapolated flat.
+
+    Attributes:
+        _dates (list[date]): The simulation dates.
+        _times (tf.Tensor): Year fractions of the simulation dates ``[n_dates]``.
+        _tenors (tf.Tensor): Year fractions of the curve tenors ``[n_tenors]``, increasing.
+        _discount_factors (tf.Tensor): Discount factors ``[n_dates, n_tenors, n_paths]``.
+        _daycounter_convention (DayCounterConvention): Convention of the year fractions.
+    """
+
+    def __init__(
+        self,
+        dates: list[date],
+        times: Union[list[float], tf.Tensor],
+        tenors: Union[list[float], tf.Tensor],
+        discount_factors: tf.Tensor,
+        daycounter_convention: DayCounterConvention,
+    ) -> None:
+        """
+        Initializes the set from simulated discount factors.
+
+        Args:
+            dates (list[date]): The simulation dates.
+            times (Union[list[float], tf.Tensor]): Year fractions of the simulation dates.
+            tenors (Union[list[float], tf.Tensor]): Strictly positive, increasing year
+                fractions of the curve tenors.
+            discount_factors (tf.Tensor): Discount factors ``[n_dates, n_tenors, n_paths]``.
+            daycounter_convention (DayCounterConvention): Convention of the year fractions.
+
+        Raises:
+            ValueError: If the shapes are inconsistent or the tenors are not increasing.
+        """
+        discount_factors = tf.convert_to_tensor(discount_factors)
+        dtype = discount_factors.dtype
+        tenors = tf.cast(tenors, dtype)
+        if discount_factors.shape.rank != 3 or discount_factors.shape[:2] != [
+            len(dates),
+            tenors.shape[0],
+        ]:
+            raise ValueError(
+                "discount_factors must have shape [n_dates, n_tenors, n_paths]"
+            )
+        if numpy.any(numpy.diff(numpy.concatenate([[0.0], tenors.numpy()])) <= 0.0):
+            raise ValueError("tenors must be strictly positive and increasing")
+        self._dates = dates
+        self._times = tf.cast(times, dtype)
+        self._tenors = tenors
+        self._discount_factors = discount_factors
+        self._daycounter_convention = daycounter_convention
+        self._zero_rates = -tf.math.log(discount_factors) / tenors[None, :, None]
+
+    @property
+    def dates(self) -> list[date]:
+        """Returns the simulation dates."""
+        return self._dates
+
+    @property
+    def times(self) -> tf.Tensor:
+        """Returns the year fractions of the simulation dates."""
+        return self._times
+
+    @property
+    def tenors(self) -> tf.Tensor:
+        """Returns the year fractions of the curve tenors."""
+        return self._tenors
+
+    @property
+    def discount_factors(self) -> tf.Tensor:
+        """Returns the simulated discount factors ``[n_dates, n_tenors, n_paths]``."""
+        return self._discount_factors
+
+    @property
+    def daycounter_convention(self) -> DayCounterConvention:
+        """Returns the convention of the year fractions."""
+        return self._daycounter_convention
+
+    @property
+    def dtype(self) -> tf.DType:
+        """Returns the dtype of the simulated discount factors."""
+        return self._discount_factors.dtype
+
+    @property
+    def n_paths(self) -> int:
+        """Returns the number of simulated paths."""
+        return self._discount_factors.shape[2]
+
+    def _zero_rate_at(self, tau: tf.Tensor, date_index: Optional[int]) -> tf.Tensor:
+        """Interpolates the zero rates at year fractions ``tau`` (``[n_dates, m]`` or ``[m]``)."""
+        zero_rates = self._zero_rates
+        if date_index is not None:
+            zero_rates = zero_rates[date_index : date_index + 1]
+        n_dates = tf.shape(zero_rates)[0]
+        tau = tf.broadcast_to(tau, tf.stack([n_dates, tf.shape(tau)[-1]]))
+        zero = LinearInterp(self._tenors, zero_rates).interpolate_batch(tau)
+        return zero[0] if date_index is not None else zero
+
+    def _to_tau(self, tau) -> tf.Tensor:
+        """Converts year fractions to a tensor of rank 1 or 2 in the working dtype."""
+        tau = tf.cast(tau, self._discount_factors.dtype)
+        if tau.shape.rank == 0:
+            tau = tau[None]
+        if tau.shape.rank not in (1, 2):
+            raise ValueError("tau must be a scalar, a [m] or a [n_dates, m] array")
+        return tau
+
+    def discount(
+        self, tau: Union[float, list[float], tf.Tensor], date_index: Optional[int] = None
+    ) -> tf.Tensor:
+        """
+        Returns the simulated discount factors ``P(t_i, t_i + tau)``.
+
+        Args:
+            tau (Union[float, list[float], tf.Tensor]): Year fractions from the
+                simulation dates: a scalar or ``[m]`` array shared by all dates, or
+                a ``[n_dates, m]`` array of date-specific year fractions (e.g. the
+                residual times of fixed cash flows).
+            date_index (Optional[int]): Restricts the query to one simulation
+                date, in which case ``tau`` is a scalar or ``[m]`` array.
+
+        Returns:
+            tf.Tensor: Discount factors ``[n_dates, m, n_paths]``, or ``[m, n_paths]``
+                for a single ``date_index``.
+        """
+        tau = self._to_tau(tau)
+        return tf.exp(-tau[..., None] * self._zero_rate_at(tau, date_index))
+
+    def forward_rate(
+        self,
+        tau1: Union[float, list[float], tf.Tensor],
+        tau2: Union[float, list[float], tf.Tensor],
+        date_index: Optional[int] = None,
+    ) -> tf.Tensor:
+        """
+        Returns the simply compounded simulated forward rates between two tenors.
+
+        Args:
+            tau1 (Union[float, list[float], tf.Tensor]): Start of the periods, in year
+                fractions from the simulation dates (see :meth:`discount`).
+            tau2 (Union[float, list[float], tf.Tensor]): End of the periods, shaped as ``tau1``.
+            date_index (Optional[int]): Restricts the query to one simulation date.
+
+        Returns:
+            tf.Tensor: Forward rates ``[n_dates, m, n_paths]``, or ``[m, n_paths]``
+                for a single ``date_index``.
+        """
+        tau1 = self._to_tau(tau1)
+        tau2 = self._to_tau(tau2)
+        df1 = self.discount(tau1, date_index)
+        df2 = self.discount(tau2, date_index)
+        return (df1 / df2 - 1.0) / (tau2 - tau1)[..., None]
+
+    def zero_rate(
+        self, tau: Union[float, list[float], tf.Tensor], date_index: Optional[int] = None
+    ) -> tf.Tensor:
+        """
+        Returns the continuously compounded simulated zero rates.
+
+        Args:
+            tau (Union[float, list[float], tf.Tensor]): Year fractions from the
+                simulation dates (see :meth:`discount`).
+            date_index (Optional[int]): Restricts the query to one simulation date.
+
+        Returns:
+            tf.Tensor: Zero rates ``[n_dates, m, n_paths]``, or ``[m, n_paths]``
+                for a single ``date_index``.
+        """
+        return self._zero_rate_at(self._to_tau(tau), date_index)
@@ -1,4 +1,5 @@
 from .stochasticprocess import *
+from .kernels import *
 from .ornsteinuhlenbeck import *
 from .hullwhite import *
 from .g2 import *
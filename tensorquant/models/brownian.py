@@ -1,13 +1,15 @@
 from .stochasticprocess import StochasticProcess
+from ..numericalhandles.precision import Precision
 import tensorflow as tf
 
 
 class GeometricBrownianMotion(StochasticProcess):
 
-    def __init__(self, mu, sigma, x0):
-        self._x0 = tf.Variable(x0, dtype=tf.float64)
-        self._mu = tf.Variable(mu, dtype=tf.float64)
-        self._sigma = tf.Variable(sigma, dtype=tf.float64)
+    def __init__(self, mu, sigma, x0, dtype=None):
+        self._dtype = Precision.resolve(dtype)
+        self._x0 = tf.Variable(x0, dtype=self._dtype)
+        self._mu = tf.Variable(mu, dtype=self._dtype)
+        self._sigma = tf.Variable(sigma, dtype=self._dtype)
 
     def drift(self, dt):
         return (self._mu - (self._sigma**2) / 2) * dt
@@ -18,6 +20,10 @@ class GeometricBrownianMotion(StochasticProcess):
     def initial_values(self):
         return self._x0
 
+    @property
+    def supports_exact_steps(self):
+        return True
+
     def size(self):
         return 1
 
@@ -29,7 +35,7 @@ class GeometricBrownianMotion(StochasticProcess):
         Returns:
             tensor of shape [n_paths, n_steps] with simulated process values
         """
-        t_full = tf.concat([tf.zeros([1], dtype=tf.float64), t_grid], axis=0)  # prepend 0
+        t_full = tf.concat([tf.zeros([1], dtype=t_grid.dtype), t_grid], axis=0)  # prepend 0
         dt = tf.reshape(t_full[1:] - t_full[:-1], [1, -1])  # [1, n_steps], one dt per step
         exp_factor = tf.math.exp(self.drift(dt) + self.diffusion(dt) * dw)
         return self._x0 * tf.math.cumprod(exp_factor, axis=1)
@@ -37,10 +43,11 @@ class GeometricBrownianMotion(StochasticProcess):
 
 class ArithmeticBrownianMotion(StochasticProcess):
 
-    def __init__(self, mu, sigma, x0):
-        self._x0 = tf.Variable(x0, dtype=tf.float64)
-        self._mu = tf.Variable(mu, dtype=tf.float64)
-        self._sigma = tf.Variable(sigma, dtype=tf.float64)
+    def __init__(self, mu, sigma, x0, dtype=None):
+        self._dtype = Precision.resolve(dtype)
+        self._x0 = tf.Variable(x0, dtype=self._dtype)
+        self._mu = tf.Variable(mu, dtype=self._dtype)
+        self._sigma = tf.Variable(sigma, dtype=self._dtype)
 
     def drift(self, dt):
 
@@ -53,6 +60,10 @@ class ArithmeticBrownianMotion(StochasticProcess):
     def initial_values(self):
         return self._x0
 
+    @property
+    def supports_exact_steps(self):
+        return True
+
     def size(self):
         return 1
 
@@ -64,6 +75,6 @@ class ArithmeticBrownianMotion(StochasticProcess):
         Returns:
             tensor of shape [n_paths, n_steps] with simulated process values
         """
-        t_full = tf.concat([tf.zeros([1], dtype=tf.float64), t_grid], axis=0)  # prepend 0
+        t_full = tf.concat([tf.zeros([1], dtype=t_grid.dtype), t_grid], axis=0)  # prepend 0
         dt = tf.reshape(t_full[1:] - t_full[:-1], [1, -1])  # [1, n_steps], one dt per step
         return self._x0 + tf.math.cumsum(self.drift(dt) + self.diffusion(dt) * dw, axis=1)
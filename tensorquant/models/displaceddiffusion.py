@@ -1,22 +1,24 @@
+from .kernels import simulation_kernel
 from .stochasticprocess import StochasticProcess
+from ..numericalhandles.precision import Precision
 import tensorflow as tf
 import numpy as np
 from scipy import optimize
-from scipy.stats import norm as _scipy_norm
+from scipy.special import ndtr
 
 
 # ============================================================
 # Numpy helpers  (calibration — not TF-traced)
 # ============================================================
 
-def _bs_call_np(S: float, K: float, T: float, vol: float, r: float, q: float) -> float:
-    """Black-Scholes call price (numpy scalar)."""
-    T   = max(T,   1e-12)
-    vol = max(vol, 1e-12)
+def _bs_call_np(S, K, T, vol, r, q):
+    """Black-Scholes call price (numpy, scalars or broadcastable arrays)."""
+    T   = np.maximum(T,   1e-12)
+    vol = np.maximum(vol, 1e-12)
     sqrt_t = np.sqrt(T)
     d1 = (np.log(S / K) + (r - q + 0.5 * vol * vol) * T) / (vol * sqrt_t)
     d2 = d1 - vol * sqrt_t
-    return S * np.exp(-q * T) * _scipy_norm.cdf(d1) - K * np.exp(-r * T) * _scipy_norm.cdf(d2)
+    return S * np.exp(-q * T) * ndtr(d1) - K * np.exp(-r * T) * ndtr(d2)
 
 
 def _dd_call_np(S0: float, K: float, T: float, beta: float, sigma: float,
@@ -38,7 +40,7 @@ def _dd_call_np(S0: float, K: float, T: float, beta: float, sigma: float,
     return _bs_call_np(S_sh, K_sh, T, sigma_a, r, q)
 
 
-def _atm_vol_correction_np(atm_vol: float, beta: float, T: float) -> float:
+def _atm_vol_correction_np(atm_vol, beta, T):
     """
     Correct ATM implied vol so that the DD ATM price matches Black-Scholes:
 
@@ -48,10 +50,137 @@ def _atm_vol_correction_np(atm_vol: float, beta: float, T: float) -> float:
     """
     numer = 1.0 - atm_vol ** 2 * T / 24.0
     denom = 1.0 - (beta * atm_vol) ** 2 * T / 24.0
-    denom = max(denom, 1e-6)
+    denom = np.maximum(denom, 1e-6)
     return atm_vol * numer / denom
 
 
+def _dd_call_beta_grad_np(S0, K, T, beta, atm_vol, r, q):
+    """
+    Displaced Diffusion call prices and their analytic derivative in β
+    (numpy, broadcastable arrays), with σ = σ(β) from the ATM correction.
+
+    With Z_0 = S_0/β, K_sh = K + a·e^{(r-q)T} and σ_a = β·σ(β):
+
+        dC/dβ = -S_0/β² · e^{-qT}·(N(d1) - N(d2)) + Z_0·e^{-qT}·φ(d1)·√T · dσ_a/dβ
+
+        dσ_a/dβ = σ + β · σ_ATM·[1 - σ_ATM²·T/24] · (2β·σ_ATM²·T/24) / [1 - (β·σ_ATM)²·T/24]²
+
+    Returns
+    -------
+    price : ndarray   DD call prices.
+    grad  : ndarray   dC/dβ.
+    """
+    T      = np.maximum(T, 1e-12)
+    sqrt_t = np.sqrt(T)
+    numer  = 1.0 - atm_vol ** 2 * T / 24.0
+    denom  = 1.0 - (beta * atm_vol) ** 2 * T / 24.0
+    sigma  = atm_vol * numer / np.maximum(denom, 1e-6)
+    dsigma = np.where(denom > 1e-6,
+                      atm_vol * numer * (beta * atm_vol ** 2 * T / 12.0) / denom ** 2,
+                      0.0)
+
+    a       = S0 * (1.0 - beta) / beta
+    sigma_a = np.maximum(sigma * beta, 1e-12)
+    S_sh    = S0 / beta
+    K_sh    = K + a * np.exp((r - q) * T)
+
+    d1 = (np.log(S_sh / K_sh) + (r - q + 0.5 * sigma_a ** 2) * T) / (sigma_a * sqrt_t)
+    d2 = d1 - sigma_a * sqrt_t
+    disc_q = np.exp(-q * T)
+    price  = S_sh * disc_q * ndtr(d1) - K_sh * np.exp(-r * T) * ndtr(d2)
+    vega   = S_sh * disc_q * np.exp(-0.5 * d1 * d1) / np.sqrt(2.0 * np.pi) * sqrt_t
+    grad   = (-S0 / beta ** 2 * disc_q * (ndtr(d1) - ndtr(d2))
+              + vega * (sigma + beta * dsigma))
+    return price, grad
+
+
+def _calibrate_spot_betas_np(S0, K_grid, T_grid, mkt_prices, atm_vols, r_vec, q, w,
+                             xtol=1e-10, max_iter=200):
+    """
+    Calibrate the spot β of every maturity at once.
+
+    Each slice is an independent one-dimensional weighted least-squares
+    problem  min_β Σ_k w_k·(C^DD_k(β) - C^mkt_k)².  All slices are solved
+    together: DD prices and analytic β-gradients of the whole [nT, nK]
+    surface come from one vectorized call per iteration.
+
+      1. Coarse grid over β ∈ [0.05, 2.5] (30 points) for the starting point.
+      2. Batched Levenberg-Marquardt (Gauss-Newton with a per-slice damping).
+
+    β is kept in the feasible set β ≥ 1e-4 with strictly positive shifted
+    strikes K_min + a·e^{(r-q)T} > 0, which bounds β from above when
+    K_min < S_0·e^{(r-q)T}.
+
+    Args:
+        S0:         Spot (scalar).
+        K_grid:     [nK] strikes.
+        T_grid:     [nT] maturities.
+        mkt_prices: [nT, nK] market call prices.
+        atm_vols:   [nT] ATM implied vols.
+        r_vec:      [nT] zero rates.
+        q:          Dividend yield (scalar).
+        w:          [nK] normalised strike weights.
+        xtol:       Relative tolerance on β.
+        max_iter:   Maximum number of Levenberg-Marquardt iterations.
+
+    Returns
+    -------
+    spot_betas : ndarray [nT]
+    """
+    T   = T_grid[:, None]
+    r   = r_vec[:, None]
+    atm = atm_vols[:, None]
+
+    # Feasible interval [lo, hi) of every slice
+    lo  = 1e-4
+    fwd = S0 * np.exp((r_vec - q) * T_grid)
+    hi  = np.where(K_grid.min() < fwd, 1.0 / (1.0 - K_grid.min() / fwd), np.inf)
+
+    def _objective(beta):
+        price, grad = _dd_call_beta_grad_np(S0, K_grid, T, beta[:, None], atm, r, q)
+        resid = price - mkt_prices
+        return np.sum(w * resid ** 2, axis=1), resid, grad
+
+    # Coarse grid to find a good starting bracket, all slices in one call
+    betas0 = np.linspace(0.05, 2.5, 30)
+    feasible = betas0[None, :] < hi[:, None]                          # [nT, 30]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        grid_prices, _ = _dd_call_beta_grad_np(
+            S0, K_grid, T[:, :, None], np.where(feasible, betas0, 1.0)[:, :, None],
+            atm[:, :, None], r[:, :, None], q,
+        )
+    obj_vals = np.where(
+        feasible, np.sum(w * (grid_prices - mkt_prices[:, None, :]) ** 2, axis=2), np.inf
+    )
+    beta = betas0[np.argmin(obj_vals, axis=1)]
+
+    f, resid, grad = _objective(beta)
+    lam    = np.full_like(beta, 1e-3)
+    active = np.ones_like(beta, dtype=bool)
+    for _ in range(max_iter):
+        g = np.sum(w * resid * grad, axis=1)
+        h = np.sum(w * grad * grad, axis=1)
+        step = -g / np.maximum(h * (1.0 + lam), 1e-300)
+        # Stay inside the feasible interval: at most half-way to the upper bound
+        trial = np.clip(beta + step, lo, beta + 0.5 * (hi - beta))
+        trial = np.where(active, trial, beta)
+
+        f_new, resid_new, grad_new = _objective(trial)
+        accept = active & (f_new <= f)
+        moved  = np.abs(trial - beta)
+
+        beta  = np.where(accept, trial, beta)
+        f     = np.where(accept, f_new, f)
+        resid = np.where(accept[:, None], resid_new, resid)
+        grad  = np.where(accept[:, None], grad_new, grad)
+        lam   = np.where(accept, lam * 0.1, lam * 10.0)
+
+        active &= (moved > xtol * (1.0 + beta)) & (lam < 1e12)
+        if not active.any():
+            break
+    return beta
+
+
 def _compute_skew_average_np(fwd_betas, fwd_vols, maturities) -> float:
     """
     Discrete skew-averaging formula: recovers the spot β_T from forward betas.
@@ -158,7 +287,7 @@ def _dd_call_tf(S0, K, T, beta, sigma, r, q):
 
     All arguments broadcastable; dtype follows S0.
     """
-    dtype = tf.float32
+    dtype = tf.convert_to_tensor(S0).dtype
     S0    = tf.cast(S0,    dtype)
     K     = tf.cast(K,     dtype)
     T     = tf.maximum(tf.cast(T,     dtype), tf.constant(1e-12, dtype))
@@ -237,6 +366,7 @@ class DisplacedDiffusionModel(StochasticProcess):
         spot_sigma_curve=None,
         K_grid=None,
         r_vec=None,
+        dtype=None,
     ):
         """
         Args:
@@ -251,22 +381,25 @@ class DisplacedDiffusionModel(StochasticProcess):
             spot_sigma_curve: [nT] spot σ (ATM-corrected) per maturity.
             K_grid:           [nK] strike grid (stored for implied_vol_surface).
             r_vec:            [nT] per-maturity zero rates (stored for pricing).
+            dtype:            Working dtype (default ``Precision.dtype``).
         """
-        self._S0    = tf.constant(float(S0),  dtype=tf.float32)
-        self._r     = tf.constant(float(r),   dtype=tf.float32)
-        self._q     = tf.constant(float(q),   dtype=tf.float32)
+        self._dtype = Precision.resolve(dtype)
+        np_dtype    = self._dtype.as_numpy_dtype
+        self._S0    = tf.constant(float(S0),  dtype=self._dtype)
+        self._r     = tf.constant(float(r),   dtype=self._dtype)
+        self._q     = tf.constant(float(q),   dtype=self._dtype)
 
-        T_np   = np.asarray(T_grid,          dtype=np.float32)
-        fb_np  = np.asarray(fwd_beta_curve,  dtype=np.float32)
-        fs_np  = np.asarray(fwd_sigma_curve, dtype=np.float32)
+        T_np   = np.asarray(T_grid,          dtype=np_dtype)
+        fb_np  = np.asarray(fwd_beta_curve,  dtype=np_dtype)
+        fs_np  = np.asarray(fwd_sigma_curve, dtype=np_dtype)
 
         self._T_grid    = tf.constant(T_np)
         self._fwd_beta  = tf.constant(fb_np)
         self._fwd_sigma = tf.constant(fs_np)
 
-        self._spot_beta  = (tf.constant(np.asarray(spot_beta_curve,  np.float32))
+        self._spot_beta  = (tf.constant(np.asarray(spot_beta_curve,  np_dtype))
                             if spot_beta_curve  is not None else self._fwd_beta)
-        self._spot_sigma = (tf.constant(np.asarray(spot_sigma_curve, np.float32))
+        self._spot_sigma = (tf.constant(np.asarray(spot_sigma_curve, np_dtype))
                             if spot_sigma_curve is not None else self._fwd_sigma)
 
         self._K_grid = (np.asarray(K_grid, dtype=np.float64)
@@ -287,15 +420,17 @@ class DisplacedDiffusionModel(StochasticProcess):
         q: float = 0.0,
         forward_skew: bool = True,
         weights=None,
+        dtype=None,
     ):
         """
         Calibrate a DisplacedDiffusionModel from a VolatilitySurface.
 
-        For each maturity T_j:
+        For every maturity T_j (all slices at once):
           1. Interpolate ATM vol at K = spot.
           2. Compute Black-Scholes market call prices.
-          3. Grid-search + Nelder-Mead minimisation of weighted squared
-             price residuals w.r.t. β_T (the single free parameter per slice).
+          3. Grid-search + Levenberg-Marquardt minimisation of weighted squared
+             price residuals w.r.t. β_T (the single free parameter per slice),
+             using analytic β-gradients of the DD prices.
           4. Apply ATM vol correction to derive σ and σ_a.
 
         If forward_skew=True, extract forward β via closed-form inversion
@@ -308,6 +443,7 @@ class DisplacedDiffusionModel(StochasticProcess):
             q:            Continuous dividend yield / repo rate (scalar).
             forward_skew: Extract forward betas (default True).
             weights:      [nK] optional strike weights (equal if None).
+            dtype:        Working dtype of the model (default ``Precision.dtype``).
 
         Returns:
             DisplacedDiffusionModel instance with calibrated curves stored.
@@ -316,57 +452,20 @@ class DisplacedDiffusionModel(StochasticProcess):
         T_grid = np.asarray(vol_surface.maturity,          dtype=np.float64)
         K_grid = np.asarray(vol_surface.strike,            dtype=np.float64)
         iv_mat = np.asarray(vol_surface.volatility_matrix, dtype=np.float64)
-        nT, nK = iv_mat.shape
+        nK     = iv_mat.shape[1]
 
         r_vec = np.array([float(disc_curve.zero_rate(T)) for T in T_grid])
 
-        spot_betas  = np.zeros(nT)
-        spot_sigmas = np.zeros(nT)
-        atm_vols    = np.zeros(nT)
-
-        for i, T in enumerate(T_grid):
-            r_i      = float(r_vec[i])
-            q_f      = float(q)
-            iv_slice = iv_mat[i, :]
-
-            atm_vol = float(np.interp(S0, K_grid, iv_slice))
-            atm_vols[i] = atm_vol
-
-            mkt_prices = np.array([
-                _bs_call_np(S0, K_grid[k], T, iv_slice[k], r_i, q_f)
-                for k in range(nK)
-            ])
-
-            w = (np.ones(nK) if weights is None else np.asarray(weights, dtype=float))
-            w = w / w.sum()
-
-            def _obj(beta_arr, _T=T, _r=r_i, _mkt=mkt_prices, _w=w, _atm=atm_vol):
-                beta = float(beta_arr[0])
-                if beta < 1e-4:
-                    return 1e10
-                a = S0 * (1.0 - beta) / beta
-                # All shifted strikes must be strictly positive
-                if K_grid.min() + a * np.exp((_r - q_f) * _T) <= 0.0:
-                    return 1e10
-                sigma = _atm_vol_correction_np(_atm, beta, _T)
-                dd    = np.array([_dd_call_np(S0, K_grid[k], _T, beta, sigma, _r, q_f)
-                                  for k in range(nK)])
-                return float(np.sum(_w * (dd - _mkt) ** 2))
-
-            # Coarse grid to find a good starting bracket
-            betas0    = np.linspace(0.05, 2.5, 30)
-            obj_vals  = [_obj([b]) for b in betas0]
-            beta_init = betas0[int(np.argmin(obj_vals))]
-
-            res = optimize.minimize(
-                _obj, x0=[beta_init], method="Nelder-Mead",
-                options={"xatol": 1e-7, "fatol": 1e-10, "maxiter": 3000},
-            )
-            beta_star  = float(res.x[0])
-            sigma_star = _atm_vol_correction_np(atm_vol, beta_star, T)
+        atm_vols   = np.array([np.interp(S0, K_grid, iv_slice) for iv_slice in iv_mat])
+        mkt_prices = _bs_call_np(S0, K_grid[None, :], T_grid[:, None], iv_mat,
+                                 r_vec[:, None], float(q))
+
+        w = (np.ones(nK) if weights is None else np.asarray(weights, dtype=float))
+        w = w / w.sum()
 
-            spot_betas[i]  = beta_star
-            spot_sigmas[i] = sigma_star
+        spot_betas  = _calibrate_spot_betas_np(S0, K_grid, T_grid, mkt_prices,
+                                               atm_vols, r_vec, float(q), w)
+        spot_sigmas = _atm_vol_correction_np(atm_vols, spot_betas, T_grid)
 
         # --- Forward skew calibration ---
         if forward_skew:
@@ -388,6 +487,7 @@ class DisplacedDiffusionModel(StochasticProcess):
             spot_sigma_curve=spot_sigmas,
             K_grid=K_grid,
             r_vec=r_vec,
+            dtype=dtype,
         )
 
     # ------------------------------------------------------------------
@@ -423,12 +523,12 @@ class DisplacedDiffusionModel(StochasticProcess):
             T_idx: Maturity index into T_grid.
 
         Returns:
-            Call price as tf.Tensor (float32).
+            Call price as tf.Tensor in the model dtype.
         """
         beta  = self._spot_beta[T_idx]
         sigma = self._spot_sigma[T_idx]
         T     = self._T_grid[T_idx]
-        r_val = (tf.constant(float(self._r_vec[T_idx]), tf.float32)
+        r_val = (tf.constant(float(self._r_vec[T_idx]), self._dtype)
                  if self._r_vec is not None else self._r)
         return _dd_call_tf(self._S0, K, T, beta, sigma, r_val, self._q)
 
@@ -496,7 +596,6 @@ class DisplacedDiffusionModel(StochasticProcess):
     # Monte Carlo simulation
     # ------------------------------------------------------------------
 
-    @tf.function
     def evolve(self, t_grid, dw):
         """
         Simulate displaced-diffusion paths with piecewise-constant forward
@@ -509,6 +608,8 @@ class DisplacedDiffusionModel(StochasticProcess):
                        − a_t · exp((r−q)·dt)
 
         This preserves the correct martingale forward E[S_T] = S_0·e^{(r−q)T}.
+        The simulation runs in the shared :class:`SimulationKernel`
+        ``_displaced_diffusion_paths``.
 
         Args:
             t_grid: [n_steps] observation times (year fractions, t > 0).
@@ -517,43 +618,69 @@ class DisplacedDiffusionModel(StochasticProcess):
         Returns:
             paths: [n_paths, n_steps]  spot at each observation time.
         """
-        dw     = tf.cast(tf.convert_to_tensor(dw),     tf.float32)
-        t_grid = tf.cast(tf.convert_to_tensor(t_grid), tf.float32)
+        return _displaced_diffusion_paths(
+            tf.cast(tf.convert_to_tensor(t_grid), self._dtype),
+            tf.cast(tf.convert_to_tensor(dw),     self._dtype),
+            self._T_grid, self._fwd_beta, self._fwd_sigma,
+            self._S0, self._r, self._q,
+        )
 
-        n_paths = tf.shape(dw)[0]
-        n_steps = tf.shape(dw)[1]
-        t_full  = tf.concat([tf.zeros([1], tf.float32), t_grid], axis=0)
 
-        S     = tf.fill([n_paths], self._S0)
-        paths = tf.TensorArray(dtype=tf.float32, size=n_steps)
+# ============================================================
+# Simulation kernel
+# ============================================================
+
+@simulation_kernel(
+    tf.TensorSpec([None], tf.float32),          # t_grid
+    tf.TensorSpec([None, None], tf.float32),    # dw
+    tf.TensorSpec([None], tf.float32),          # T_grid
+    tf.TensorSpec([None], tf.float32),          # fwd_beta
+    tf.TensorSpec([None], tf.float32),          # fwd_sigma
+    tf.TensorSpec([], tf.float32),              # S0
+    tf.TensorSpec([], tf.float32),              # r
+    tf.TensorSpec([], tf.float32),              # q
+)
+def _displaced_diffusion_paths(t_grid, dw, T_grid, fwd_beta, fwd_sigma, S0, r, q):
+    """
+    Euler simulation kernel behind :meth:`DisplacedDiffusionModel.evolve`.
+
+    Returns:
+        paths [n_paths, n_steps]
+    """
+    n_paths = tf.shape(dw)[0]
+    n_steps = tf.shape(dw)[1]
+    t_full  = tf.concat([tf.zeros([1], t_grid.dtype), t_grid], axis=0)
+    dt_all  = t_full[1:] - t_full[:-1]                              # [n_steps]
 
-        carry = self._r - self._q
+    # Piecewise-constant forward params of every step: interval index
+    # j = number of T_grid entries <= t0 (so at t0=T_j we enter next interval)
+    j = tf.cast(tf.searchsorted(T_grid, t_full[:-1], side="right"), tf.int32)
+    j = tf.clip_by_value(j, 0, tf.shape(fwd_beta)[0] - 1)
+    beta_all    = tf.gather(fwd_beta, j)                            # [n_steps]
+    sigma_a_all = tf.gather(fwd_sigma, j) * beta_all                # shifted vol
 
-        for k in tf.range(n_steps):
-            t0 = t_full[k]
-            dt = t_full[k + 1] - t_full[k]
+    S     = tf.fill([n_paths], S0)
+    paths = tf.TensorArray(dtype=S0.dtype, size=n_steps)
 
-            # Piecewise-constant forward params: interval index j
-            # j = number of T_grid entries strictly < t0 (so at t0=T_j we enter next interval)
-            j = tf.reduce_sum(tf.cast(self._T_grid <= t0, tf.int32))
-            j = tf.clip_by_value(j, 0, tf.shape(self._fwd_beta)[0] - 1)
+    carry = r - q
 
-            beta_j  = self._fwd_beta[j]
-            sigma_j = self._fwd_sigma[j]
-            sigma_a = sigma_j * beta_j
+    for k in tf.range(n_steps):
+        dt      = dt_all[k]
+        beta_j  = beta_all[k]
+        sigma_a = sigma_a_all[k]
 
-            # Path-dependent displacement
-            a = S * (1.0 - beta_j) / beta_j
+        # Path-dependent displacement
+        a = S * (1.0 - beta_j) / beta_j
 
-            # DD Euler step
-            drift = (carry - 0.5 * sigma_a * sigma_a) * dt
-            diff  = sigma_a * tf.sqrt(dt) * dw[:, k]
-            exp_carry = tf.exp(carry * dt)
-            S = (S + a) * tf.exp(drift + diff) - a * exp_carry
+        # DD Euler step
+        drift = (carry - 0.5 * sigma_a * sigma_a) * dt
+        diff  = sigma_a * tf.sqrt(dt) * dw[:, k]
+        exp_carry = tf.exp(carry * dt)
+        S = (S + a) * tf.exp(drift + diff) - a * exp_carry
 
-            # Absorbing barrier at zero to avoid negative spots
-            S = tf.maximum(S, tf.constant(1e-8, tf.float32))
+        # Absorbing barrier at zero to avoid negative spots
+        S = tf.maximum(S, tf.constant(1e-8, S.dtype))
 
-            paths = paths.write(k, S)
+        paths = paths.write(k, S)
 
-        return tf.transpose(paths.stack(), perm=[1, 0])
+    return tf.transpose(paths.stack(), perm=[1, 0])
@@ -1,10 +1,10 @@
 import tensorflow
 from tensorflow import Variable
-from tensorflow.python.framework import dtypes
 
 from .stochasticprocess import StochasticProcess
 from .ornsteinuhlenbeck import OrnsteinUhlenbeckProcess
 from ..markethandles.ircurve import RateCurve
+from ..numericalhandles.precision import Precision
 
 
 class G2PlusPlusProcess(StochasticProcess):
@@ -52,6 +52,7 @@ class G2PlusPlusProcess(StochasticProcess):
         sigma: float,
         eta: float,
         rho: float,
+        dtype=None,
     ):
         """
         Initialises the G2++ process.
@@ -63,16 +64,39 @@ class G2PlusPlusProcess(StochasticProcess):
             sigma (float): Volatility of the first factor x.
             eta   (float): Volatility of the second factor y.
             rho   (float): Correlation between the two Brownian motions (|rho| < 1).
+            dtype (optional): Working dtype. Defaults to ``Precision.dtype``;
+                the float64 term structure is cast to it where it is read.
         """
-        self._process_x = OrnsteinUhlenbeckProcess(mr_speed=a, volatility=sigma, x0=0.0)
-        self._process_y = OrnsteinUhlenbeckProcess(mr_speed=b, volatility=eta, x0=0.0)
-        self._a = Variable(a, dtype=dtypes.float64)
-        self._b = Variable(b, dtype=dtypes.float64)
-        self._sigma = Variable(sigma, dtype=dtypes.float64)
-        self._eta = Variable(eta, dtype=dtypes.float64)
-        self._rho = Variable(rho, dtype=dtypes.float64)
+        self._dtype = Precision.resolve(dtype)
+        self._process_x = OrnsteinUhlenbeckProcess(
+            mr_speed=a, volatility=sigma, x0=0.0, dtype=self._dtype
+        )
+        self._process_y = OrnsteinUhlenbeckProcess(
+            mr_speed=b, volatility=eta, x0=0.0, dtype=self._dtype
+        )
+        self._a = Variable(a, dtype=self._dtype)
+        self._b = Variable(b, dtype=self._dtype)
+        self._sigma = Variable(sigma, dtype=self._dtype)
+        self._eta = Variable(eta, dtype=self._dtype)
+        self._rho = Variable(rho, dtype=self._dtype)
         self._term_structure = term_structure
 
+    def _inst_fwd(self, t):
+        """Reads f(0, t), on a cached grid map when ``t`` is an array of times."""
+        if RateCurve._is_array(t):
+            value = self._term_structure.inst_fwd_on_grid(t)
+        else:
+            value = self._term_structure.inst_fwd(t)
+        return tensorflow.cast(value, self._dtype)
+
+    def _discount(self, t):
+        """Reads P(0, t), on a cached grid map when ``t`` is an array of times."""
+        if RateCurve._is_array(t):
+            value = self._term_structure.discount_on_grid(t)
+        else:
+            value = self._term_structure.discount(t)
+        return tensorflow.cast(value, self._dtype)
+
     # ------------------------------------------------------------------
     # StochasticProcess interface
     # ------------------------------------------------------------------
@@ -167,6 +191,43 @@ class G2PlusPlusProcess(StochasticProcess):
             self._process_y.std_deviation(dt=dt),
         )
 
+    @property
+    def supports_exact_steps(self) -> bool:
+        """The joint Gaussian transition of (x, y) is sampled exactly by :meth:`evolve_paths`."""
+        return True
+
+    def evolve_paths(self, t_grid, dw):
+        """
+        Simulates whole paths of both factors with their exact joint transition.
+
+        Over each step the factor increments are Gaussian with variances
+        ``variance_x(dt)``, ``variance_y(dt)`` and covariance ``covariance(dt)``:
+        the two independent normals of the step are correlated through the
+        Cholesky factor of that 2×2 covariance, and each factor is then built
+        on all steps at once by the exact Ornstein-Uhlenbeck kernel.
+
+        Args:
+            t_grid: Increasing observation times ``[n_steps]``; the origin
+                ``t = 0``, where both factors are zero, is implicit.
+            dw: Independent standard normals ``[n_paths, n_steps, 2]``.
+
+        Returns:
+            tensorflow.Tensor: The factors (x, y) at the observation times
+                ``[n_paths, n_steps, 2]``.
+        """
+        t_grid = tensorflow.cast(tensorflow.convert_to_tensor(t_grid), self._dtype)
+        dw = tensorflow.cast(tensorflow.convert_to_tensor(dw), self._dtype)
+        dt = tensorflow.concat([t_grid[:1], t_grid[1:] - t_grid[:-1]], axis=0)
+        # correlation of the step increments, rho in the limit dt -> 0
+        rho = self.covariance(dt) / tensorflow.sqrt(
+            self.variance_x(dt) * self.variance_y(dt)
+        )
+        z_x = dw[..., 0]
+        z_y = rho * z_x + tensorflow.sqrt(1.0 - rho**2) * dw[..., 1]
+        x = self._process_x.evolve_paths(t_grid, z_x)
+        y = self._process_y.evolve_paths(t_grid, z_y)
+        return tensorflow.stack([x, y], axis=-1)
+
     # ------------------------------------------------------------------
     # G2++-specific methods
     # ------------------------------------------------------------------
@@ -259,7 +320,7 @@ class G2PlusPlusProcess(StochasticProcess):
         Returns:
             float: The value of the deterministic shift at time t.
         """
-        f0t = self._term_structure.inst_fwd(t)
+        f0t = self._inst_fwd(t)
         term_x = (
             self._sigma ** 2
             / (2 * self._a ** 2)
@@ -365,6 +426,9 @@ class G2PlusPlusProcess(StochasticProcess):
         This expression correctly recovers P(0,T) = P^M(0,T) when S=0 (since
         x(0)=y(0)=0 and all F/G terms vanish at t=0).
 
+        ``S`` and ``T`` may also be broadcastable tensors of times, in which
+        case the coefficients of all bonds are evaluated in one vectorized pass.
+
         Args:
             S (float): Reference (start) time in years (S ≤ T).
             T (float): Maturity time in years.
@@ -372,9 +436,11 @@ class G2PlusPlusProcess(StochasticProcess):
         Returns:
             tuple: (A, B_x, B_y) where A is a scalar and B_x, B_y are scalars.
         """
+        P0T = self._discount(T)
+        P0S = self._discount(S)
+        S = tensorflow.cast(S, self._dtype)
+        T = tensorflow.cast(T, self._dtype)
         tau = T - S
-        P0T = self._term_structure.discount(T)
-        P0S = self._term_structure.discount(S)
 
         Bx = (1 - tensorflow.math.exp(-self._a * tau)) / self._a
         By = (1 - tensorflow.math.exp(-self._b * tau)) / self._b
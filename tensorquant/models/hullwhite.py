@@ -1,10 +1,10 @@
 from tensorflow import Variable
 import tensorflow
-from tensorflow.python.framework import dtypes
 
 from .stochasticprocess import StochasticProcess
-from .ornsteinuhlenbeck import OrnsteinUhlenbeckProcess
+from .ornsteinuhlenbeck import OrnsteinUhlenbeckProcess, _ornstein_uhlenbeck_paths
 from ..markethandles.ircurve import RateCurve
+from ..numericalhandles.precision import Precision
 
 
 class HullWhiteProcess(StochasticProcess):
@@ -18,7 +18,7 @@ class HullWhiteProcess(StochasticProcess):
         _term_structure (RateCurve): The term structure (yield curve) used for forward rate calculations.
     """
 
-    def __init__(self, term_structure: RateCurve, a: float, sigma: float):
+    def __init__(self, term_structure: RateCurve, a: float, sigma: float, dtype=None):
         """
         Initializes the Hull-White process.
 
@@ -26,14 +26,36 @@ class HullWhiteProcess(StochasticProcess):
             term_structure (RateCurve): The term structure (yield curve) used for forward rate calculations.
             a (float): Mean reversion speed (alpha) of the process.
             sigma (float): Volatility of the process (sigma).
+            dtype (optional): Working dtype. Defaults to ``Precision.dtype``;
+                the float64 term structure is cast to it where it is read.
         """
+        self._dtype = Precision.resolve(dtype)
         self._process = OrnsteinUhlenbeckProcess(
-            mr_speed=a, volatility=sigma, x0=term_structure.inst_fwd(0)
+            mr_speed=a,
+            volatility=sigma,
+            x0=tensorflow.cast(term_structure.inst_fwd(0), self._dtype),
+            dtype=self._dtype,
         )
-        self._a = Variable(a, dtype=dtypes.float64)
-        self._sigma = Variable(sigma, dtype=dtypes.float64)
+        self._a = Variable(a, dtype=self._dtype)
+        self._sigma = Variable(sigma, dtype=self._dtype)
         self._term_structure = term_structure
 
+    def _curve(self, value):
+        """Casts a term-structure quantity to the working dtype."""
+        return tensorflow.cast(value, self._dtype)
+
+    def _inst_fwd(self, t):
+        """Reads f(0, t), on a cached grid map when ``t`` is an array of times."""
+        if RateCurve._is_array(t):
+            return self._curve(self._term_structure.inst_fwd_on_grid(t))
+        return self._curve(self._term_structure.inst_fwd(t))
+
+    def _discount(self, t):
+        """Reads P(0, t), on a cached grid map when ``t`` is an array of times."""
+        if RateCurve._is_array(t):
+            return self._curve(self._term_structure.discount_on_grid(t))
+        return self._curve(self._term_structure.discount(t))
+
     def size(self) -> int:
         """
         Returns the dimensionality of the process.
@@ -52,6 +74,11 @@ class HullWhiteProcess(StochasticProcess):
         """
         return self._process.x0
 
+    @property
+    def supports_exact_steps(self) -> bool:
+        """The Gaussian transition of the short rate is sampled exactly by :meth:`evolve_paths`."""
+        return True
+
     @property
     def a(self) -> float:
         """
@@ -97,11 +124,10 @@ class HullWhiteProcess(StochasticProcess):
             self._sigma**2 / (2 * self._a) * (1 - tensorflow.math.exp(-2 * self._a * t))
         )
         shift = 0.0001
-        f = self._term_structure.forward_rate(t, t)
-        fup = self._term_structure.forward_rate(t + shift, t + shift)
-        f_prime = (fup - f) / shift
+        f = self._inst_fwd(t)
+        f_prime = (self._inst_fwd(t + shift) - f) / shift
         alpha_drift += self._a * f + f_prime
-        return self._process.drift(t, x) + alpha_drift
+        return self._process.drift(x) + alpha_drift
 
     def diffusion(self, t: float, x: float) -> float:
         """
@@ -114,7 +140,7 @@ class HullWhiteProcess(StochasticProcess):
         Returns:
             float: The diffusion value.
         """
-        return self._process.diffusion(t, x)
+        return self._process.diffusion()
 
     def expectation(self, t0: float, x0: float, dt: float) -> float:
         """
@@ -160,12 +186,45 @@ class HullWhiteProcess(StochasticProcess):
         """
         return self._process.variance(dt)
 
+    def evolve_paths(self, t_grid, dw) -> tensorflow.Tensor:
+        """
+        Simulates short-rate paths with the exact transition of the process.
+
+        The short rate is ``r(t) = x(t) + alpha(t)``, with ``x`` a zero-mean
+        Ornstein-Uhlenbeck process started at zero. All steps of ``x`` are
+        built at once in the shared simulation kernel of
+        :class:`OrnsteinUhlenbeckProcess`, and the deterministic shift is
+        evaluated once on the whole grid.
+
+        Args:
+            t_grid: Increasing observation times ``[n_steps]`` measured from the
+                reference date of the term structure (the origin is implicit).
+            dw: Standard normals ``[n_paths, n_steps]``.
+
+        Returns:
+            tensorflow.Tensor: The short rates at the observation times ``[n_paths, n_steps]``.
+        """
+        t_grid = tensorflow.cast(tensorflow.convert_to_tensor(t_grid), self._dtype)
+        zero = tensorflow.zeros([], self._dtype)
+        x = _ornstein_uhlenbeck_paths(
+            t_grid,
+            tensorflow.cast(tensorflow.convert_to_tensor(dw), self._dtype),
+            zero,
+            tensorflow.convert_to_tensor(self._a),
+            tensorflow.convert_to_tensor(self._sigma),
+            zero,
+        )
+        return x + self.alpha(t_grid)[None, :]
+
     def alpha(self, t: float) -> float:
         """
         Computes the alpha (mean reversion level) term at time t.
 
         Args:
-            t (float): The time at which alpha is calculated.
+            t (float): The time at which alpha is calculated, or a tensor of
+                times evaluated in a single vectorized pass. The curve is read
+                on a grid map cached by the term structure, so repeated
+                evaluations on the same grid reduce to tensor arithmetic.
 
         Returns:
             float: The alpha value.
@@ -175,13 +234,17 @@ class HullWhiteProcess(StochasticProcess):
         else:
             alfa = self._sigma * t
         alfa = 0.5 * alfa**2
-        alfa += self._term_structure.inst_fwd(t)
+        alfa += self._inst_fwd(t)
         return alfa
 
     def A_B(self, S: float, T: float) -> tuple:
         """
         Computes the time-dependent parameters A(S, T) and B(S, T) of a zero-coupon bond.
 
+        ``S`` and ``T`` may also be broadcastable tensors of times (e.g. simulation
+        dates ``[n_dates, 1]`` against maturities ``[n_dates, n_tenors]``), in which
+        case the coefficients of all bonds are evaluated in one vectorized pass.
+
         Args:
             S (float): Start time in years (S <= T).
             T (float): Maturity time in years.
@@ -189,14 +252,16 @@ class HullWhiteProcess(StochasticProcess):
         Returns:
             tuple: A(S, T) and B(S, T) parameters used in bond pricing.
         """
-        f0S = self._term_structure.inst_fwd(S)
-        P0T = self._term_structure.discount(T)
-        P0S = self._term_structure.discount(S)
+        f0S = self._inst_fwd(S)
+        P0T = self._discount(T)
+        P0S = self._discount(S)
+        S = self._curve(S)
+        T = self._curve(T)
 
         B = 1 - tensorflow.math.exp(-self._a * (T - S))
         B /= self._a
 
-        exponent = self.sigma * (
+        exponent = self._sigma * (
             tensorflow.math.exp(-self._a * T) - tensorflow.math.exp(-self._a * S)
         )
         exponent *= exponent
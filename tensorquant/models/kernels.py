@@ -0,0 +1,91 @@
+import tensorflow as tf
+from tensorflow.python.eager import record
+
+
+class SimulationKernel:
+    """
+    Path-simulation kernel compiled with a shape-polymorphic input signature.
+
+    A kernel is a module-level function of tensors only (time grid, Gaussian
+    increments and model parameters), traced against an ``input_signature``
+    with unknown dimensions. One trace therefore serves every model instance,
+    number of paths and number of steps, instead of one trace per model and
+    per shape as with a bare ``tf.function`` on ``evolve``. The floating-point
+    specs of the signature are specialized to the dtype of the call (see
+    :class:`~tensorquant.numericalhandles.precision.Precision`), so a kernel
+    is traced once per precision.
+
+    With ``SimulationKernel.jit_compile`` set to True the kernels are compiled
+    by XLA, which fuses the element-wise work of each simulation step into a
+    few kernels. XLA still specializes the compiled code on the concrete
+    shapes of each call, but the TensorFlow trace is shared. XLA cannot
+    differentiate through the simulation loop, so while a gradient tape or
+    forward accumulator is recording the non-compiled variant is used.
+
+    Attributes:
+        jit_compile (bool): Class-wide switch selecting the XLA-compiled
+            variant of every kernel. Defaults to False.
+        trace_count (int): Number of times this kernel has been traced.
+    """
+
+    jit_compile = False
+    _registry = {}
+
+    def __init__(self, function, input_signature):
+        self._function = function
+        self._input_signature = input_signature
+        self._compiled = {}
+        self.trace_count = 0
+        self.name = f"{function.__module__}.{function.__name__}"
+        SimulationKernel._registry[self.name] = self
+
+    def __call__(self, *args):
+        jit_compile = SimulationKernel.jit_compile and not record.could_possibly_record()
+        dtype = next(
+            arg.dtype
+            for arg, spec in zip(args, self._input_signature)
+            if spec.dtype.is_floating
+        )
+        key = (jit_compile, dtype)
+        if key not in self._compiled:
+            signature = [
+                tf.TensorSpec(spec.shape, dtype) if spec.dtype.is_floating else spec
+                for spec in self._input_signature
+            ]
+            self._compiled[key] = tf.function(
+                self._trace, input_signature=signature, jit_compile=jit_compile
+            )
+        return self._compiled[key](*args)
+
+    def _trace(self, *args):
+        # runs only while TensorFlow traces the function
+        self.trace_count += 1
+        return self._function(*args)
+
+    @classmethod
+    def trace_counts(cls) -> dict:
+        """
+        Returns the number of traces of every simulation kernel.
+
+        Returns:
+            dict: Kernel name to trace count.
+        """
+        return {name: kernel.trace_count for name, kernel in cls._registry.items()}
+
+
+def simulation_kernel(*input_signature):
+    """
+    Decorator turning a function of tensors into a :class:`SimulationKernel`.
+
+    Args:
+        *input_signature (tf.TensorSpec): One spec per argument of the function;
+            floating-point specs follow the dtype of the call.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(function):
+        return SimulationKernel(function, input_signature)
+
+    return decorator
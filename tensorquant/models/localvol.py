@@ -1,4 +1,6 @@
+from .kernels import simulation_kernel
 from .stochasticprocess import StochasticProcess
+from ..numericalhandles.precision import Precision
 import tensorflow as tf
 
 
@@ -122,6 +124,59 @@ def bilinear_interp(sigma_TK, T_grid, K_grid, t, S):
     return s0 * (1.0 - wt) + s1 * wt
 
 
+def time_slices(sigma_TK, T_grid, t):
+    """
+    Differentiable linear interpolation in time of σ_loc(T, K): one strike
+    slice per time, shared by all paths.
+
+    Args:
+        sigma_TK: [nT, nK]
+        T_grid:   [nT]
+        t:        [n_t] times
+
+    Returns:
+        sigma(t, K_grid): [n_t, nK]
+    """
+    nT = tf.shape(T_grid)[0]
+
+    t_c = tf.clip_by_value(t, T_grid[0], T_grid[-1])
+    i = tf.clip_by_value(
+        tf.cast(tf.searchsorted(T_grid, t_c, side="right"), tf.int32) - 1,
+        0, nT - 2,
+    )
+
+    T0 = tf.gather(T_grid, i);     T1 = tf.gather(T_grid, i + 1)
+    wt = ((t_c - T0) / tf.maximum(T1 - T0, 1e-12))[:, None]
+
+    return tf.gather(sigma_TK, i) * (1.0 - wt) + tf.gather(sigma_TK, i + 1) * wt
+
+
+def strike_interp(sigma_K, K_grid, S):
+    """
+    Differentiable linear interpolation of a strike slice σ_loc(t, K) at S.
+
+    Args:
+        sigma_K: [nK]       — slice from time_slices
+        K_grid:  [nK]
+        S:       [nPaths]   — current spot for each path
+
+    Returns:
+        sigma(t, S): [nPaths]
+    """
+    nK = tf.shape(K_grid)[0]
+
+    S_c = tf.clip_by_value(S, K_grid[0], K_grid[-1])
+    j = tf.clip_by_value(
+        tf.cast(tf.searchsorted(K_grid, S_c, side="right"), tf.int32) - 1,
+        0, nK - 2,
+    )
+
+    K0 = tf.gather(K_grid, j);     K1 = tf.gather(K_grid, j + 1)
+    wk = (S_c - K0) / tf.maximum(K1 - K0, 1e-12)
+
+    return tf.gather(sigma_K, j) * (1.0 - wk) + tf.gather(sigma_K, j + 1) * wk
+
+
 # ============================================================
 # LocalVolatilityProcess
 # ============================================================
@@ -150,7 +205,7 @@ class LocalVolatilityProcess(StochasticProcess):
 
     def __init__(self, C_surface, T_grid, K_grid, S0,
                  r=0.0, q=0.0,
-                 dupire_eps=1e-10, sigma_cap=4.0):
+                 dupire_eps=1e-10, sigma_cap=4.0, dtype=None):
         """
         Args:
             C_surface:  [nT, nK] call price matrix — tf.Variable for AAD,
@@ -162,13 +217,15 @@ class LocalVolatilityProcess(StochasticProcess):
             q:          Dividend yield (scalar or tf.Variable).
             dupire_eps: Numerical floor in Dupire denominator.
             sigma_cap:  Cap on local volatility value.
+            dtype:      Working dtype (default ``Precision.dtype``).
         """
+        self._dtype   = Precision.resolve(dtype)
         self._C       = C_surface
-        self._T_grid  = tf.cast(tf.convert_to_tensor(T_grid), tf.float32)
-        self._K_grid  = tf.cast(tf.convert_to_tensor(K_grid), tf.float32)
-        self._S0      = tf.cast(tf.convert_to_tensor(S0),     tf.float32)
-        self._r       = tf.cast(tf.convert_to_tensor(r),      tf.float32)
-        self._q       = tf.cast(tf.convert_to_tensor(q),      tf.float32)
+        self._T_grid  = tf.cast(tf.convert_to_tensor(T_grid), self._dtype)
+        self._K_grid  = tf.cast(tf.convert_to_tensor(K_grid), self._dtype)
+        self._S0      = tf.cast(tf.convert_to_tensor(S0),     self._dtype)
+        self._r       = tf.cast(tf.convert_to_tensor(r),      self._dtype)
+        self._q       = tf.cast(tf.convert_to_tensor(q),      self._dtype)
         self._eps     = dupire_eps
         self._cap     = sigma_cap
 
@@ -197,12 +254,13 @@ class LocalVolatilityProcess(StochasticProcess):
     # Main simulation
     # ------------------------------------------------------------------
 
-    @tf.function
     def evolve(self, T, dw):
         """
         Simulate paths using a log-Euler scheme with Dupire local volatility.
 
         All operations are pure TF — wrap inside GradientTape for AAD.
+        The simulation runs in the shared :class:`SimulationKernel`
+        ``_local_vol_process_paths``.
 
         Args:
             T:   Final time horizon (scalar).
@@ -211,35 +269,64 @@ class LocalVolatilityProcess(StochasticProcess):
         Returns:
             paths [n_paths, n_steps]  (spot at each step, NOT including S0).
         """
-        dw = tf.cast(tf.convert_to_tensor(dw), tf.float32)
+        return _local_vol_process_paths(
+            tf.cast(T, self._dtype),
+            tf.cast(tf.convert_to_tensor(dw), self._dtype),
+            tf.cast(self._C, self._dtype),
+            self._T_grid, self._K_grid,
+            self._S0, self._r, self._q,
+            tf.constant(self._eps, self._dtype),
+            tf.constant(self._cap, self._dtype),
+        )
+
+
+# ============================================================
+# Simulation kernel
+# ============================================================
+
+@simulation_kernel(
+    tf.TensorSpec([], tf.float32),              # T
+    tf.TensorSpec([None, None], tf.float32),    # dw
+    tf.TensorSpec([None, None], tf.float32),    # C
+    tf.TensorSpec([None], tf.float32),          # T_grid
+    tf.TensorSpec([None], tf.float32),          # K_grid
+    tf.TensorSpec([], tf.float32),              # S0
+    tf.TensorSpec([], tf.float32),              # r
+    tf.TensorSpec([], tf.float32),              # q
+    tf.TensorSpec([], tf.float32),              # dupire_eps
+    tf.TensorSpec([], tf.float32),              # sigma_cap
+)
+def _local_vol_process_paths(T, dw, C, T_grid, K_grid, S0, r, q, eps, cap):
+    """
+    Log-Euler simulation kernel behind :meth:`LocalVolatilityProcess.evolve`.
 
-        n_paths = tf.shape(dw)[0]
-        n_steps = tf.shape(dw)[1]
-        T_f     = tf.cast(T, tf.float32)
-        dt      = T_f / tf.cast(n_steps, tf.float32)
+    Returns:
+        paths [n_paths, n_steps]
+    """
+    n_paths = tf.shape(dw)[0]
+    n_steps = tf.shape(dw)[1]
+    dt      = T / tf.cast(n_steps, T.dtype)
 
-        # Precompute σ_loc surface once (differentiable w.r.t. self._C)
-        C_f       = tf.cast(self._C, tf.float32)
-        sigma_TK  = dupire_local_vol(C_f, self._T_grid, self._K_grid,
-                                     r=self._r, q=self._q,
-                                     eps=self._eps, sig_cap=self._cap)
+    # σ_loc surface (differentiable w.r.t. C)
+    sigma_TK = dupire_local_vol(C, T_grid, K_grid, r=r, q=q, eps=eps, sig_cap=cap)
 
-        # Time grid for each step
-        t_steps = tf.linspace(tf.constant(0.0), T_f, n_steps + 1)  # [n_steps+1]
+    # Time grid for each step
+    t_steps = tf.linspace(tf.zeros([], T.dtype), T, n_steps + 1)  # [n_steps+1]
 
-        S     = tf.fill([n_paths], self._S0)
-        paths = tf.TensorArray(dtype=tf.float32, size=n_steps)
+    # Time is shared by all paths: interpolate σ_loc in time once per
+    # step, leaving a 1-D strike interpolation per path in the loop
+    sigma_steps = time_slices(sigma_TK, T_grid, t_steps[:-1])  # [n_steps, nK]
 
-        for k in tf.range(n_steps):
-            t   = t_steps[k]
-            t_v = tf.fill([n_paths], t)
+    S     = tf.fill([n_paths], S0)
+    paths = tf.TensorArray(dtype=S0.dtype, size=n_steps)
 
-            sig   = bilinear_interp(sigma_TK, self._T_grid, self._K_grid, t_v, S)
-            drift = (self._r - self._q - 0.5 * tf.square(sig)) * dt
-            diff  = sig * tf.sqrt(dt) * dw[:, k]
-            S     = S * tf.exp(drift + diff)
+    for k in tf.range(n_steps):
+        sig   = strike_interp(sigma_steps[k], K_grid, S)
+        drift = (r - q - 0.5 * tf.square(sig)) * dt
+        diff  = sig * tf.sqrt(dt) * dw[:, k]
+        S     = S * tf.exp(drift + diff)
 
-            paths = paths.write(k, S)
+        paths = paths.write(k, S)
 
-        # [n_steps, n_paths] → [n_paths, n_steps]
-        return tf.transpose(paths.stack(), perm=[1, 0])
+    # [n_steps, n_paths] → [n_paths, n_steps]
+    return tf.transpose(paths.stack(), perm=[1, 0])
@@ -1,4 +1,6 @@
+from .kernels import simulation_kernel
 from .stochasticprocess import StochasticProcess
+from ..numericalhandles.precision import Precision
 import tensorflow as tf
 
 
@@ -11,7 +13,7 @@ def _norm_cdf(x):
     return 0.5 * (1.0 + tf.math.erf(x / tf.sqrt(tf.constant(2.0, dtype=x.dtype))))
 
 
-def _bs_call(S0, K, T, vol, r=0.0, q=0.0):
+def _bs_call(S0, K, T, vol, r=0.0, q=0.0, dtype=tf.float32):
     """
     Black-Scholes call price with continuous rate r and dividend yield q.
     Supports broadcasting over (T, K) grids.
@@ -23,11 +25,11 @@ def _bs_call(S0, K, T, vol, r=0.0, q=0.0):
         vol: implied-vol grid [nT, nK] or broadcastable
         r:   continuously-compounded risk-free rate (scalar)
         q:   continuous dividend yield (scalar)
+        dtype: working dtype of the computation
 
     Returns:
         discounted call price C = S·e^{-qT}·N(d1) - K·e^{-rT}·N(d2)
     """
-    dtype = tf.float32
     T   = tf.maximum(tf.cast(T,   dtype), tf.constant(1e-12, dtype))
     vol = tf.maximum(tf.cast(vol, dtype), tf.constant(1e-12, dtype))
     S0  = tf.cast(S0, dtype)
@@ -144,8 +146,8 @@ def _dupire_local_vol(C, T, K, r=0.0, q=0.0, eps=1e-10, sig_cap=4.0):
     Returns:
         sigma_loc [nT, nK]
     """
-    r = tf.cast(r, tf.float32)
-    q = tf.cast(q, tf.float32)
+    r = tf.cast(r, C.dtype)
+    q = tf.cast(q, C.dtype)
 
     dT  = _dC_dT(C, T)   # [nT, nK]
     dK  = _dC_dK(C, K)   # [nT, nK]
@@ -204,6 +206,59 @@ def _bilinear_interp(sigma_TK, T_grid, K_grid, t, S):
     return s0 * (1.0 - wt) + s1 * wt
 
 
+def _time_slices(sigma_TK, T_grid, t):
+    """
+    Differentiable linear interpolation in time of σ_loc(T, K): one strike
+    slice per time, shared by all paths.
+
+    Args:
+        sigma_TK: [nT, nK]
+        T_grid:   [nT]
+        t:        [n_t] times
+
+    Returns:
+        sigma(t, K_grid): [n_t, nK]
+    """
+    nT = tf.shape(T_grid)[0]
+
+    t_c = tf.clip_by_value(t, T_grid[0], T_grid[-1])
+    i = tf.clip_by_value(
+        tf.cast(tf.searchsorted(T_grid, t_c, side="right"), tf.int32) - 1,
+        0, nT - 2,
+    )
+
+    T0 = tf.gather(T_grid, i);     T1 = tf.gather(T_grid, i + 1)
+    wt = ((t_c - T0) / tf.maximum(T1 - T0, 1e-12))[:, None]
+
+    return tf.gather(sigma_TK, i) * (1.0 - wt) + tf.gather(sigma_TK, i + 1) * wt
+
+
+def _strike_interp(sigma_K, K_grid, S):
+    """
+    Differentiable linear interpolation of a strike slice σ_loc(t, K) at S.
+
+    Args:
+        sigma_K: [nK]       — slice from _time_slices
+        K_grid:  [nK]
+        S:       [nPaths]   — current spot for each path
+
+    Returns:
+        sigma(t, S): [nPaths]
+    """
+    nK = tf.shape(K_grid)[0]
+
+    S_c = tf.clip_by_value(S, K_grid[0], K_grid[-1])
+    j = tf.clip_by_value(
+        tf.cast(tf.searchsorted(K_grid, S_c, side="right"), tf.int32) - 1,
+        0, nK - 2,
+    )
+
+    K0 = tf.gather(K_grid, j);     K1 = tf.gather(K_grid, j + 1)
+    wk = (S_c - K0) / tf.maximum(K1 - K0, 1e-12)
+
+    return tf.gather(sigma_K, j) * (1.0 - wk) + tf.gather(sigma_K, j + 1) * wk
+
+
 # ============================================================
 # LocalVolatilityModel
 # ============================================================
@@ -253,6 +308,7 @@ class LocalVolatilityModel(StochasticProcess):
         q=0.0,
         dupire_eps=1e-10,
         sigma_cap=4.0,
+        dtype=None,
     ):
         """
         Args:
@@ -265,13 +321,15 @@ class LocalVolatilityModel(StochasticProcess):
             q:          Dividend yield (scalar or tf.Variable).
             dupire_eps: Numerical floor in the Dupire denominator.
             sigma_cap:  Upper cap on σ_loc (for numerical robustness).
+            dtype:      Working dtype (default ``Precision.dtype``).
         """
+        self._dtype  = Precision.resolve(dtype)
         self._C      = C_surface
-        self._T_grid = tf.cast(tf.convert_to_tensor(T_grid), tf.float32)
-        self._K_grid = tf.cast(tf.convert_to_tensor(K_grid), tf.float32)
-        self._S0     = tf.cast(tf.convert_to_tensor(S0),     tf.float32)
-        self._r      = tf.cast(tf.convert_to_tensor(r),      tf.float32)
-        self._q      = tf.cast(tf.convert_to_tensor(q),      tf.float32)
+        self._T_grid = tf.cast(tf.convert_to_tensor(T_grid), self._dtype)
+        self._K_grid = tf.cast(tf.convert_to_tensor(K_grid), self._dtype)
+        self._S0     = tf.cast(tf.convert_to_tensor(S0),     self._dtype)
+        self._r      = tf.cast(tf.convert_to_tensor(r),      self._dtype)
+        self._q      = tf.cast(tf.convert_to_tensor(q),      self._dtype)
         self._eps    = dupire_eps
         self._cap    = sigma_cap
 
@@ -286,6 +344,7 @@ class LocalVolatilityModel(StochasticProcess):
         q=0.0,
         dupire_eps=1e-10,
         sigma_cap=4.0,
+        dtype=None,
     ):
         """
         Build a LocalVolatilityModel from an implied-volatility surface.
@@ -303,6 +362,7 @@ class LocalVolatilityModel(StochasticProcess):
             r, q:       Risk-free rate / dividend yield.
             dupire_eps: Numerical floor in the Dupire denominator.
             sigma_cap:  Upper cap on σ_loc.
+            dtype:      Working dtype (default ``Precision.dtype``).
 
         Returns:
             LocalVolatilityModel instance.
@@ -319,17 +379,13 @@ class LocalVolatilityModel(StochasticProcess):
                 iv_matrix, T_grid, K_grid, S0=100.0
             )
         """
-        T_tf = tf.cast(tf.convert_to_tensor(T_grid), tf.float32)
-        K_tf = tf.cast(tf.convert_to_tensor(K_grid), tf.float32)
+        dtype = Precision.resolve(dtype)
+        T_tf = tf.cast(tf.convert_to_tensor(T_grid), dtype)
+        K_tf = tf.cast(tf.convert_to_tensor(K_grid), dtype)
         TT, KK = tf.meshgrid(T_tf, K_tf, indexing="ij")   # [nT, nK]
 
-        C_surface = _bs_call(
-            tf.cast(S0, tf.float32), KK, TT,
-            tf.cast(iv_matrix, tf.float32),
-            r=tf.cast(r, tf.float32),
-            q=tf.cast(q, tf.float32),
-        )
-        return cls(C_surface, T_grid, K_grid, S0, r, q, dupire_eps, sigma_cap)
+        C_surface = _bs_call(S0, KK, TT, iv_matrix, r=r, q=q, dtype=dtype)
+        return cls(C_surface, T_grid, K_grid, S0, r, q, dupire_eps, sigma_cap, dtype)
 
     # ------------------------------------------------------------------
     # StochasticProcess interface
@@ -378,9 +434,9 @@ class LocalVolatilityModel(StochasticProcess):
                 "diffusion() requires the precomputed local-vol surface. "
                 "Call evolve() to simulate paths — it manages the surface internally."
             )
-        t_v = tf.fill([tf.shape(x0)[0]], tf.cast(t0, tf.float32))
+        t_v = tf.fill([tf.shape(x0)[0]], tf.cast(t0, self._dtype))
         sig = _bilinear_interp(self._sigma_TK, self._T_grid, self._K_grid, t_v, x0)
-        return sig * x0 * tf.sqrt(tf.cast(dt, tf.float32))
+        return sig * x0 * tf.sqrt(tf.cast(dt, self._dtype))
 
     def sigma_loc(self, t, S):
         """
@@ -398,19 +454,19 @@ class LocalVolatilityModel(StochasticProcess):
             σ_loc(t, S): [n_paths]
         """
         sigma_TK = _dupire_local_vol(
-            tf.cast(self._C, tf.float32),
+            tf.cast(self._C, self._dtype),
             self._T_grid, self._K_grid,
             r=self._r, q=self._q,
             eps=self._eps, sig_cap=self._cap,
         )
-        t_v = tf.cast(tf.broadcast_to(t, [tf.shape(tf.cast(S, tf.float32))[0]]), tf.float32)
-        return _bilinear_interp(sigma_TK, self._T_grid, self._K_grid, t_v, tf.cast(S, tf.float32))
+        S = tf.cast(S, self._dtype)
+        t_v = tf.cast(tf.broadcast_to(t, [tf.shape(S)[0]]), self._dtype)
+        return _bilinear_interp(sigma_TK, self._T_grid, self._K_grid, t_v, S)
 
     # ------------------------------------------------------------------
     # Main simulation
     # ------------------------------------------------------------------
 
-    @tf.function
     def evolve(self, t_grid, dw):
         """
         Simulate paths using a log-Euler (Milstein-order-0) scheme with
@@ -418,6 +474,9 @@ class LocalVolatilityModel(StochasticProcess):
         brownian.py — paths are returned at every observation time in t_grid.
 
         All operations are pure TF — wrap inside tf.GradientTape for AAD.
+        The simulation runs in the shared :class:`SimulationKernel`
+        ``_local_vol_paths`` (XLA-compiled when
+        ``SimulationKernel.jit_compile`` is set).
 
         Args:
             t_grid: [n_steps] observation times (year fractions), e.g.
@@ -435,40 +494,67 @@ class LocalVolatilityModel(StochasticProcess):
             dw     = tf.random.normal([n_paths, n_steps])
             paths  = model.evolve(t_grid, dw)
         """
-        dw     = tf.cast(tf.convert_to_tensor(dw),     tf.float32)
-        t_grid = tf.cast(tf.convert_to_tensor(t_grid), tf.float32)
+        return _local_vol_paths(
+            tf.cast(tf.convert_to_tensor(t_grid), self._dtype),
+            tf.cast(tf.convert_to_tensor(dw),     self._dtype),
+            tf.cast(self._C, self._dtype),
+            self._T_grid, self._K_grid,
+            self._S0, self._r, self._q,
+            tf.constant(self._eps, self._dtype),
+            tf.constant(self._cap, self._dtype),
+        )
 
-        n_paths = tf.shape(dw)[0]
-        n_steps = tf.shape(dw)[1]
 
-        # Prepend t=0 so we can compute dt for the first step
-        t_full = tf.concat([tf.zeros([1], tf.float32), t_grid], axis=0)  # [n_steps+1]
+# ============================================================
+# Simulation kernel
+# ============================================================
 
-        # Precompute σ_loc surface once (differentiable w.r.t. self._C)
-        sigma_TK = _dupire_local_vol(
-            tf.cast(self._C, tf.float32),
-            self._T_grid, self._K_grid,
-            r=self._r, q=self._q,
-            eps=self._eps, sig_cap=self._cap,
-        )
+@simulation_kernel(
+    tf.TensorSpec([None], tf.float32),          # t_grid
+    tf.TensorSpec([None, None], tf.float32),    # dw
+    tf.TensorSpec([None, None], tf.float32),    # C
+    tf.TensorSpec([None], tf.float32),          # T_grid
+    tf.TensorSpec([None], tf.float32),          # K_grid
+    tf.TensorSpec([], tf.float32),              # S0
+    tf.TensorSpec([], tf.float32),              # r
+    tf.TensorSpec([], tf.float32),              # q
+    tf.TensorSpec([], tf.float32),              # dupire_eps
+    tf.TensorSpec([], tf.float32),              # sigma_cap
+)
+def _local_vol_paths(t_grid, dw, C, T_grid, K_grid, S0, r, q, eps, cap):
+    """
+    Log-Euler local-vol simulation kernel behind :meth:`LocalVolatilityModel.evolve`.
+
+    Returns:
+        paths [n_paths, n_steps]
+    """
+    n_paths = tf.shape(dw)[0]
+    n_steps = tf.shape(dw)[1]
+
+    # Prepend t=0 so we can compute dt for the first step
+    t_full = tf.concat([tf.zeros([1], t_grid.dtype), t_grid], axis=0)  # [n_steps+1]
+
+    # σ_loc surface (differentiable w.r.t. C)
+    sigma_TK = _dupire_local_vol(C, T_grid, K_grid, r=r, q=q, eps=eps, sig_cap=cap)
 
-        S     = tf.fill([n_paths], self._S0)
-        paths = tf.TensorArray(dtype=tf.float32, size=n_steps)
+    # Time is shared by all paths: interpolate σ_loc in time once per
+    # step, leaving a 1-D strike interpolation per path in the loop
+    sigma_steps = _time_slices(sigma_TK, T_grid, t_full[:-1])  # [n_steps, nK]
 
-        for k in tf.range(n_steps):
-            t0 = t_full[k]
-            dt = t_full[k + 1] - t_full[k]
+    S     = tf.fill([n_paths], S0)
+    paths = tf.TensorArray(dtype=S0.dtype, size=n_steps)
 
-            t_v = tf.fill([n_paths], t0)
-            sig = _bilinear_interp(sigma_TK, self._T_grid, self._K_grid, t_v, S)
+    for k in tf.range(n_steps):
+        dt = t_full[k + 1] - t_full[k]
 
-            # Log-Euler step
-            drift = (self._r - self._q - 0.5 * tf.square(sig)) * dt
-            diff  = sig * tf.sqrt(dt) * dw[:, k]
-            S     = S * tf.exp(drift + diff)
+        sig = _strike_interp(sigma_steps[k], K_grid, S)
 
-            paths = paths.write(k, S)
+        # Log-Euler step
+        drift = (r - q - 0.5 * tf.square(sig)) * dt
+        diff  = sig * tf.sqrt(dt) * dw[:, k]
+        S     = S * tf.exp(drift + diff)
 
-        # [n_steps, n_paths] → [n_paths, n_steps]
-        return tf.transpose(paths.stack(), perm=[1, 0])
+        paths = paths.write(k, S)
 
+    # [n_steps, n_paths] → [n_paths, n_steps]
+    return tf.transpose(paths.stack(), perm=[1, 0])
@@ -1,7 +1,8 @@
+from .kernels import simulation_kernel
 from .stochasticprocess import StochasticProcess
-from tensorflow.python.framework import dtypes
+from ..numericalhandles.precision import Precision
 from tensorflow import Variable, Tensor
-from math import exp, sqrt
+import tensorflow as tf
 
 
 class OrnsteinUhlenbeckProcess(StochasticProcess):
@@ -17,7 +18,7 @@ class OrnsteinUhlenbeckProcess(StochasticProcess):
         level (float, optional): The long-term mean level of the process. Defaults to 0.0.
     """
 
-    def __init__(self, mr_speed, volatility, x0=0.0, level=0.0):
+    def __init__(self, mr_speed, volatility, x0=0.0, level=0.0, dtype=None):
         """Initializes the Ornstein-Uhlenbeck process.
 
         Args:
@@ -25,10 +26,12 @@ class OrnsteinUhlenbeckProcess(StochasticProcess):
             volatility (float): The volatility of the process.
             x0 (float, optional): The initial value of the process. Defaults to 0.0.
             level (float, optional): The long-term mean level of the process. Defaults to 0.0.
+            dtype (optional): Working dtype. Defaults to ``Precision.dtype``.
         """
-        self._x0 = Variable(x0, dtype=dtypes.float64)
-        self._mr_speed = Variable(mr_speed, dtype=dtypes.float64)
-        self._volatility = Variable(volatility, dtype=dtypes.float64)
+        self._dtype = Precision.resolve(dtype)
+        self._x0 = Variable(x0, dtype=self._dtype)
+        self._mr_speed = Variable(mr_speed, dtype=self._dtype)
+        self._volatility = Variable(volatility, dtype=self._dtype)
         self._level = level
 
     def size(self):
@@ -47,6 +50,34 @@ class OrnsteinUhlenbeckProcess(StochasticProcess):
         """
         return self.x0
 
+    @property
+    def supports_exact_steps(self):
+        """The Gaussian transition of the process is sampled exactly by :meth:`evolve_paths`."""
+        return True
+
+    def evolve_paths(self, t_grid, dw) -> Tensor:
+        """Simulates whole paths with the exact Gaussian transition of the process.
+
+        All steps are built at once in the shared simulation kernel
+        ``_ornstein_uhlenbeck_paths`` instead of one call per step.
+
+        Args:
+            t_grid: Increasing observation times ``[n_steps]``; the origin
+                ``t = 0``, where the process equals ``x0``, is implicit.
+            dw: Standard normals ``[n_paths, n_steps]``.
+
+        Returns:
+            tensorflow.Tensor: The process at the observation times ``[n_paths, n_steps]``.
+        """
+        return _ornstein_uhlenbeck_paths(
+            tf.cast(tf.convert_to_tensor(t_grid), self._dtype),
+            tf.cast(tf.convert_to_tensor(dw), self._dtype),
+            tf.convert_to_tensor(self._x0),
+            tf.convert_to_tensor(self._mr_speed),
+            tf.convert_to_tensor(self._volatility),
+            tf.constant(self._level, self._dtype),
+        )
+
     def drift(self, x: Tensor) -> Tensor:
         """Calculates the drift term of the process.
 
@@ -77,7 +108,7 @@ class OrnsteinUhlenbeckProcess(StochasticProcess):
         Returns:
             tensorflow.Tensor: The expected value of the process at time t0 + dt.
         """
-        return self._level + (x0 - self._level) * exp(-self._mr_speed * dt)
+        return self._level + (x0 - self._level) * tf.exp(-self._mr_speed * dt)
 
     def std_deviation(self, dt: float, t0=None, x0=None) -> Tensor:
         """Calculates the standard deviation of the process after a time step.
@@ -90,7 +121,7 @@ class OrnsteinUhlenbeckProcess(StochasticProcess):
         Returns:
             tensorflow.Tensor: The standard deviation of the process at time t0 + dt.
         """
-        return sqrt(self.variance(dt))
+        return tf.sqrt(self.variance(dt))
 
     def variance(self, dt: float) -> Tensor:
         """Calculates the variance of the process after a time step.
@@ -105,7 +136,7 @@ class OrnsteinUhlenbeckProcess(StochasticProcess):
             0.5
             * self._volatility**2
             / self._mr_speed
-            * (1 - exp(-2 * self._mr_speed * dt))
+            * (1 - tf.exp(-2 * self._mr_speed * dt))
         )
 
     @property
@@ -143,3 +174,42 @@ class OrnsteinUhlenbeckProcess(StochasticProcess):
             float: The long-term mean level of the process.
         """
         return self._level
+
+
+@simulation_kernel(
+    tf.TensorSpec([None], tf.float32),  # t_grid
+    tf.TensorSpec([None, None], tf.float32),  # dw
+    tf.TensorSpec([], tf.float32),  # x0
+    tf.TensorSpec([], tf.float32),  # mr_speed
+    tf.TensorSpec([], tf.float32),  # volatility
+    tf.TensorSpec([], tf.float32),  # level
+)
+def _ornstein_uhlenbeck_paths(t_grid, dw, x0, mr_speed, volatility, level):
+    """Exact Ornstein-Uhlenbeck simulation kernel behind :meth:`OrnsteinUhlenbeckProcess.evolve_paths`.
+
+    With the step factors ``e^{-a·Δt_i}`` and ``sd_i`` the conditional
+    standard deviation of step ``i``, the deviation from the level follows
+    the exact recursion
+
+        x(t_i) - level = e^{-a·Δt_i}·(x(t_{i-1}) - level) + sd_i·z_i
+
+    which is scanned over the steps, each step updating all paths at once.
+
+    Returns:
+        The paths ``[n_paths, n_steps]``.
+    """
+    t_full = tf.concat([tf.zeros([1], t_grid.dtype), t_grid], axis=0)
+    dt = t_full[1:] - t_full[:-1]
+    # conditional variance of each step, sigma^2·dt in the limit a -> 0
+    small = tf.abs(mr_speed) < 1e-10
+    a = tf.where(small, tf.ones_like(mr_speed), mr_speed)
+    variance = tf.where(small, dt, -tf.math.expm1(-2.0 * a * dt) / (2.0 * a))
+    sd = volatility * tf.sqrt(variance)
+    decay = tf.exp(-mr_speed * dt)
+    noise = tf.transpose(dw) * sd[:, None]  # [n_steps, n_paths]
+    deviations = tf.scan(
+        lambda x, step: step[0] * x + step[1],
+        (decay, noise),
+        initializer=tf.fill([tf.shape(dw)[0]], x0 - level),
+    )
+    return level + tf.transpose(deviations)
@@ -40,6 +40,32 @@ class StochasticProcess(ABC):
         """
         return self.size()
 
+    @property
+    def dtype(self):
+        """
+        Working dtype of the process parameters and of the simulated paths.
+
+        Set at construction from the ``dtype`` argument of the process, or from
+        :class:`~tensorquant.numericalhandles.precision.Precision` by default.
+
+        Returns:
+            tf.DType: The working dtype.
+        """
+        return self._dtype
+
+    @property
+    def supports_exact_steps(self):
+        """
+        Whether ``evolve`` samples the exact transition law over any step size.
+
+        Pricers may then simulate the observation dates only, instead of a
+        dense discretization grid.
+
+        Returns:
+            bool: False unless overridden by an exactly simulated process.
+        """
+        return False
+
     @abstractmethod
     def initial_values(self):
         """
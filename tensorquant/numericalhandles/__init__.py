@@ -1,2 +1,5 @@
 from .interpolation import *
 from .newton import *
+from .randomsource import *
+from .variancereduction import *
+from .precision import *
@@ -1,3 +1,8 @@
+from bisect import bisect_right
+
+import tensorflow as tf
+
+
 class LinearInterp:
     """
     Linear interpolation.
@@ -47,3 +52,234 @@ class LinearInterp:
                 return r1 + r2
 
         raise ValueError(f"Term {term} is outside the range of x-values.")
+
+    def interpolate_tensor(self, terms: tf.Tensor) -> tf.Tensor:
+        """
+        Interpolates values at a 1-D tensor of terms in a single vectorized pass.
+
+        The bracketing pillars are located with ``tf.searchsorted`` and the
+        linear weights are applied to ``y`` in one product, so the result stays
+        differentiable with respect to ``y``. Terms outside the x-range are
+        extrapolated flat.
+
+        Args:
+            terms (tf.Tensor): The x-values at which interpolation is desired.
+
+        Returns:
+            tf.Tensor: The interpolated y-values, with the same shape as ``terms``.
+        """
+        x = tf.constant(self.x, dtype=terms.dtype)
+        if isinstance(self.y, (list, tuple)):
+            y = tf.cast(tf.stack(self.y), terms.dtype)
+        else:
+            y = tf.cast(tf.convert_to_tensor(self.y), terms.dtype)
+        if len(self.x) == 1:
+            return tf.fill(tf.shape(terms), y[0])
+        t = tf.clip_by_value(tf.reshape(terms, [-1]), x[0], x[-1])
+        idx = tf.searchsorted(x, t, side="right")
+        idx = tf.clip_by_value(idx, 1, len(self.x) - 1)
+        x0 = tf.gather(x, idx - 1)
+        x1 = tf.gather(x, idx)
+        w = (t - x0) / (x1 - x0)
+        # the interpolation weights are applied as a sparse-by-construction
+        # matrix product, so gradients w.r.t. y come back as dense tensors
+        weights = tf.one_hot(idx - 1, len(self.x), dtype=terms.dtype) * (
+            1.0 - w
+        )[:, None] + tf.one_hot(idx, len(self.x), dtype=terms.dtype) * w[:, None]
+        return tf.reshape(tf.linalg.matvec(weights, y), tf.shape(terms))
+
+    def interpolate_batch(self, terms: tf.Tensor) -> tf.Tensor:
+        """
+        Interpolates a batch of curves sharing the x-values, each at its own terms.
+
+        ``y`` holds one curve per batch entry, with shape ``[n_batch, n_x, ...]``
+        (trailing dimensions, e.g. simulated paths, are carried along), and
+        ``terms`` has shape ``[n_batch, m]``. The bracketing pillars of all terms
+        are located with one batched ``tf.searchsorted``. Terms outside the
+        x-range are extrapolated flat.
+
+        Args:
+            terms (tf.Tensor): The x-values at which interpolation is desired,
+                one row per curve of the batch.
+
+        Returns:
+            tf.Tensor: The interpolated y-values, with shape ``[n_batch, m, ...]``.
+        """
+        x = tf.cast(self.x, terms.dtype)
+        y = tf.cast(tf.convert_to_tensor(self.y), terms.dtype)
+        n_x = x.shape[0]
+        if n_x == 1:
+            return tf.repeat(y, tf.shape(terms)[-1], axis=1)
+        idx = tf.searchsorted(
+            tf.broadcast_to(x, tf.stack([tf.shape(terms)[0], n_x])), terms, side="right"
+        )
+        idx = tf.clip_by_value(idx, 1, n_x - 1)
+        x0 = tf.gather(x, idx - 1)
+        x1 = tf.gather(x, idx)
+        w = tf.clip_by_value((terms - x0) / (x1 - x0), 0.0, 1.0)
+        for _ in range(y.shape.rank - 2):
+            w = w[..., None]
+        y0 = tf.gather(y, idx - 1, axis=1, batch_dims=1)
+        y1 = tf.gather(y, idx, axis=1, batch_dims=1)
+        return (1.0 - w) * y0 + w * y1
+
+
+class FlatForwardInterp:
+    """
+    Piecewise-flat forward interpolation of zero rates.
+
+    The zero rates ``y`` at the pillars ``x`` fix the integrated forward
+    ``I(x_i) = x_i * y_i``. Between consecutive pillars the instantaneous
+    forward is constant, which is the same as interpolating the discount
+    factors log-linearly. The segment grid (with the origin prepended) is
+    built once; the per-segment integrals and forwards are two vector
+    operations on ``y``, so they follow in-place updates of a ``y`` variable
+    and stay differentiable. Evaluating a term then needs one
+    ``tf.searchsorted`` and one multiply-add.
+
+    Before the first pillar the forward is ``y[0]``; after the last pillar the
+    last segment forward is extended.
+
+    Args:
+        x (list or numpy array): Known x-values (pillar times), increasing.
+        y (list, numpy array or tf.Variable): Known zero rates at the pillars.
+    """
+
+    def __init__(self, x, y):
+        """
+        Initializes the FlatForwardInterp class with given x and y data points.
+
+        Args:
+            x (list or numpy array): Known x-values.
+            y (list, numpy array or tf.Variable): Known y-values.
+        """
+        self.x = x
+        self.y = y
+        # the origin is a knot with zero integral unless it is already a pillar
+        self._offset = 0 if x[0] <= 0.0 else 1
+        self._knots = [0.0] * self._offset + [float(t) for t in x]
+
+    def _coefficients(self, dtype):
+        """Returns the segment start times, integrals at the start and forwards."""
+        if isinstance(self.y, (list, tuple)):
+            y = tf.cast(tf.stack(self.y), dtype)
+        else:
+            y = tf.cast(tf.convert_to_tensor(self.y), dtype)
+        knots = tf.constant(self._knots, dtype=dtype)
+        integrals = knots[self._offset :] * y
+        if self._offset:
+            integrals = tf.concat([tf.zeros([1], dtype=dtype), integrals], axis=0)
+        if len(self._knots) == 1:
+            return knots, integrals, y[:1]
+        forwards = (integrals[1:] - integrals[:-1]) / (knots[1:] - knots[:-1])
+        return knots[:-1], integrals[:-1], forwards
+
+    def _segments(self, terms: tf.Tensor):
+        starts, integrals, forwards = self._coefficients(terms.dtype)
+        t = tf.reshape(terms, [-1])
+        idx = tf.searchsorted(starts, t, side="right") - 1
+        idx = tf.clip_by_value(idx, 0, tf.shape(starts)[0] - 1)
+        return t, tf.gather(starts, idx), tf.gather(integrals, idx), tf.gather(forwards, idx)
+
+    def integral_tensor(self, terms: tf.Tensor) -> tf.Tensor:
+        """
+        Integrates the instantaneous forward from 0 to each term, i.e. ``-log P(0, t)``.
+
+        Args:
+            terms (tf.Tensor): The times at which the integral is desired.
+
+        Returns:
+            tf.Tensor: The integrated forwards, with the same shape as ``terms``.
+        """
+        t, start, integral, forward = self._segments(terms)
+        return tf.reshape(integral + forward * (t - start), tf.shape(terms))
+
+    def forward_tensor(self, terms: tf.Tensor) -> tf.Tensor:
+        """
+        Returns the instantaneous forward at each term.
+
+        Args:
+            terms (tf.Tensor): The times at which the forward is desired.
+
+        Returns:
+            tf.Tensor: The forwards, with the same shape as ``terms``.
+        """
+        forward = self._segments(terms)[3]
+        return tf.reshape(forward, tf.shape(terms))
+
+    def interpolate_tensor(self, terms: tf.Tensor) -> tf.Tensor:
+        """
+        Interpolates zero rates at a tensor of terms in a single vectorized pass.
+
+        At ``t = 0`` the zero rate is the first forward.
+
+        Args:
+            terms (tf.Tensor): The x-values at which interpolation is desired.
+
+        Returns:
+            tf.Tensor: The interpolated zero rates, with the same shape as ``terms``.
+        """
+        t, start, integral, forward = self._segments(terms)
+        safe_t = tf.where(t == 0.0, tf.ones_like(t), t)
+        zero = tf.where(t == 0.0, forward, (integral + forward * (t - start)) / safe_t)
+        return tf.reshape(zero, tf.shape(terms))
+
+    def _bracket(self, term):
+        """Locates the segment of a single term: its index and bounding knots."""
+        k = bisect_right(self._knots, term) - 1
+        k = min(max(k, 0), len(self._knots) - 2)
+        return k, self._knots[k], self._knots[k + 1]
+
+    def integral(self, term):
+        """
+        Integrates the instantaneous forward from 0 to a single term.
+
+        The segment is located with a binary search on the knots, so only the
+        two bounding zero rates enter the computation.
+
+        Args:
+            term (float): The time at which the integral is desired.
+
+        Returns:
+            float: The integrated forward.
+        """
+        if len(self._knots) == 1:
+            return term * self.y[0]
+        k, s0, s1 = self._bracket(term)
+        w = (term - s0) / (s1 - s0)
+        integral = w * s1 * self.y[k + 1 - self._offset]
+        if k >= self._offset:
+            integral += (1.0 - w) * s0 * self.y[k - self._offset]
+        return integral
+
+    def forward(self, term):
+        """
+        Returns the instantaneous forward at a single term.
+
+        Args:
+            term (float): The time at which the forward is desired.
+
+        Returns:
+            float: The forward.
+        """
+        if len(self._knots) == 1:
+            return self.y[0]
+        k, s0, s1 = self._bracket(term)
+        forward = s1 / (s1 - s0) * self.y[k + 1 - self._offset]
+        if k >= self._offset:
+            forward -= s0 / (s1 - s0) * self.y[k - self._offset]
+        return forward
+
+    def interpolate(self, term):
+        """
+        Interpolates the zero rate at the specified term.
+
+        Args:
+            term (float): The x-value at which interpolation is desired.
+
+        Returns:
+            float: The interpolated zero rate.
+        """
+        if term == 0.0:
+            return self.forward(term)
+        return self.integral(term) / term
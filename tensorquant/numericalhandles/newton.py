@@ -43,9 +43,26 @@ def newton_1d(func, i: int, r0: float, tol: float = 1e-8, max_iter: int = 100) -
     )
 
 
-def newton(func, x0, tol=1e-8, max_iter=100):
+def newton(
+    func,
+    x0,
+    tol=1e-8,
+    max_iter=100,
+    jac0=None,
+    broyden=False,
+    residual=None,
+):
     """Solves a system of nonlinear equations using Newton's method.
 
+    With ``broyden=True`` the Jacobian is only evaluated (through *func*, or
+    taken from *jac0*) at the first iteration; afterwards it is refreshed with
+    Broyden's rank-1 update
+
+        J += (Δf - J Δx) Δxᵀ / (Δxᵀ Δx)
+
+    so each further iteration only needs the residuals. When *residual* is
+    given it is used for those residual-only evaluations.
+
     Args:
         func (callable): A function that returns ``(f(x), jacobian)``, where
             ``f(x)`` is the vector of residuals and ``jacobian`` is the NxN
@@ -54,24 +71,45 @@ def newton(func, x0, tol=1e-8, max_iter=100):
         tol (float, optional): Convergence tolerance. The method stops when
             both ``‖f(x)‖`` and ``‖Δx‖`` are below *tol*. Defaults to 1e-8.
         max_iter (int, optional): Maximum number of iterations. Defaults to 100.
+        jac0 (numpy.ndarray, optional): Jacobian used at the first iteration
+            instead of evaluating *func* (e.g. from a previous solve). Defaults
+            to None.
+        broyden (bool, optional): Whether to use Broyden rank-1 updates after
+            the first iteration. Defaults to False.
+        residual (callable, optional): A function returning only ``f(x)``, used
+            whenever the Jacobian is not needed. Defaults to None, in which case
+            ``func(x)[0]`` is used.
 
     Returns:
         tuple:
             - numpy.ndarray: Solution vector ``x`` satisfying ``func(x) ≈ 0``.
-            - numpy.ndarray: Jacobian matrix at the solution.
+            - numpy.ndarray: Jacobian matrix at the solution (the Broyden
+              approximation when ``broyden=True``).
 
     Raises:
         ValueError: If the method fails to converge after *max_iter* iterations.
     """
-    x = x0.copy()
+    if residual is None:
+        residual = lambda x: func(x)[0]
+    x = numpy.array(x0, dtype=numpy.float64)
     f, jac = None, None
     for iteration in range(max_iter):
         print(iteration)
-        f, jac = func(x)
+        if iteration == 0 and jac0 is not None:
+            f = numpy.asarray(residual(x), dtype=numpy.float64)
+            jac = numpy.array(jac0, dtype=numpy.float64)
+        elif iteration == 0 or not broyden:
+            f, jac = func(x)
         delta_x = numpy.linalg.solve(jac, -f)
         x += delta_x
         if numpy.linalg.norm(f) < tol and numpy.linalg.norm(delta_x) < tol:
             return x, jac
+        if broyden:
+            f_new = numpy.asarray(residual(x), dtype=numpy.float64)
+            jac = jac + numpy.outer(
+                f_new - f - jac @ delta_x, delta_x
+            ) / numpy.dot(delta_x, delta_x)
+            f = f_new
     raise ValueError(
         f"Newton's method failed to converge after {max_iter} iterations "
         f"(last residual norm: {numpy.linalg.norm(f):.3e})."
@@ -0,0 +1,62 @@
+from contextlib import contextmanager
+
+import tensorflow as tf
+
+
+class Precision:
+    """
+    Library-wide floating-point precision policy.
+
+    Models and pricers built with ``dtype=None`` take their working dtype from
+    ``Precision.dtype`` when they are constructed, and then keep their
+    parameters, simulations and prices in that dtype without casting back and
+    forth. float32 halves the memory and bandwidth of large Monte Carlo
+    simulations; float64 is the safer choice for risk, where sensitivities
+    are small differences of large numbers. Market data (curves, surfaces)
+    stays in float64 and is cast once to the working dtype where it is read.
+
+    Attributes:
+        dtype (tf.DType): The default working dtype. Defaults to ``tf.float64``.
+    """
+
+    dtype = tf.float64
+
+    @classmethod
+    def resolve(cls, dtype=None) -> tf.DType:
+        """
+        Returns the working dtype of an object built with the given ``dtype``.
+
+        Args:
+            dtype: A floating dtype (``tf.float32``, ``"float64"``, ...) or None
+                for the library default.
+
+        Returns:
+            tf.DType: The working dtype.
+
+        Raises:
+            ValueError: If the dtype is not float32 or float64.
+        """
+        dtype = tf.as_dtype(cls.dtype if dtype is None else dtype)
+        if dtype not in (tf.float32, tf.float64):
+            raise ValueError(f"Unsupported precision: {dtype.name}")
+        return dtype
+
+    @classmethod
+    @contextmanager
+    def scope(cls, dtype):
+        """
+        Context manager changing the default working dtype temporarily.
+
+        Example:
+            >>> with Precision.scope(tf.float32):
+            ...     model = LocalVolatilityModel.from_implied_vol(...)
+
+        Args:
+            dtype: The default working dtype within the block.
+        """
+        previous = cls.dtype
+        cls.dtype = cls.resolve(dtype)
+        try:
+            yield
+        finally:
+            cls.dtype = previous
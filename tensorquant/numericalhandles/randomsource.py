@@ -0,0 +1,188 @@
+from abc import ABC, abstractmethod
+
+import numpy
+import tensorflow as tf
+
+
+class RandomSource(ABC):
+    """
+    Source of the standard-normal increments driving Monte Carlo path generators.
+
+    Every source returns a ``[n_paths, n_steps]`` tensor of independent
+    standard normals, one column per step of the simulation time grid, which is
+    the ``dw`` argument expected by the ``evolve`` methods of the models.
+
+    Multi-factor models draw ``factors`` independent Brownian motions on the
+    same grid, returned as a ``[n_paths, n_steps, factors]`` tensor.
+
+    The increments of a path depend only on its index, so a simulation can be
+    drawn in chunks of paths (see ``offset``) with the same result as in one go.
+    """
+
+    @abstractmethod
+    def increments(
+        self, n_paths: int, times, dtype=tf.float64, offset: int = 0, factors: int = 1
+    ) -> tf.Tensor:
+        """
+        Draws standard-normal increments for a simulation time grid.
+
+        Args:
+            n_paths (int): Number of paths.
+            times: Increasing simulation times ``[n_steps]`` measured from the
+                simulation start (the origin is implicit).
+            dtype: Dtype of the returned tensor.
+            offset (int): Index of the first path.
+            factors (int): Number of independent Brownian motions.
+
+        Returns:
+            tf.Tensor: Standard normals of shape ``[n_paths, n_steps]``, or
+                ``[n_paths, n_steps, factors]`` when ``factors > 1``.
+        """
+        pass
+
+
+class PseudoRandomSource(RandomSource):
+    """
+    Pseudo-random standard normals from TensorFlow's stateless generator.
+
+    Paths are drawn in blocks of ``block_size``, block ``b`` from the stateless
+    seed ``[seed, b]``, so the draws depend only on ``seed`` and the path
+    indices and repeated calls return the same increments.
+
+    Args:
+        seed (int): Seed of the generator.
+        block_size (int): Number of paths drawn from one stateless seed.
+    """
+
+    def __init__(self, seed: int = 42, block_size: int = 1024):
+        self.seed = seed
+        self.block_size = block_size
+
+    def increments(
+        self, n_paths: int, times, dtype=tf.float64, offset: int = 0, factors: int = 1
+    ) -> tf.Tensor:
+        shape = [self.block_size, len(times)] + ([factors] if factors > 1 else [])
+        first = offset // self.block_size
+        last = (offset + n_paths - 1) // self.block_size
+        blocks = [
+            tf.random.stateless_normal(shape, seed=[self.seed, b], dtype=dtype)
+            for b in range(first, last + 1)
+        ]
+        start = offset - first * self.block_size
+        return tf.concat(blocks, axis=0)[start : start + n_paths]
+
+
+class SobolRandomSource(RandomSource):
+    """
+    Quasi-random standard normals from a Sobol sequence.
+
+    Each path is one point of a ``n_steps``-dimensional Sobol sequence, mapped
+    to normals through the inverse normal CDF. With ``scramble`` the points are
+    randomized by a random digital shift (XOR of every coordinate with a
+    seeded 32-bit integer), which keeps the low-discrepancy structure while
+    making the estimator unbiased and its error measurable over seeds.
+
+    With ``brownian_bridge`` the normals are assigned through a Brownian-bridge
+    construction: the first Sobol dimension fixes the terminal value of the
+    Brownian motion, the next ones the midpoints, and so on, so that the
+    best-distributed dimensions drive the coarse structure of the paths. The
+    bridge is linear, so it is applied as one matrix product. With several
+    factors the Sobol dimensions are taken step by step, all factors of a step
+    together, and each factor has its own bridge: the first ``factors``
+    dimensions fix the terminal values of the factors, and so on.
+
+    Args:
+        seed (int): Seed of the digital shift.
+        scramble (bool): Whether to apply the random digital shift.
+        brownian_bridge (bool): Whether to build the increments with a Brownian bridge.
+    """
+
+    def __init__(
+        self, seed: int = 42, scramble: bool = True, brownian_bridge: bool = True
+    ):
+        self.seed = seed
+        self.scramble = scramble
+        self.brownian_bridge = brownian_bridge
+
+    def uniforms(self, n_paths: int, n_dims: int, offset: int = 0) -> tf.Tensor:
+        """
+        Returns the (scrambled) Sobol points in the open unit hypercube.
+
+        Args:
+            n_paths (int): Number of points.
+            n_dims (int): Number of dimensions.
+            offset (int): Index of the first point in the sequence.
+
+        Returns:
+            tf.Tensor: float64 uniforms of shape ``[n_paths, n_dims]``.
+        """
+        # TF Sobol points are exact multiples of 2^-32 in float64
+        points = tf.math.sobol_sample(n_dims, n_paths, skip=offset, dtype=tf.float64)
+        digits = tf.cast(tf.round(points * 2.0**32), tf.int64)
+        if self.scramble:
+            shift = numpy.random.default_rng(self.seed).integers(
+                0, 2**32, size=n_dims, dtype=numpy.int64
+            )
+            digits = tf.bitwise.bitwise_xor(digits, tf.constant(shift)[None, :])
+        # centre each point in its 2^-32 cell so that 0 and 1 never occur
+        return (tf.cast(digits, tf.float64) + 0.5) / 2.0**32
+
+    def increments(
+        self, n_paths: int, times, dtype=tf.float64, offset: int = 0, factors: int = 1
+    ) -> tf.Tensor:
+        times = numpy.asarray(times, dtype=numpy.float64)
+        z = tf.math.ndtri(self.uniforms(n_paths, len(times) * factors, offset))
+        z = tf.reshape(z, [n_paths, len(times), factors])
+        if self.brownian_bridge:
+            bridge = tf.constant(brownian_bridge_matrix(times))
+            z = tf.einsum("pkf,kn->pnf", z, bridge)
+        if factors == 1:
+            z = z[..., 0]
+        return tf.cast(z, dtype)
+
+
+def brownian_bridge_matrix(times) -> numpy.ndarray:
+    """
+    Builds the matrix mapping bridge-ordered normals to standard-normal increments.
+
+    The Brownian motion at ``times`` is constructed in bridge order (terminal
+    point first, then successive midpoints of the remaining intervals), each
+    point from its two already known neighbours plus one new normal. With
+    ``z`` of shape ``[n_paths, n_steps]`` in bridge order, ``z @ matrix`` gives
+    the increments ``(W(t_i) - W(t_{i-1})) / sqrt(t_i - t_{i-1})``; steps of
+    zero length get a zero increment.
+
+    Args:
+        times: Increasing times ``[n_steps]``, with an implicit origin ``W(0) = 0``.
+
+    Returns:
+        numpy.ndarray: The ``[n_steps, n_steps]`` construction matrix.
+    """
+    times = numpy.asarray(times, dtype=numpy.float64)
+    n = len(times)
+    # coefficients of W(t_i) on the normals; the origin is index -1 -> row of zeros
+    paths = numpy.zeros((n + 1, n))
+    knot_times = numpy.concatenate([times, [0.0]])
+    paths[n - 1, 0] = numpy.sqrt(times[-1])
+    k = 1
+    intervals = [(-1, n - 1)]
+    while intervals:
+        left, right = intervals.pop(0)
+        if right - left <= 1:
+            continue
+        mid = (left + right) // 2
+        t_left, t_mid, t_right = knot_times[left], times[mid], times[right]
+        if t_right > t_left:
+            w_left = (t_right - t_mid) / (t_right - t_left)
+            w_right = (t_mid - t_left) / (t_right - t_left)
+            std = numpy.sqrt((t_mid - t_left) * (t_right - t_mid) / (t_right - t_left))
+        else:
+            w_left, w_right, std = 1.0, 0.0, 0.0
+        paths[mid] = w_left * paths[left] + w_right * paths[right]
+        paths[mid, k] += std
+        k += 1
+        intervals += [(left, mid), (mid, right)]
+    dt = numpy.diff(numpy.concatenate([[0.0], times]))
+    increments = paths[:n] - numpy.concatenate([paths[n:], paths[: n - 1]])
+    scale = numpy.where(dt > 0.0, 1.0 / numpy.sqrt(numpy.where(dt > 0.0, dt, 1.0)), 0.0)
+    return (increments * scale[:, None]).T
@@ -0,0 +1,259 @@
+from typing import Optional
+
+import numpy
+import tensorflow as tf
+
+
+def antithetic_increments(dw: tf.Tensor) -> tf.Tensor:
+    """
+    Completes a block of Gaussian increments with its antithetic copy.
+
+    Args:
+        dw (tf.Tensor): Standard normals of shape ``[n_pairs, n_steps]``.
+
+    Returns:
+        tf.Tensor: ``[dw; -dw]`` of shape ``[2 * n_pairs, n_steps]``: path ``i``
+            and path ``i + n_pairs`` form an antithetic pair.
+    """
+    return tf.concat([dw, -dw], axis=0)
+
+
+def mc_estimate(
+    samples: tf.Tensor,
+    controls: Optional[tf.Tensor] = None,
+    control_means: Optional[tf.Tensor] = None,
+    antithetic: bool = False,
+) -> tuple:
+    """
+    Monte Carlo estimate of a mean and its standard error.
+
+    With ``antithetic`` the samples are laid out as produced by
+    :func:`antithetic_increments` and each pair is averaged before the
+    statistics are taken, so the standard error reflects the pair
+    correlation. With ``controls`` the samples are corrected by the
+    regression ``Y - (X - E[X]) beta``, with ``beta`` the least-squares
+    coefficient of the samples on the centred controls. ``beta`` is held
+    constant for differentiation, so pathwise sensitivities of the estimate
+    remain those of the control-corrected payoff.
+
+    Leading batch dimensions (e.g. one row per option of a book) are
+    estimated independently.
+
+    Args:
+        samples (tf.Tensor): Path-wise values ``[..., n_paths]``.
+        controls (Optional[tf.Tensor]): Path-wise control variates ``[..., n_paths, n_controls]``.
+        control_means (Optional[tf.Tensor]): Known expectations of the controls ``[..., n_controls]``.
+        antithetic (bool): Whether the paths come in antithetic pairs.
+
+    Returns:
+        tuple: The estimate and its standard error, as tensors of the
+            samples' dtype and batch shape.
+    """
+    dtype = samples.dtype
+    y = tf.cast(samples, tf.float64)
+    if controls is not None:
+        x = tf.cast(controls, tf.float64)
+    if antithetic:
+        half = tf.shape(y)[-1] // 2
+        y = 0.5 * (y[..., :half] + y[..., half : 2 * half])
+        if controls is not None:
+            x = 0.5 * (x[..., :half, :] + x[..., half : 2 * half, :])
+    if controls is not None:
+        x_centred = x - tf.reduce_mean(x, axis=-2, keepdims=True)
+        y_centred = y - tf.reduce_mean(y, axis=-1, keepdims=True)
+        beta = tf.stop_gradient(
+            tf.linalg.lstsq(x_centred, y_centred[..., None], fast=False)[..., 0]
+        )
+        control_means = tf.cast(control_means, tf.float64)[..., None, :]
+        y = y - tf.linalg.matvec(x - control_means, beta)
+    n = tf.cast(tf.shape(y)[-1], tf.float64)
+    estimate = tf.reduce_mean(y, axis=-1)
+    std_error = tf.math.reduce_std(y, axis=-1) * tf.sqrt(n / (n - 1.0)) / tf.sqrt(n)
+    return tf.cast(estimate, dtype), tf.cast(std_error, dtype)
+
+
+class MomentAccumulator:
+    """
+    Streaming counterpart of :func:`mc_estimate` for simulations run in chunks.
+
+    Each chunk of path-wise samples (and controls) is reduced to its count,
+    sums and sums of cross products, block by block of ``block_size`` samples
+    (pairs when ``antithetic``), and the blocks are accumulated in path order.
+    As long as every chunk but the last holds a multiple of ``block_size``
+    samples, the result is bit-for-bit independent of the chunk size, and the
+    memory used does not grow with the number of paths.
+
+    Args:
+        antithetic (bool): Whether each chunk comes in antithetic pairs, laid
+            out as produced by :func:`antithetic_increments`.
+        block_size (int): Number of samples reduced together.
+    """
+
+    def __init__(self, antithetic: bool = False, block_size: int = 1024):
+        self.antithetic = antithetic
+        self.block_size = block_size
+        self._count = 0
+        self._sums = None
+        self._cross = None
+
+    def add(self, samples, controls=None) -> None:
+        """
+        Accumulates one chunk of samples.
+
+        Args:
+            samples: Path-wise values ``[..., n_paths]``.
+            controls: Path-wise control variates ``[..., n_paths, n_controls]``.
+        """
+        v = numpy.asarray(samples, dtype=numpy.float64)[..., None]
+        if controls is not None:
+            v = numpy.concatenate(
+                [v, numpy.asarray(controls, dtype=numpy.float64)], axis=-1
+            )
+        if self.antithetic:
+            half = v.shape[-2] // 2
+            v = 0.5 * (v[..., :half, :] + v[..., half : 2 * half, :])
+        if self._sums is None:
+            self._sums = numpy.zeros(v.shape[:-2] + v.shape[-1:])
+            self._cross = numpy.zeros(v.shape[:-2] + v.shape[-1:] * 2)
+        for start in range(0, v.shape[-2], self.block_size):
+            block = v[..., start : start + self.block_size, :]
+            self._count += block.shape[-2]
+            self._sums += block.sum(axis=-2)
+            self._cross += numpy.swapaxes(block, -1, -2) @ block
+
+    def estimate(self, control_means=None) -> tuple:
+        """
+        Returns the estimate of the mean and its standard error.
+
+        Args:
+            control_means: Known expectations of the controls ``[..., n_controls]``.
+
+        Returns:
+            tuple: The estimate and its standard error, as floats or arrays of
+                the batch shape.
+        """
+        n = self._count
+        mean = self._sums / n
+        cov = self._cross / n - mean[..., :, None] * mean[..., None, :]
+        estimate, variance = mean[..., 0], cov[..., 0, 0]
+        if cov.shape[-1] > 1:
+            beta = (numpy.linalg.pinv(cov[..., 1:, 1:]) @ cov[..., 1:, :1])[..., 0]
+            control_means = numpy.asarray(control_means, dtype=numpy.float64)
+            estimate = estimate - ((mean[..., 1:] - control_means) * beta).sum(axis=-1)
+            variance = variance - (cov[..., 0, 1:] * beta).sum(axis=-1)
+        std_error = numpy.sqrt(numpy.maximum(variance, 0.0) / (n - 1))
+        return estimate[()], std_error[()]
+
+
+CONTROL_VARIATES = {"spot", "black"}
+
+
+def spot_drift(model) -> tuple:
+    """
+    Returns the initial spot and the risk-neutral drift of an equity model.
+
+    Args:
+        model (StochasticProcess): A model exposing ``mu``, or ``r`` and ``q``.
+
+    Returns:
+        tuple: The spot and the drift, as floats.
+
+    Raises:
+        ValueError: If the model exposes neither ``mu`` nor ``r`` and ``q``.
+    """
+    if hasattr(model, "_mu"):
+        return float(model.initial_values()), float(model._mu)
+    if hasattr(model, "_r") and hasattr(model, "_q"):
+        return float(model.initial_values()), float(model._r - model._q)
+    raise ValueError(
+        "control variates need a model with a known forward (mu, or r and q)"
+    )
+
+
+def black_control(
+    model,
+    sigma: Optional[float],
+    dw: tf.Tensor,
+    t_grid: tf.Tensor,
+    indices,
+    strikes,
+    phis,
+) -> tuple:
+    """
+    Undiscounted option payoffs on a companion GBM driven by ``dw``.
+
+    The companion GBM shares the spot and drift of ``model`` and has volatility
+    ``sigma`` (the model ``sigma`` when None), so the expected payoffs are
+    undiscounted Black-Scholes prices.
+
+    Args:
+        model (StochasticProcess): The simulated equity model.
+        sigma (Optional[float]): Volatility of the companion GBM.
+        dw (tf.Tensor): Standard normals driving the simulation ``[n_paths, n_steps]``.
+        t_grid (tf.Tensor): Simulation times ``[n_steps]``.
+        indices: Grid index of the maturity of each option ``[n_options]``.
+        strikes: Strikes ``[n_options]``.
+        phis: ``+1`` for calls and ``-1`` for puts ``[n_options]``.
+
+    Returns:
+        tuple: The path-wise payoffs ``[n_options, n_paths]`` (float64) and
+            their expectations ``[n_options]``.
+
+    Raises:
+        ValueError: If ``sigma`` is None and the model has no ``sigma``.
+    """
+    # imported here: the pricers depend on this module
+    from ..markethandles.utils import OptionType
+    from ..pricers.black import blackscholes_calc
+
+    spot, drift = spot_drift(model)
+    if sigma is None:
+        if not hasattr(model, "_sigma"):
+            raise ValueError("control_volatility is required for this model")
+        sigma = float(model._sigma)
+    t_np = t_grid.numpy().astype(numpy.float64)
+    dt = numpy.diff(numpy.concatenate([[0.0], t_np]))
+    w = tf.cumsum(tf.cast(dw, tf.float64) * numpy.sqrt(dt), axis=1)
+    t = t_np[indices]
+    strikes = numpy.array([float(k) for k in strikes])
+    phis = numpy.asarray(phis, dtype=numpy.float64)
+    w_t = tf.transpose(tf.gather(w, indices, axis=1))
+    s_t = spot * tf.exp((drift - 0.5 * sigma**2) * t[:, None] + sigma * w_t)
+    payoff = tf.maximum(phis[:, None] * (s_t - strikes[:, None]), 0.0)
+    # zero rate and dividend yield -drift give the undiscounted GBM price
+    call = blackscholes_calc(
+        tf.constant(spot, tf.float64),
+        tf.constant(strikes, tf.float64),
+        tf.constant(0.0, tf.float64),
+        tf.constant(sigma, tf.float64),
+        tf.constant(t, tf.float64),
+        tf.constant(-drift, tf.float64),
+        OptionType.Call,
+    ).numpy()
+    forward = spot * numpy.exp(drift * t)
+    mean = numpy.where(phis > 0.0, call, call - (forward - strikes))
+    return payoff, mean
+
+
+def path_chunks(n_paths: int, chunk_size: int, antithetic: bool, block_size: int):
+    """
+    Yields ``(offset, n_draws)`` for the chunks of a streamed simulation.
+
+    Draws are antithetic pairs when ``antithetic``. Every chunk but the last
+    holds a multiple of ``block_size`` draws, as :class:`MomentAccumulator`
+    requires for chunk-size independent results.
+
+    Args:
+        n_paths (int): Total number of paths.
+        chunk_size (int): Target number of paths per chunk.
+        antithetic (bool): Whether the paths come in antithetic pairs.
+        block_size (int): Block size of the accumulator.
+
+    Yields:
+        tuple: The index of the first draw and the number of draws of each chunk.
+    """
+    n_draws = n_paths // 2 if antithetic else n_paths
+    step = chunk_size // 2 if antithetic else chunk_size
+    step = max(1, -(-step // block_size)) * block_size
+    for offset in range(0, n_draws, step):
+        yield offset, min(step, n_draws - offset)
@@ -2,6 +2,7 @@ from .pricer import Pricer
 from ..instruments.option import VanillaOption
 from ..markethandles.utils import ExerciseType, OptionType
 from ..markethandles.marketenvironment import MarketEnvironment
+from ..numericalhandles.precision import Precision
 from ..timehandles.utils import Settings
 
 import tensorflow as tf
@@ -42,7 +43,7 @@ def blackscholes_calc(
     Returns:
         tf.Tensor: Option price.
     """
-    phi = tf.constant(float(option_type.value), dtype=tf.float32)
+    phi = float(option_type.value)
     sqrt_t = tf.sqrt(time_to_maturity)
     d1 = (
         tf.math.log(spot_price / strike)
@@ -107,7 +108,7 @@ def _bs1993_call(
     )
     B_inf = beta / (beta - 1.0) * K
     # Guard against b ~ r to avoid division by zero
-    r_minus_b = tf.maximum(r - b, tf.constant(1e-7, dtype=tf.float32))
+    r_minus_b = tf.maximum(r - b, tf.constant(1e-7, dtype=r.dtype))
     B_0 = tf.maximum(K, r * K / r_minus_b)
 
     ht = -(b * T + 2.0 * sigma * tf.sqrt(T)) * B_0 * B_inf / ((B_inf - B_0) * K)
@@ -170,6 +171,7 @@ class BlackScholesPricer(Pricer):
         self,
         dividend_model: str = "continuous",
         use_implied_repo: bool = True,
+        dtype=None,
     ):
         """Initialize the Black-Scholes / Bjerksund-Stensland pricer.
 
@@ -183,6 +185,8 @@ class BlackScholesPricer(Pricer):
                 models read from the :class:`DividendCurve` in the market.
             use_implied_repo (bool): When ``True``, reads the repo margin from
                 the market environment and includes it in the carry.
+            dtype (optional): Working dtype of the inputs and of the price.
+                Defaults to ``Precision.dtype``.
         """
         super().__init__()
         allowed_dividend_models = {"continuous", "discrete"}
@@ -193,6 +197,7 @@ class BlackScholesPricer(Pricer):
             )
         self._dividend_model = dividend_model
         self._use_implied_repo = use_implied_repo
+        self._dtype = Precision.resolve(dtype)
         self._s = None
         self._k = None
         self._t = None
@@ -245,29 +250,29 @@ class BlackScholesPricer(Pricer):
 
         sigma = tf.Variable(
             vol_surface.volatility(strike=product.strike.numpy(), tenor=tenor),
-            dtype=tf.float32,
+            dtype=self._dtype,
         )
-        s = tf.Variable(spot_value, dtype=tf.float32)
-        k = product.strike
-        t = tf.Variable(tenor, dtype=tf.float32)
+        s = tf.Variable(spot_value, dtype=self._dtype)
+        k = tf.cast(product.strike, self._dtype)
+        t = tf.Variable(tenor, dtype=self._dtype)
 
-        discount_factor = tf.cast(disc_curve.discount(product.end_date), tf.float32)
-        r = tf.Variable(-tf.math.log(discount_factor).numpy() / t.numpy(), dtype=tf.float32)
+        discount_factor = tf.cast(disc_curve.discount(product.end_date), self._dtype)
+        r = tf.Variable(-tf.math.log(discount_factor).numpy() / t.numpy(), dtype=self._dtype)
 
         # --- repo margin (independent Variable → rho w.r.t. repo) -----------
         if self._use_implied_repo:
             repo_margin = tf.Variable(
                 market_env.get_eq_repo(product.underlying, ccy=product.ccy),
-                dtype=tf.float32,
+                dtype=self._dtype,
             )
         else:
-            repo_margin = tf.Variable(0.0, dtype=tf.float32)
+            repo_margin = tf.Variable(0.0, dtype=self._dtype)
 
         # --- dividend model -------------------------------------------------
         # PV of discrete dividends always comes from the DividendCurve.
         div_curve = market_env.get_eq_dividends(product.underlying, ccy=product.ccy)
         pv_div = tf.cast(
-            div_curve.pv_dividends(product.end_date, disc_curve), tf.float32
+            div_curve.pv_dividends(product.end_date, disc_curve), self._dtype
         )
         if self._dividend_model == "discrete":
             # QuantLib / BBG standard: S* = S - PV(div), q = repo only.
@@ -281,9 +286,9 @@ class BlackScholesPricer(Pricer):
             #   q_eff = -ln(1 - PV_div / S) / T
             # Detached via .numpy() → independent Variable, same convention
             # as r and sigma.
-            pv_discrete_dividends = tf.constant(0.0, dtype=tf.float32)
+            pv_discrete_dividends = tf.constant(0.0, dtype=self._dtype)
             q_eff = tf.Variable(
-                (-tf.math.log(1.0 - pv_div / s) / t).numpy(), dtype=tf.float32
+                (-tf.math.log(1.0 - pv_div / s) / t).numpy(), dtype=self._dtype
             )
             s_net = s
             q = q_eff + repo_margin
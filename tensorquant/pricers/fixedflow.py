@@ -5,6 +5,7 @@ Pricing di cash flow fissi
 from ..flows.fixedcoupon import FixedCoupon, FixedRateLeg
 from ..markethandles.ircurve import RateCurve
 from ..timehandles.utils import Settings
+from tensorflow import convert_to_tensor, float64, reduce_sum, stack
 
 
 class FixedCouponDiscounting:
@@ -28,12 +29,17 @@ class FixedLegDiscounting:
         self._leg = leg
 
     def calculate_price(self, discount_curve: RateCurve):
-        if len(self._leg.leg_flows) == 0:
+        flows = [
+            cf
+            for cf in self._leg.leg_flows
+            if not cf.has_occurred(Settings.evaluation_date)
+        ]
+        if len(flows) == 0:
             return 0
-        npv = 0
-        for i in range(0, len(self._leg.leg_flows)):
-            cf = self._leg.leg_flows[i]
-            if not cf.has_occurred(Settings.evaluation_date):
-                pricer = FixedCouponDiscounting(cf)
-                npv += pricer.calculate_price(discount_curve)
-        return npv
+        # all payment dates are discounted in one vectorized curve evaluation
+        taus = [
+            cf.day_counter.year_fraction(Settings.evaluation_date, cf._payment_date)
+            for cf in flows
+        ]
+        amounts = stack([convert_to_tensor(cf.amount, float64) for cf in flows])
+        return reduce_sum(amounts * discount_curve.discount(taus))
@@ -1,3 +1,5 @@
+from typing import Optional
+
 import tensorflow as tf
 
 from .pricer import Pricer
@@ -5,6 +7,8 @@ from ..instruments.option import VanillaOption
 from ..markethandles.marketenvironment import MarketEnvironment
 from ..markethandles.utils import OptionType, ExerciseType
 from ..models.localvolatility import LocalVolatilityModel
+from ..numericalhandles.precision import Precision
+from ..numericalhandles.randomsource import RandomSource
 from ..timehandles.daycounter import DayCounter, DayCounterConvention
 from ..timehandles.utils import Settings
 
@@ -24,6 +28,11 @@ class LocalVolMCPricer(Pricer):
         seed: Seed for ``tf.random.normal`` (reproducibility).
         daycounter_convention: Convention used to convert dates to year
             fractions for the simulation time grid.
+        random_source: Optional :class:`RandomSource` drawing the Gaussian
+            increments (e.g. :class:`SobolRandomSource`).  Defaults to
+            ``tf.random.normal`` seeded with *seed*.
+        dtype: Working dtype of the model, the simulation and the price.
+            Defaults to ``Precision.dtype``.
     """
 
     def __init__(
@@ -32,12 +41,16 @@ class LocalVolMCPricer(Pricer):
         n_steps: int = 252,
         seed: int = 42,
         daycounter_convention: DayCounterConvention = DayCounterConvention.Actual365,
+        random_source: Optional[RandomSource] = None,
+        dtype=None,
     ) -> None:
         super().__init__()
         self._n_paths = n_paths
         self._n_steps = n_steps
         self._seed = seed
         self._daycounter = DayCounter(daycounter_convention)
+        self._random_source = random_source
+        self._dtype = Precision.resolve(dtype)
 
     # ------------------------------------------------------------------
     # Pricer interface
@@ -59,7 +72,7 @@ class LocalVolMCPricer(Pricer):
                 rate curve and dividend yield for the option's underlying.
 
         Returns:
-            tf.Tensor (scalar, float32): The option NPV.
+            tf.Tensor (scalar, in the pricer dtype): The option NPV.
 
         Raises:
             ValueError: If *product* is not a :class:`VanillaOption` or has
@@ -79,21 +92,21 @@ class LocalVolMCPricer(Pricer):
 
         T = tf.constant(
             self._daycounter.year_fraction(evaluation_date, product.end_date),
-            dtype=tf.float32,
+            dtype=self._dtype,
         )
-        S0 = tf.constant(float(spot_value), dtype=tf.float32)
+        S0 = tf.constant(float(spot_value), dtype=self._dtype)
 
-        discount_factor = tf.cast(disc_curve.discount(product.end_date), tf.float32)
-        r = tf.cast(-tf.math.log(discount_factor) / T, tf.float32)
+        discount_factor = tf.cast(disc_curve.discount(product.end_date), self._dtype)
+        r = tf.cast(-tf.math.log(discount_factor) / T, self._dtype)
 
         # continuous dividend yield (DIVYIELD key, defaults to 0)
         q_raw = market_env.get_eq_div_yield(product.underlying, ccy=product.ccy)
-        q = tf.constant(float(q_raw or 0.0), dtype=tf.float32)
+        q = tf.constant(float(q_raw or 0.0), dtype=self._dtype)
 
         # ---- implied-vol surface → LocalVolatilityModel (Dupire) ------------
-        T_grid = tf.constant(vol_surface.maturity, dtype=tf.float32)
-        K_grid = tf.constant(vol_surface.strike,   dtype=tf.float32)
-        iv_matrix = tf.constant(vol_surface.volatility_matrix, dtype=tf.float32)
+        T_grid = tf.constant(vol_surface.maturity, dtype=self._dtype)
+        K_grid = tf.constant(vol_surface.strike,   dtype=self._dtype)
+        iv_matrix = tf.constant(vol_surface.volatility_matrix, dtype=self._dtype)
 
         lv_model = LocalVolatilityModel.from_implied_vol(
             iv_matrix=iv_matrix,
@@ -102,14 +115,20 @@ class LocalVolMCPricer(Pricer):
             S0=S0,
             r=r,
             q=q,
+            dtype=self._dtype,
         )
 
         # ---- simulation -----------------------------------------------------
         T_max   = float(T_grid[-1].numpy())
-        t_grid  = tf.linspace(0.0, T_max, self._n_steps + 1)[1:]   # skip t=0
-
-        tf.random.set_seed(self._seed)
-        dw    = tf.random.normal([self._n_paths, self._n_steps], dtype=tf.float32)
+        t_grid  = tf.linspace(tf.constant(0.0, self._dtype), T_max, self._n_steps + 1)[1:]   # skip t=0
+
+        if self._random_source is None:
+            tf.random.set_seed(self._seed)
+            dw = tf.random.normal([self._n_paths, self._n_steps], dtype=self._dtype)
+        else:
+            dw = self._random_source.increments(
+                self._n_paths, t_grid.numpy(), self._dtype
+            )
         paths = lv_model.evolve(t_grid, dw)                         # [n_paths, n_steps]
 
         # terminal spots at product maturity
@@ -118,8 +137,8 @@ class LocalVolMCPricer(Pricer):
         S_T        = paths[:, target_idx]                           # [n_paths]
 
         # ---- discounted payoff ----------------------------------------------
-        K   = tf.cast(product.strike, tf.float32)
-        phi = tf.constant(float(product.option_type.value), dtype=tf.float32)
+        K   = tf.cast(product.strike, self._dtype)
+        phi = tf.constant(float(product.option_type.value), dtype=self._dtype)
         payoff = tf.maximum(phi * (S_T - K), 0.0)
         price  = discount_factor * tf.reduce_mean(payoff)
 
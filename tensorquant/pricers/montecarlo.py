@@ -1,10 +1,24 @@
+from typing import Optional, Sequence
+
 import numpy as np
 import tensorflow as tf
 
 from .pricer import Pricer
 from ..instruments.autocallable import AutocallableOption
 from ..markethandles.marketenvironment import MarketEnvironment
+from ..markethandles.utils import OptionType
+from ..models.kernels import simulation_kernel
 from ..models.stochasticprocess import StochasticProcess
+from ..numericalhandles.randomsource import PseudoRandomSource, RandomSource
+from ..numericalhandles.variancereduction import (
+    CONTROL_VARIATES,
+    MomentAccumulator,
+    antithetic_increments,
+    black_control,
+    mc_estimate,
+    path_chunks,
+    spot_drift,
+)
 from ..timehandles.daycounter import DayCounter, DayCounterConvention
 from ..timehandles.schedule import ScheduleGenerator
 from ..timehandles.targetcalendar import TARGET
@@ -20,7 +34,8 @@ class AutocallableMCPricer(Pricer):
     maturity.
 
     The price stored on the product via :meth:`Pricer.price` is expressed in
-    **currency units** (notional-adjusted NPV).
+    **currency units** (notional-adjusted NPV).  The simulation and the
+    payoff run in the working dtype of the model (``model.dtype``).
 
     Args:
         model: Calibrated :class:`StochasticProcess` (e.g.
@@ -32,7 +47,32 @@ class AutocallableMCPricer(Pricer):
         calendar: Business-day calendar used to build the auxiliary monthly
             discretization grid.  Defaults to TARGET when ``None``.
         discretization_months: Step (in months) of the auxiliary grid added
-            on top of the product's own fixing dates.
+            on top of the product's own fixing dates.  Not used for models
+            with ``supports_exact_steps``, which are simulated on the
+            observation dates only.
+        random_source: Optional :class:`RandomSource` drawing the Gaussian
+            increments (e.g. :class:`SobolRandomSource`).  Defaults to
+            ``tf.random.normal`` seeded with *seed*.
+        antithetic: Simulate ``n_paths // 2`` antithetic pairs.
+        control_variates: Control variates regressed out of the path-wise
+            present value: ``"spot"`` (spot on the last grid date, whose mean
+            is the model forward) and/or ``"black"`` (a put struck at
+            ``product.strike`` at maturity on a companion GBM, whose mean is
+            the Black-Scholes price).  See :class:`VanillaMCPricer`.
+        control_volatility: Volatility of the companion GBM of the ``"black"``
+            control.  Defaults to the model ``sigma`` when it has one.
+        chunk_size: Stream the simulation and the payoff in chunks of (about)
+            this many paths, with a price independent of the chunk size.  See
+            :class:`VanillaMCPricer`.
+        barrier_smoothing: Width, as a fraction of the strike, of the sigmoid
+            replacing the coupon, autocall and redemption barrier indicators.
+            Zero (default) prices the exact digital payoff, whose coupons and
+            autocalls carry no pathwise sensitivity; a small width (e.g.
+            ``0.01``) gives AAD deltas and vegas for them at the cost of a
+            small bias.
+
+    The standard error of the last price, in currency units, is available as
+    :attr:`std_error`.
     """
 
     def __init__(
@@ -43,14 +83,37 @@ class AutocallableMCPricer(Pricer):
         daycounter_convention: DayCounterConvention = DayCounterConvention.Actual360,
         calendar=None,
         discretization_months: int = 1,
+        random_source: Optional[RandomSource] = None,
+        antithetic: bool = False,
+        control_variates: Sequence[str] = (),
+        control_volatility: Optional[float] = None,
+        chunk_size: Optional[int] = None,
+        barrier_smoothing: float = 0.0,
     ) -> None:
         super().__init__()
+        unknown = set(control_variates) - CONTROL_VARIATES
+        if unknown:
+            raise ValueError(f"Unknown control variates: {sorted(unknown)}")
         self._model = model
         self._n_paths = n_paths
         self._seed = seed
         self._daycounter = DayCounter(daycounter_convention)
         self._calendar = calendar if calendar is not None else TARGET()
         self._discretization_months = discretization_months
+        self._random_source = random_source
+        self._antithetic = antithetic
+        self._control_variates = tuple(control_variates)
+        self._control_volatility = control_volatility
+        self._chunk_size = chunk_size
+        self._barrier_smoothing = barrier_smoothing
+        self._std_error = None
+
+    @property
+    def std_error(self) -> float:
+        """Standard error of the last Monte Carlo price, in currency units."""
+        if self._std_error is None:
+            raise ValueError("price the option first")
+        return self._std_error
 
     # ------------------------------------------------------------------
     # Pricer interface
@@ -65,6 +128,13 @@ class AutocallableMCPricer(Pricer):
             product: The autocallable option to price.
             market_env: Market environment providing the discount curve.
 
+        The payoff is evaluated in TensorFlow, so with
+        ``Pricer.price(autodiff=True)`` the tape holds pathwise sensitivities
+        to the model variables (e.g. spot and volatility of a
+        :class:`GeometricBrownianMotion`) and to the discount curve.  Digital
+        features (coupons, autocall) contribute to them only with
+        ``barrier_smoothing``.
+
         Returns:
             NPV as a ``tf.Tensor`` in currency units (notional × price_pct).
 
@@ -78,55 +148,142 @@ class AutocallableMCPricer(Pricer):
         disc_curve = market_env.get_ir_curve(product.ccy)
 
         date_grid, time_grid_tensor = self._build_date_grid(product, valuation_date)
-        s_t = self._simulate(time_grid_tensor)
+        if self._chunk_size is not None:
+            price_pct, std_error = self._stream(
+                product, time_grid_tensor, date_grid, disc_curve, valuation_date
+            )
+            self._std_error = std_error * product.notional
+            return tf.constant(price_pct * product.notional, dtype=self._model.dtype)
+
+        z, s_t = self._simulate(time_grid_tensor)
 
         price_pct = self._price_option_leg(
             product, s_t, date_grid, disc_curve, valuation_date
         )
-        return tf.constant(price_pct * product.notional, dtype=tf.float64)
+        if self._antithetic or self._control_variates:
+            controls, control_means = self._controls(
+                product, z, s_t, time_grid_tensor, date_grid
+            )
+            price_pct, std_error = mc_estimate(
+                self._path_pv, controls, control_means, self._antithetic
+            )
+        else:
+            std_error = mc_estimate(self._path_pv)[1]
+        self._std_error = float(std_error) * product.notional
+        return price_pct * product.notional
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _build_date_grid(self, product: AutocallableOption, valuation_date):
-        """Merge product fixing dates with the auxiliary discretization grid.
+        """Build the simulation dates of *product*.
+
+        When the model samples its transition law exactly over any step
+        (``model.supports_exact_steps``, e.g. :class:`GeometricBrownianMotion`)
+        only the observation dates still to come are simulated.  Otherwise the
+        product fixing dates are merged with the auxiliary discretization grid.
 
         Returns:
             date_grid: Sorted list of :class:`datetime.date` objects.
-            time_grid_tensor: ``tf.Tensor`` of year fractions (float64).
+            time_grid_tensor: ``tf.Tensor`` of year fractions in the model dtype.
         """
-        schedule_gen = ScheduleGenerator(
-            self._calendar, BusinessDayConvention.ModifiedFollowing
-        )
-        disc_dates = schedule_gen.generate(
-            valuation_date,
-            product.end_date,
-            self._discretization_months,
-            TimeUnit.Months,
-        )
-        date_set = (
-            set(product.coupon_fixing_dates)
-            | set(product.autocall_fixing_dates)
-            | set(disc_dates)
-        )
+        date_set = set(product.coupon_fixing_dates) | set(product.autocall_fixing_dates)
+        if getattr(self._model, "supports_exact_steps", False):
+            date_set = {d for d in date_set if d > valuation_date}
+        else:
+            schedule_gen = ScheduleGenerator(
+                self._calendar, BusinessDayConvention.ModifiedFollowing
+            )
+            disc_dates = schedule_gen.generate(
+                valuation_date,
+                product.end_date,
+                self._discretization_months,
+                TimeUnit.Months,
+            )
+            date_set |= set(disc_dates)
         date_grid = sorted(date_set)
         time_grid = [
             self._daycounter.year_fraction(valuation_date, d) for d in date_grid
         ]
-        return date_grid, tf.constant(time_grid, dtype=tf.float64)
+        return date_grid, tf.constant(time_grid, dtype=self._model.dtype)
 
     def _simulate(self, time_grid_tensor: tf.Tensor) -> tf.Tensor:
         """Draw Gaussian variates and evolve the model.
 
         Returns:
-            Tensor of shape ``[n_paths, n_steps]``.
+            The variates and the simulated spots, both of shape
+            ``[n_paths, n_steps]``.
         """
         n_steps = time_grid_tensor.shape[0]
-        z = tf.random.normal(
-            (self._n_paths, n_steps), seed=self._seed, dtype=tf.float64
-        )
-        return self._model.evolve(time_grid_tensor, z)
+        n_draws = self._n_paths // 2 if self._antithetic else self._n_paths
+        if self._random_source is None:
+            z = tf.random.normal(
+                (n_draws, n_steps), seed=self._seed, dtype=time_grid_tensor.dtype
+            )
+        else:
+            z = self._random_source.increments(
+                n_draws, time_grid_tensor.numpy(), time_grid_tensor.dtype
+            )
+        if self._antithetic:
+            z = antithetic_increments(z)
+        return z, self._model.evolve(time_grid_tensor, z)
+
+    def _stream(self, product, time_grid_tensor, date_grid, disc_curve, valuation_date):
+        """Simulate and evaluate the payoff chunk by chunk.
+
+        Returns:
+            The price as a fraction of notional and its standard error.
+        """
+        source = self._random_source or PseudoRandomSource(self._seed)
+        accumulator = MomentAccumulator(self._antithetic)
+        control_means = None
+        coupon_pv = redemption_pv = 0.0
+        for offset, n_draws in path_chunks(
+            self._n_paths, self._chunk_size, self._antithetic, accumulator.block_size
+        ):
+            z = source.increments(
+                n_draws, time_grid_tensor.numpy(), time_grid_tensor.dtype, offset
+            )
+            if self._antithetic:
+                z = antithetic_increments(z)
+            s_t = self._model.evolve(time_grid_tensor, z)
+            self._price_option_leg(product, s_t, date_grid, disc_curve, valuation_date)
+            coupon_pv += self._coupon_pv * s_t.shape[0]
+            redemption_pv += self._redemption_pv * s_t.shape[0]
+            controls, control_means = self._controls(
+                product, z, s_t, time_grid_tensor, date_grid
+            )
+            accumulator.add(self._path_pv, controls)
+        n_paths = 2 * (self._n_paths // 2) if self._antithetic else self._n_paths
+        self._coupon_pv = coupon_pv / n_paths
+        self._redemption_pv = redemption_pv / n_paths
+        return accumulator.estimate(control_means)
+
+    def _controls(self, product, z, s_t, time_grid_tensor, date_grid):
+        """Build the path-wise control variates and their known means.
+
+        Returns:
+            Controls ``[n_paths, n_controls]`` and means ``[n_controls]`` (float64),
+            or ``(None, None)`` when no control variate is requested.
+        """
+        if not self._control_variates:
+            return None, None
+        spot, drift = spot_drift(self._model)
+        controls, means = [], []
+        if "spot" in self._control_variates:
+            t = float(time_grid_tensor[-1])
+            controls.append(tf.cast(s_t[:, -1], tf.float64))
+            means.append(spot * np.exp(drift * t))
+        if "black" in self._control_variates:
+            control, mean = black_control(
+                self._model, self._control_volatility, z, time_grid_tensor,
+                [date_grid.index(product.coupon_fixing_dates[-1])],
+                [float(product.strike)], [OptionType.Put.value],
+            )
+            controls.append(control[0])
+            means.append(mean[0])
+        return tf.stack(controls, axis=1), tf.constant(means, tf.float64)
 
     def _price_option_leg(
         self,
@@ -135,11 +292,13 @@ class AutocallableMCPricer(Pricer):
         date_grid: list,
         disc_curve,
         valuation_date,
-    ) -> float:
+    ) -> tf.Tensor:
         """Path-wise Monte Carlo evaluation of the autocallable option leg.
 
-        Loops over all unique observation dates (union of coupon and autocall
-        fixing dates) in chronological order.  At each date it checks:
+        Tabulates all future observation dates (union of coupon and autocall
+        fixing dates) in chronological order and evaluates them with the
+        compiled ``tf.scan`` of the :class:`SimulationKernel`
+        :func:`_autocallable_payoff`.  At each date:
 
         * **Coupon leg** — conditional coupon (with optional memory) if the
           note is alive and spot ≥ coupon barrier.
@@ -156,91 +315,163 @@ class AutocallableMCPricer(Pricer):
             valuation_date: Pricing date; past fixing dates are skipped.
 
         Returns:
-            Mean present value as a fraction of notional.
+            Mean present value as a fraction of notional (scalar tensor in the
+            dtype of *s_t*).
         """
+        dtype = s_t.dtype
         strike = product.strike
-        coupon_fixing_dates = product.coupon_fixing_dates
-        coupon_payment_dates = product.coupon_payment_dates
-        coupon_rates = product.coupon_rates
-        coupon_barriers = product.coupon_barriers
-        autocall_fixing_dates = product.autocall_fixing_dates
-        autocall_payment_dates = product.autocall_payment_dates
-        autocall_barriers = product.autocall_barrier
-        payoff_barrier = product.payoff_barrier
-        payoff_participation = product.payoff_participation
-        memory = product.memory
-
-        n_paths = s_t.shape[0]
         date_to_col = {d: j for j, d in enumerate(date_grid)}
-
         coupon_map = {
-            d: (i, coupon_payment_dates[i])
-            for i, d in enumerate(coupon_fixing_dates)
+            d: i for i, d in enumerate(product.coupon_fixing_dates)
         }
         autocall_map = {
-            d: (i, autocall_payment_dates[i])
-            for i, d in enumerate(autocall_fixing_dates)
+            d: i for i, d in enumerate(product.autocall_fixing_dates)
         }
+        fixing_dates = [
+            d
+            for d in sorted(set(coupon_map) | set(autocall_map))
+            if d > valuation_date
+        ]
 
-        all_fixing_dates = sorted(
-            set(coupon_fixing_dates) | set(autocall_fixing_dates)
-        )
-
-        alive = np.ones(n_paths, dtype=bool)
-        unpaid_coupons = np.zeros(n_paths, dtype=np.float64)
-        coupon_pv = np.zeros(n_paths, dtype=np.float64)
-        redemption_pv = np.zeros(n_paths, dtype=np.float64)
-
-        for fix_date in all_fixing_dates:
-            if fix_date <= valuation_date:
-                continue
-            if not alive.any():
-                break
-
-            col = date_to_col[fix_date]
-            s_i = s_t[:, col].numpy()
-
-            # --- coupon leg ---
-            if fix_date in coupon_map:
-                c_idx, c_pay_date = coupon_map[fix_date]
-                coupon_thr = coupon_barriers[c_idx] / 100.0 * strike
-                above_coupon = s_i >= coupon_thr
-                paid = alive & above_coupon
-
-                if memory:
-                    pay_amount = coupon_rates[c_idx] / 100.0 * (1.0 + unpaid_coupons)
-                else:
-                    pay_amount = coupon_rates[c_idx] / 100.0
-
-                df = float(disc_curve.discount(c_pay_date))
-                coupon_pv += np.where(paid, pay_amount, 0.0) * df
-
-                # --- capital-at-risk put at maturity ---
-                if (
-                    fix_date == coupon_fixing_dates[-1]
-                    and product.redemption_payoff is not None
-                ):
-                    below_barrier = s_i <= payoff_barrier / 100.0 * strike
-                    redemption_pv += np.where(
-                        alive & below_barrier,
-                        product.redemption_payoff(s_i, strike, payoff_participation),
-                        0.0,
-                    ) * df
-
-                # --- memory counter ---
-                unpaid_coupons = np.where(paid, 0.0, unpaid_coupons)
-                unpaid_coupons = np.where(
-                    alive & ~above_coupon, unpaid_coupons + 1.0, unpaid_coupons
+        # one row per fixing date: column, flags, levels, rates and discounts
+        cols, is_coupon, rates, coupon_levels, dfs = [], [], [], [], []
+        is_final, is_autocall, autocall_levels = [], [], []
+        for fix_date in fixing_dates:
+            cols.append(date_to_col[fix_date])
+            c_idx = coupon_map.get(fix_date)
+            is_coupon.append(c_idx is not None)
+            is_final.append(fix_date == product.coupon_fixing_dates[-1])
+            if c_idx is not None:
+                rates.append(product.coupon_rates[c_idx] / 100.0)
+                coupon_levels.append(product.coupon_barriers[c_idx] / 100.0 * strike)
+                pay_date = product.coupon_payment_dates[c_idx]
+                dfs.append(tf.cast(disc_curve.discount(pay_date), dtype))
+            else:
+                rates.append(0.0)
+                coupon_levels.append(0.0)
+                dfs.append(tf.constant(0.0, dtype))
+            a_idx = autocall_map.get(fix_date)
+            is_autocall.append(a_idx is not None)
+            autocall_levels.append(
+                product.autocall_barrier[a_idx] / 100.0 * strike
+                if a_idx is not None
+                else 0.0
+            )
+
+        if fixing_dates:
+            # the redemption payoff is a user callable: it is evaluated outside
+            # the compiled kernel, on the spots of the final coupon fixing
+            final_date = product.coupon_fixing_dates[-1]
+            if product.redemption_payoff is not None and final_date in date_to_col:
+                redemption = product.redemption_payoff(
+                    s_t[:, date_to_col[final_date]],
+                    tf.constant(float(strike), dtype),
+                    tf.constant(product.payoff_participation, dtype),
                 )
-
-            # --- autocall leg ---
-            if fix_date in autocall_map:
-                a_idx, _ = autocall_map[fix_date]
-                autocall_thr = autocall_barriers[a_idx] / 100.0 * strike
-                above_autocall = s_i >= autocall_thr
-                alive = alive & ~above_autocall
+            else:
+                redemption = tf.zeros_like(s_t[:, 0])
+            coupon_pv, redemption_pv = _autocallable_payoff(
+                s_t,
+                tf.constant(cols, tf.int32),
+                tf.constant(is_coupon, dtype),
+                tf.constant(rates, dtype),
+                tf.constant(coupon_levels, dtype),
+                tf.stack(dfs),
+                tf.constant(is_final, dtype),
+                tf.constant(is_autocall, dtype),
+                tf.constant(autocall_levels, dtype),
+                tf.constant(product.payoff_barrier / 100.0 * strike, dtype),
+                redemption,
+                tf.constant(self._barrier_smoothing * float(strike), dtype),
+                tf.constant(float(product.memory), dtype),
+            )
+        else:
+            coupon_pv = redemption_pv = tf.zeros_like(s_t[:, 0])
 
         total_pv = coupon_pv + redemption_pv
-        self._coupon_pv = float(coupon_pv.mean())
-        self._redemption_pv = float(redemption_pv.mean())
-        return float(total_pv.mean())
+        self._path_pv = total_pv
+        self._coupon_pv = float(tf.reduce_mean(coupon_pv))
+        self._redemption_pv = float(tf.reduce_mean(redemption_pv))
+        return tf.reduce_mean(total_pv)
+
+
+@simulation_kernel(
+    tf.TensorSpec([None, None], tf.float32),  # s_t
+    tf.TensorSpec([None], tf.int32),  # cols
+    tf.TensorSpec([None], tf.float32),  # is_coupon
+    tf.TensorSpec([None], tf.float32),  # rates
+    tf.TensorSpec([None], tf.float32),  # coupon_levels
+    tf.TensorSpec([None], tf.float32),  # dfs
+    tf.TensorSpec([None], tf.float32),  # is_final
+    tf.TensorSpec([None], tf.float32),  # is_autocall
+    tf.TensorSpec([None], tf.float32),  # autocall_levels
+    tf.TensorSpec([], tf.float32),  # payoff_level
+    tf.TensorSpec([None], tf.float32),  # redemption
+    tf.TensorSpec([], tf.float32),  # smoothing
+    tf.TensorSpec([], tf.float32),  # memory
+)
+def _autocallable_payoff(
+    s_t,
+    cols,
+    is_coupon,
+    rates,
+    coupon_levels,
+    dfs,
+    is_final,
+    is_autocall,
+    autocall_levels,
+    payoff_level,
+    redemption,
+    smoothing,
+    memory,
+):
+    """Scan the fixing dates of an autocallable, path by path.
+
+    The barrier indicators are ``1{x >= 0}``, or ``sigmoid(x / smoothing)``
+    when *smoothing* is positive, and the state of each path (alive, unpaid
+    coupons) is carried as float weights, so that every product shares one
+    trace of the kernel whatever its strike, memory flag or number of fixings.
+
+    Args:
+        s_t: Simulated spots ``[n_paths, n_dates]``.
+        cols: Columns of *s_t* of the fixing dates ``[n_fixings]``.
+        is_coupon, is_final, is_autocall: Date flags (0 or 1) ``[n_fixings]``.
+        rates, coupon_levels, dfs: Coupon rates, coupon barrier levels and
+            discount factors of the coupon payment dates ``[n_fixings]``.
+        autocall_levels: Autocall barrier levels ``[n_fixings]``.
+        payoff_level: Barrier level of the final redemption.
+        redemption: Redemption payoff of each path at the final fixing ``[n_paths]``.
+        smoothing: Width of the smoothed barrier indicators, in spot units.
+        memory: 1 if missed coupons are paid later, 0 otherwise.
+
+    Returns:
+        The discounted coupon and redemption values ``[n_paths]`` as
+        fractions of notional.
+    """
+    smooth = smoothing > 0.0
+    width = tf.where(smooth, smoothing, tf.ones_like(smoothing))
+
+    def indicator(x):
+        return tf.where(smooth, tf.sigmoid(x / width), tf.cast(x >= 0.0, x.dtype))
+
+    def step(state, fixing):
+        alive, unpaid, coupon_pv, redemption_pv = state
+        s, coupon, rate, coupon_level, df, final, autocall, autocall_level = fixing
+        above_coupon = indicator(s - coupon_level)
+        paid = alive * above_coupon * coupon
+        coupon_pv += paid * rate * (1.0 + memory * unpaid) * df
+        redeemed = alive * final * indicator(payoff_level - s)
+        redemption_pv += redeemed * redemption * df
+        missed = alive * (1.0 - above_coupon) * (unpaid + 1.0) + (1.0 - alive) * unpaid
+        unpaid = coupon * missed + (1.0 - coupon) * unpaid
+        alive = alive * (1.0 - autocall * indicator(s - autocall_level))
+        return alive, unpaid, coupon_pv, redemption_pv
+
+    s_fix = tf.transpose(tf.gather(s_t, cols, axis=1))  # [n_fixings, n_paths]
+    zeros = tf.zeros_like(redemption)
+    states = tf.scan(
+        step,
+        (s_fix, is_coupon, rates, coupon_levels, dfs, is_final, is_autocall, autocall_levels),
+        initializer=(tf.ones_like(zeros), zeros, zeros, zeros),
+    )
+    return states[2][-1], states[3][-1]
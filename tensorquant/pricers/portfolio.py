@@ -0,0 +1,378 @@
+"""
+Pricing batch di portafogli di swap e OIS
+"""
+
+import numpy
+import tensorflow as tf
+
+from .pricer import Pricer
+from .swapdiscounting import _index_curve
+from ..instruments.ois import Ois
+from ..instruments.product import Product
+from ..instruments.swap import Swap
+from ..markethandles.ircurve import RateCurve
+from ..markethandles.marketenvironment import MarketEnvironment
+from ..markethandles.utils import SwapType
+from ..timehandles.utils import Settings
+
+
+class _FlowGroup:
+    """Cash flows discounted and projected on the same pair of curves.
+
+    Every flow is valued as ``(a * (P_est(t1) / P_est(t2) - 1) + b) * P_disc(tp)``:
+    fixed coupons and already fixed floating coupons only carry ``b``, while
+    forecast floating coupons carry the geared forward in ``a`` and the spread
+    in ``b``. Flows are summed into their leg by ``segments``.
+    """
+
+    def __init__(self, disc_curve: RateCurve, est_curve: RateCurve):
+        self.disc_curve = disc_curve
+        self.est_curve = est_curve
+        self._columns = {
+            "segments": [],
+            "pay_times": [],
+            "start_times": [],
+            "end_times": [],
+            "a": [],
+            "b": [],
+        }
+
+    def add(self, segment, pay_times, start_times, end_times, a, b) -> None:
+        n = len(pay_times)
+        self._columns["segments"].append(numpy.full(n, segment, dtype=numpy.int32))
+        self._columns["pay_times"].append(pay_times)
+        self._columns["start_times"].append(start_times)
+        self._columns["end_times"].append(end_times)
+        self._columns["a"].append(a)
+        self._columns["b"].append(b)
+
+    def freeze(self) -> None:
+        """Concatenates the collected flows into constant tensors."""
+        for name, chunks in self._columns.items():
+            setattr(self, name, tf.constant(numpy.concatenate(chunks)))
+        self._columns = None
+
+    def flow_npvs(self) -> tf.Tensor:
+        ratio = self.est_curve.discount(self.start_times) / self.est_curve.discount(
+            self.end_times
+        )
+        amounts = self.a * (ratio - 1.0) + self.b
+        return amounts * self.disc_curve.discount(self.pay_times)
+
+
+class SwapBook:
+    """A book of swaps and OIS with all leg cash flows packed into flat tensors.
+
+    Flows are grouped by (discount curve, estimation curve) and tagged with the
+    leg they belong to, so the NPVs of every leg are computed with one
+    vectorized curve evaluation per group and a segment sum. Flows that have
+    already occurred at ``Settings.evaluation_date`` are dropped while packing,
+    and historical fixings are frozen into the flow amounts.
+
+    Args:
+        products (list[Product]): The swaps and OIS of the book.
+        market_env (MarketEnvironment): The market environment providing the curves.
+
+    Raises:
+        TypeError: If a product is neither a Swap nor an Ois.
+        ValueError: If a curve is not found.
+    """
+
+    def __init__(self, products: list[Product], market_env: MarketEnvironment):
+        self._size = len(products)
+        self._evaluation_date = Settings.evaluation_date
+        self._groups = {}
+        self._curves = {}
+        for i, product in enumerate(products):
+            disc_curve, est_curve = self._curves_for(product, market_env)
+            key = (id(disc_curve), id(est_curve))
+            if key not in self._groups:
+                self._groups[key] = _FlowGroup(disc_curve, est_curve)
+            group = self._groups[key]
+            sign = 1.0 if product.swap_type == SwapType.Payer else -1.0
+            self._pack_fixed_leg(group, 2 * i, product, -sign)
+            self._pack_floating_leg(group, 2 * i + 1, product, sign)
+        self._groups = [g for g in self._groups.values() if g._columns["a"]]
+        for group in self._groups:
+            group.freeze()
+        self._npv_function = None
+        self._jacobian_function = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def curves(self) -> dict:
+        """Returns the curves the book depends on, keyed by curve name.
+
+        Returns:
+            dict: Curve name to RateCurve.
+        """
+        return {curve.name: curve for curve in self._curves.values()}
+
+    @staticmethod
+    def resolve_curves(product: Product, market_env: MarketEnvironment) -> tuple:
+        """Returns the discount and estimation curves of ``product`` in ``market_env``.
+
+        Args:
+            product (Product): A Swap or Ois.
+            market_env (MarketEnvironment): The market environment providing the curves.
+
+        Returns:
+            tuple: The discount and estimation RateCurve.
+
+        Raises:
+            TypeError: If the product is neither a Swap nor an Ois.
+            ValueError: If a curve is not found.
+        """
+        try:
+            if type(product) == Ois:
+                disc_curve = _index_curve(market_env, product.index, "CCY:ON")
+                est_curve = disc_curve
+            elif type(product) == Swap:
+                disc_curve = market_env.get_ir_curve(product.ccy)
+                est_curve = _index_curve(market_env, product.index, "CCY:TENOR")
+            else:
+                raise TypeError(f"{product} is a wrong product type")
+        except ValueError as e:
+            raise ValueError(f"Unknown Curve: {e}") from e
+        return disc_curve, est_curve
+
+    def _curves_for(self, product: Product, market_env: MarketEnvironment):
+        disc_curve, est_curve = self.resolve_curves(product, market_env)
+        product.discount_curve = disc_curve.name
+        product.estimation_curve = est_curve.name
+        self._curves[id(disc_curve)] = disc_curve
+        self._curves[id(est_curve)] = est_curve
+        return disc_curve, est_curve
+
+    def _pack_fixed_leg(
+        self, group: _FlowGroup, segment: int, product: Product, sign: float
+    ) -> None:
+        flows = [
+            cf
+            for cf in product.fixed_leg.leg_flows
+            if not cf.has_occurred(self._evaluation_date)
+        ]
+        if len(flows) == 0:
+            return
+        pay_times = flows[0].day_counter.year_fraction_array(
+            self._evaluation_date, [cf.date for cf in flows]
+        )
+        zeros = numpy.zeros(len(flows))
+        amounts = numpy.array([float(cf.amount) for cf in flows])
+        group.add(segment, pay_times, zeros, zeros, zeros, sign * amounts)
+
+    def _pack_floating_leg(
+        self, group: _FlowGroup, segment: int, product: Product, sign: float
+    ) -> None:
+        flows = [
+            cf
+            for cf in product.floating_leg.leg_flows
+            if not cf.has_occurred(self._evaluation_date)
+        ]
+        if len(flows) == 0:
+            return
+        est_curve = group.est_curve
+        starts = [cf.ref_period_start for cf in flows]
+        ends = [cf.ref_period_end for cf in flows]
+        day_counter = flows[0].day_counter
+        pay_times = day_counter.year_fraction_array(
+            self._evaluation_date, [cf.date for cf in flows]
+        )
+        accruals = day_counter.year_fraction_array(
+            [cf.accrual_start_date for cf in flows],
+            [cf.accrual_end_date for cf in flows],
+        )
+        nominals = numpy.array([cf.nominal for cf in flows], dtype=numpy.float64)
+        gearings = numpy.array([cf.gearing for cf in flows], dtype=numpy.float64)
+        spreads = numpy.array([cf.spread for cf in flows], dtype=numpy.float64)
+
+        if type(product) == Ois:
+            # OisCouponDiscounting: forecast until the reference period starts
+            forecast = numpy.array([s >= self._evaluation_date for s in starts])
+            taus = est_curve.daycounter.year_fraction_array(starts, ends)
+        else:
+            # FloatingCouponDiscounting: forecast until the coupon fixes
+            forecast = numpy.array(
+                [cf.fixing_date > self._evaluation_date for cf in flows]
+            )
+            taus = product.index.daycounter.year_fraction_array(starts, ends)
+
+        fixings = numpy.zeros(len(flows))
+        for j in numpy.flatnonzero(~forecast):
+            cf = flows[j]
+            if type(product) == Ois:
+                fixings[j] = cf.index.fixing(cf.index.fixing_date(cf.fixing_date))
+            else:
+                fixings[j] = cf.index.fixing(cf.fixing_date)
+
+        scale = sign * nominals * accruals
+        a = numpy.where(forecast, scale * gearings / taus, 0.0)
+        b = scale * (spreads + numpy.where(forecast, 0.0, gearings * fixings))
+        start_times = numpy.where(
+            forecast,
+            est_curve.daycounter.year_fraction_array(est_curve.reference_date, starts),
+            0.0,
+        )
+        end_times = numpy.where(
+            forecast,
+            est_curve.daycounter.year_fraction_array(est_curve.reference_date, ends),
+            0.0,
+        )
+        group.add(segment, pay_times, start_times, end_times, a, b)
+
+    def _leg_npvs(self) -> tf.Tensor:
+        """Computes the NPVs of all legs as a ``[n_products, 2]`` tensor (fixed, floating)."""
+        n_segments = 2 * self._size
+        npvs = tf.zeros([n_segments], dtype=tf.float64)
+        for group in self._groups:
+            npvs += tf.math.unsorted_segment_sum(
+                group.flow_npvs(), group.segments, n_segments
+            )
+        return tf.reshape(npvs, [self._size, 2])
+
+    def _leg_npvs_and_jacobians(self):
+        # forward mode: one pass per pillar is far cheaper than one backward
+        # pass per product when the book is much larger than the curves
+        leg_npvs = self._leg_npvs()
+        jacobians = []
+        for curve in self._curves.values():
+            n_pillars = curve.rate_variable.shape[0]
+            columns = []
+            for j in range(n_pillars):
+                tangent = tf.one_hot(j, n_pillars, dtype=tf.float64)
+                with tf.autodiff.ForwardAccumulator(curve.rate_variable, tangent) as acc:
+                    npvs = tf.reduce_sum(self._leg_npvs(), axis=1)
+                columns.append(
+                    acc.jvp(npvs, unconnected_gradients=tf.UnconnectedGradients.ZERO)
+                )
+            jacobians.append(tf.stack(columns, axis=1))
+        return leg_npvs, jacobians
+
+    def leg_npvs(self) -> tf.Tensor:
+        """Prices every leg of the book in one compiled pass.
+
+        Returns:
+            tf.Tensor: The leg NPVs, shape ``[n_products, 2]`` (fixed, floating),
+                signed according to the swap type.
+        """
+        if self._npv_function is None:
+            self._npv_function = tf.function(self._leg_npvs)
+        return self._npv_function()
+
+    def leg_npvs_and_jacobians(self):
+        """Prices every leg and differentiates the product NPVs w.r.t. the curve pillars.
+
+        Returns:
+            tuple: The leg NPVs ``[n_products, 2]`` and a dict mapping each curve
+                name to the Jacobian of the product NPVs, shape ``[n_products, n_pillars]``.
+        """
+        if self._jacobian_function is None:
+            self._jacobian_function = tf.function(self._leg_npvs_and_jacobians)
+        leg_npvs, jacobians = self._jacobian_function()
+        names = [curve.name for curve in self._curves.values()]
+        return leg_npvs, dict(zip(names, jacobians))
+
+
+class PortfolioPricer(Pricer):
+    """Prices a whole book of Swap and Ois products in one vectorized pass.
+
+    The book is packed into a :class:`SwapBook` on first use and reused while
+    the products, the curves they resolve to and the evaluation date are
+    unchanged, so repricing after an in-place curve move only reruns the
+    compiled TF function. Replacing a curve in the market environment (e.g. a
+    re-strip) repacks the book on the new curve.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._book = None
+        self._book_key = None
+        self._book_refs = None
+        self._jacobians = None
+
+    @property
+    def jacobians(self) -> dict:
+        """Returns the per-curve Jacobians of the last autodiff pricing.
+
+        Returns:
+            dict: Curve name to numpy array of shape ``[n_products, n_pillars]``.
+        """
+        if self._jacobians is None:
+            raise ValueError("autodiff must be enabled")
+        return self._jacobians
+
+    def book(self, products: list[Product], market_env: MarketEnvironment) -> SwapBook:
+        """Returns the packed book for ``products``, packing it only when needed.
+
+        Args:
+            products (list[Product]): The swaps and OIS to price.
+            market_env (MarketEnvironment): The market environment providing the curves.
+
+        Returns:
+            SwapBook: The packed book.
+        """
+        curves = [SwapBook.resolve_curves(product, market_env) for product in products]
+        key = (
+            Settings.evaluation_date,
+            tuple(id(product) for product in products),
+            tuple(id(curve) for pair in curves for curve in pair),
+        )
+        if key != self._book_key:
+            self._book = SwapBook(products, market_env)
+            self._book_key = key
+            # strong references: the ids in the key cannot be reused while cached
+            self._book_refs = (list(products), curves)
+        return self._book
+
+    def calculate_price(self, product: list[Product], market_env: MarketEnvironment):
+        """Prices a list of swaps and OIS.
+
+        Args:
+            product (list[Product]): The swaps and OIS to price.
+            market_env (MarketEnvironment): The market environment providing
+                access to market data (curves).
+
+        Returns:
+            tf.Tensor: The NPVs of the products, shape ``[n_products]``.
+        """
+        book = self.book(product, market_env)
+        if len(book) == 0:
+            return tf.zeros([0], dtype=tf.float64)
+        return tf.reduce_sum(book.leg_npvs(), axis=1)
+
+    def price(
+        self,
+        product: list[Product],
+        market_env: MarketEnvironment,
+        autodiff: bool = False,
+    ):
+        """Prices a list of swaps and OIS and stores leg and product prices on each product.
+
+        Args:
+            product (list[Product]): The swaps and OIS to price.
+            market_env (MarketEnvironment): The market environment providing
+                access to market data (curves).
+            autodiff (bool, optional): Whether to compute the Jacobians of the NPVs
+                with respect to the curve rates, available in :attr:`jacobians`.
+                Defaults to False.
+
+        Returns:
+            numpy.ndarray: The NPVs of the products.
+        """
+        book = self.book(product, market_env)
+        if len(book) == 0:
+            self._jacobians = {} if autodiff else None
+            return numpy.zeros(0)
+        if autodiff:
+            leg_npvs, jacobians = book.leg_npvs_and_jacobians()
+            self._jacobians = {name: j.numpy() for name, j in jacobians.items()}
+        else:
+            leg_npvs = book.leg_npvs()
+        leg_npvs = leg_npvs.numpy()
+        for p, (fixed_npv, floating_npv) in zip(product, leg_npvs):
+            p.fixed_leg.price = fixed_npv
+            p.floating_leg.price = floating_npv
+            p.price = fixed_npv + floating_npv
+        return leg_npvs.sum(axis=1)
@@ -12,6 +12,38 @@ from .fixedflow import FixedLegDiscounting  # , FixedCouponDiscounting
 from datetime import date
 
 
+def _index_curve(market_env: MarketEnvironment, index, expected_format: str):
+    """Looks up the curve projecting ``index`` in the market environment.
+
+    Args:
+        market_env (MarketEnvironment): The market environment.
+        index (Index): The index, named "CCY:TICKER" (e.g., "EUR:6M").
+        expected_format (str): The name format reported on errors.
+
+    Returns:
+        RateCurve: The curve for the index currency and ticker.
+
+    Raises:
+        ValueError: If the index name is malformed or the curve is not found.
+    """
+    index_name_parts = index.name.split(":")
+    if len(index_name_parts) != 2:
+        raise ValueError(
+            f"Invalid index name format: '{index.name}'. "
+            f"Expected format: '{expected_format}'"
+        )
+    index_ccy_str, index_ticker = index_name_parts
+
+    # Convert currency string to Currency enum
+    try:
+        index_ccy = Currency[index_ccy_str]
+    except KeyError:
+        raise ValueError(
+            f"Unknown currency '{index_ccy_str}' in index name '{index.name}'"
+        )
+    return market_env.get_ir_curve(index_ccy, ticker=index_ticker)
+
+
 class OisPricer(Pricer):
     def __init__(self):
         """Initialize the OIS pricer.
@@ -41,26 +73,10 @@ class OisPricer(Pricer):
             raise TypeError("Wrong product type")
 
         try:
-            # Overnight index name format: "CCY:ON" (e.g., "EUR:ON")
-            index_name_parts = product._index.name.split(":")
-            if len(index_name_parts) != 2:
-                raise ValueError(
-                    f"Invalid index name format: '{product._index.name}'. "
-                    f"Expected format: 'CCY:ON'"
-                )
-            index_ccy_str, index_ticker = index_name_parts
-
-            # Convert currency string to Currency enum
-            try:
-                index_ccy = Currency[index_ccy_str]
-            except KeyError:
-                raise ValueError(
-                    f"Unknown currency '{index_ccy_str}' in index name '{product._index.name}'"
-                )
-
             # Get single curve for OIS valuation and discounting
+            # Overnight index name format: "CCY:ON" (e.g., "EUR:ON")
             # Legacy ticker "ON" is mapped inside MarketEnvironment.get_ir_curve
-            self.disc_curve = market_env.get_ir_curve(index_ccy, ticker=index_ticker)
+            self.disc_curve = _index_curve(market_env, product._index, "CCY:ON")
 
             # Store curve identifiers on the product for transparency
             product.discount_curve = self.disc_curve.name
@@ -125,23 +141,7 @@ class SwapPricer(Pricer):
 
             # Forward (estimation) curve for the index
             # Index name format: "CCY:TENOR" (e.g., "EUR:6M")
-            index_name_parts = product._index.name.split(":")
-            if len(index_name_parts) != 2:
-                raise ValueError(
-                    f"Invalid index name format: '{product._index.name}'. "
-                    f"Expected format: 'CCY:TENOR'"
-                )
-            index_ccy_str, index_ticker = index_name_parts
-
-            # Convert currency string to Currency enum
-            try:
-                index_ccy = Currency[index_ccy_str]
-            except KeyError:
-                raise ValueError(
-                    f"Unknown currency '{index_ccy_str}' in index name '{product._index.name}'"
-                )
-
-            self.fwd_curve = market_env.get_ir_curve(index_ccy, ticker=index_ticker)
+            self.fwd_curve = _index_curve(market_env, product._index, "CCY:TENOR")
             product.estimation_curve = self.fwd_curve.name
 
         except ValueError as e:
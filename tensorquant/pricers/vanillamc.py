@@ -1,3 +1,5 @@
+from typing import Optional, Sequence
+
 import numpy as np
 import tensorflow as tf
 
@@ -6,6 +8,16 @@ from ..instruments.option import VanillaOption
 from ..markethandles.marketenvironment import MarketEnvironment
 from ..markethandles.utils import ExerciseType
 from ..models.stochasticprocess import StochasticProcess
+from ..numericalhandles.randomsource import PseudoRandomSource, RandomSource
+from ..numericalhandles.variancereduction import (
+    CONTROL_VARIATES,
+    MomentAccumulator,
+    antithetic_increments,
+    black_control,
+    mc_estimate,
+    path_chunks,
+    spot_drift,
+)
 from ..timehandles.daycounter import DayCounter, DayCounterConvention
 from ..timehandles.utils import Settings
 
@@ -22,6 +34,10 @@ class VanillaMCPricer(Pricer):
     rate curve; all other market data (spot, vol, dividends) must be baked into
     the model before constructing this pricer.
 
+    The simulation, the payoffs and the prices are all in the working dtype of
+    the model (``model.dtype``, see :class:`Precision`), so a float32 model
+    prices a float32 book without casting the paths.
+
     Args:
         model: A calibrated :class:`StochasticProcess` whose ``evolve`` method
             accepts ``(t_grid [n_steps], dw [n_paths, n_steps])`` and returns
@@ -31,6 +47,25 @@ class VanillaMCPricer(Pricer):
         seed: Seed for ``tf.random.normal`` (reproducibility).
         daycounter_convention: Convention used to convert dates to year
             fractions for the time grid.
+        random_source: Optional :class:`RandomSource` drawing the Gaussian
+            increments (e.g. :class:`SobolRandomSource`).  Defaults to
+            ``tf.random.normal`` seeded with *seed*.
+        antithetic: Simulate ``n_paths // 2`` antithetic pairs.
+        control_variates: Control variates regressed out of the payoff:
+            ``"spot"`` (terminal spot, whose mean is the model forward) and/or
+            ``"black"`` (the same option on a companion GBM driven by the same
+            increments, whose mean is the Black-Scholes price).  Both need a
+            model with a known forward, i.e. ``mu`` or ``r`` and ``q``.
+        control_volatility: Volatility of the companion GBM of the ``"black"``
+            control.  Defaults to the model ``sigma`` when it has one.
+        chunk_size: Stream the simulation in chunks of (about) this many
+            paths, so that peak memory does not grow with *n_paths*.  The
+            increments come from *random_source* (a :class:`PseudoRandomSource`
+            seeded with *seed* by default) and the payoff moments are reduced
+            in fixed blocks of paths, so the price is bit-for-bit the same
+            for any chunk size.  Not differentiable.
+
+    The standard error of the last price is available as :attr:`std_error`.
 
     Example::
 
@@ -52,13 +87,34 @@ class VanillaMCPricer(Pricer):
         n_steps: int = 252,
         seed: int = 42,
         daycounter_convention: DayCounterConvention = DayCounterConvention.Actual365,
+        random_source: Optional[RandomSource] = None,
+        antithetic: bool = False,
+        control_variates: Sequence[str] = (),
+        control_volatility: Optional[float] = None,
+        chunk_size: Optional[int] = None,
     ) -> None:
         super().__init__()
+        unknown = set(control_variates) - CONTROL_VARIATES
+        if unknown:
+            raise ValueError(f"Unknown control variates: {sorted(unknown)}")
         self._model = model
         self._n_paths = n_paths
         self._n_steps = n_steps
         self._seed = seed
         self._daycounter = DayCounter(daycounter_convention)
+        self._random_source = random_source
+        self._antithetic = antithetic
+        self._control_variates = tuple(control_variates)
+        self._control_volatility = control_volatility
+        self._chunk_size = chunk_size
+        self._std_error = None
+
+    @property
+    def std_error(self) -> tf.Tensor:
+        """Standard error of the last Monte Carlo price."""
+        if self._std_error is None:
+            raise ValueError("price the option first")
+        return self._std_error
 
     # ------------------------------------------------------------------
     # Pricer interface
@@ -77,9 +133,7 @@ class VanillaMCPricer(Pricer):
         4. Extracts terminal spots at the option maturity.
         5. Returns ``df × E[max(φ(S_T - K), 0)]``.
 
-        The dtype of the simulation matches ``model.initial_values().dtype``
-        so both float32 (e.g. :class:`LocalVolatilityModel`) and float64
-        (e.g. :class:`GeometricBrownianMotion`) models are supported.
+        The increments, paths and price are in the model dtype.
 
         Args:
             product: The vanilla option to price.  Must have
@@ -87,65 +141,202 @@ class VanillaMCPricer(Pricer):
             market_env: Provides the rate curve for discounting.
 
         Returns:
-            tf.Tensor (scalar, float32): The option NPV.
+            tf.Tensor (scalar, in the model dtype): The option NPV.
 
         Raises:
             ValueError: If *product* is not a :class:`VanillaOption` or has
                 non-European exercise.
         """
-        if not isinstance(product, VanillaOption):
-            raise ValueError("VanillaMCPricer only supports VanillaOption")
-        if product.exercise_type != ExerciseType.European:
-            raise ValueError("VanillaMCPricer only supports European exercise")
+        self._check(product)
 
         evaluation_date = Settings.evaluation_date
         disc_curve = market_env.get_ir_curve(product.ccy)
 
         T = self._daycounter.year_fraction(evaluation_date, product.end_date)
-        discount_factor = tf.cast(disc_curve.discount(product.end_date), tf.float32)
-
-        # ---- detect model dtype and adapt simulation inputs ----------------
-        model_dtype = tf.cast(self._model.initial_values(), tf.float32).dtype
-        # GBM uses float64, LV uses float32 — we cast dw to the model's dtype
-        sim_dtype = self._model.initial_values().dtype
+        dtype = self._model.dtype
+        discount_factor = tf.cast(disc_curve.discount(product.end_date), dtype)
 
         # ---- time grid: T_max covers the full model range ------------------
         # For LV the surface extends beyond T; for GBM any T_max >= T works.
         T_max = self._T_max(T)
-        t_grid = tf.cast(
-            tf.linspace(0.0, T_max, self._n_steps + 1)[1:],
-            sim_dtype,
-        )
+        t_grid = tf.constant(np.linspace(0.0, T_max, self._n_steps + 1)[1:], dtype)
 
-        # ---- simulation ----------------------------------------------------
-        tf.random.set_seed(self._seed)
-        dw = tf.cast(
-            tf.random.normal([self._n_paths, self._n_steps]),
-            sim_dtype,
-        )
-        paths = self._model.evolve(t_grid, dw)   # [n_paths, n_steps]
-
-        # terminal spot at option maturity
+        # ---- simulation and discounted payoff ------------------------------
         t_np       = t_grid.numpy()
         target_idx = int(np.argmin(np.abs(t_np - T)))
-        S_T        = tf.cast(paths[:, target_idx], tf.float32)
-
-        # ---- discounted payoff ---------------------------------------------
-        K   = tf.cast(product.strike, tf.float32)
-        phi = tf.constant(float(product.option_type.value), dtype=tf.float32)
-        payoff = tf.maximum(phi * (S_T - K), 0.0)
-        price  = discount_factor * tf.reduce_mean(payoff)
+        mean, std_error = self._estimate(
+            t_grid, [target_idx], [product.strike], [product.option_type.value]
+        )
+        price = discount_factor * mean[0]
+        self._std_error = discount_factor * std_error[0]
 
         # diagnostics stored on product
         product.discount_factor  = discount_factor
-        product.time_to_maturity = tf.constant(T, dtype=tf.float32)
+        product.time_to_maturity = tf.constant(T, dtype=dtype)
 
         return price
 
+    def calculate_book(
+        self, products: Sequence[VanillaOption], market_env: MarketEnvironment
+    ) -> tuple:
+        """Price a book of European options on the model underlying in one simulation.
+
+        The option maturities are added to the uniform time grid, the paths
+        are simulated once and the terminal spots of every option are
+        gathered from them, so all payoffs are evaluated as a single
+        ``[n_options, n_paths]`` reduction.  Antithetics, control variates and
+        streaming apply as in :meth:`calculate_price`.
+
+        Args:
+            products: The vanilla options to price.  Must have
+                ``exercise_type == ExerciseType.European``.
+            market_env: Provides the rate curves for discounting.
+
+        Returns:
+            tuple: The option NPVs and their standard errors, as
+            ``tf.Tensor`` of shape ``[n_options]`` in the model dtype.
+
+        Raises:
+            ValueError: If a product is not a :class:`VanillaOption` or has
+                non-European exercise.
+        """
+        for product in products:
+            self._check(product)
+
+        evaluation_date = Settings.evaluation_date
+        T = np.array(
+            [self._daycounter.year_fraction(evaluation_date, p.end_date) for p in products]
+        )
+        dtype = self._model.dtype
+        discount_factors = tf.cast(
+            tf.stack(
+                [market_env.get_ir_curve(p.ccy).discount(p.end_date) for p in products]
+            ),
+            dtype,
+        )
+
+        T_max = self._T_max(float(T.max()))
+        t_np = np.union1d(np.linspace(0.0, T_max, self._n_steps + 1)[1:], T[T > 0.0])
+        t_grid = tf.constant(t_np, dtype)
+        indices = np.searchsorted(t_np, T)
+
+        mean, std_error = self._estimate(
+            t_grid,
+            indices,
+            [p.strike for p in products],
+            [p.option_type.value for p in products],
+        )
+        self._std_error = discount_factors * std_error
+        for product, df, t in zip(products, discount_factors, T):
+            product.discount_factor  = df
+            product.time_to_maturity = tf.constant(t, dtype=dtype)
+        return discount_factors * mean, self._std_error
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _check(product: VanillaOption) -> None:
+        if not isinstance(product, VanillaOption):
+            raise ValueError("VanillaMCPricer only supports VanillaOption")
+        if product.exercise_type != ExerciseType.European:
+            raise ValueError("VanillaMCPricer only supports European exercise")
+
+    def _estimate(self, t_grid: tf.Tensor, indices, strikes, phis) -> tuple:
+        """Simulate on *t_grid* and estimate the undiscounted option prices.
+
+        Args:
+            t_grid: Simulation times ``[n_steps]`` in the model dtype.
+            indices: Grid index of the maturity of each option ``[n_options]``.
+            strikes: Strikes ``[n_options]``.
+            phis: ``+1`` for calls and ``-1`` for puts ``[n_options]``.
+
+        Returns:
+            Prices and standard errors ``[n_options]`` in the model dtype.
+        """
+        indices = np.asarray(indices)
+        if self._chunk_size is not None:
+            mean, std_error = self._stream(t_grid, indices, strikes, phis)
+            return tf.constant(mean, t_grid.dtype), tf.constant(std_error, t_grid.dtype)
+
+        dw = self._draw(t_grid, t_grid.dtype)
+        paths = self._model.evolve(t_grid, dw)   # [n_paths, n_steps]
+        S_T = tf.transpose(tf.gather(paths, indices, axis=1))
+        payoff = self._payoff(S_T, strikes, phis)
+        if not (self._antithetic or self._control_variates):
+            return tf.reduce_mean(payoff, axis=-1), mc_estimate(payoff)[1]
+        controls, control_means = self._controls(
+            S_T, dw, t_grid, indices, strikes, phis
+        )
+        return mc_estimate(payoff, controls, control_means, self._antithetic)
+
+    @staticmethod
+    def _payoff(S_T: tf.Tensor, strikes, phis) -> tf.Tensor:
+        """Undiscounted payoffs ``[n_options, n_paths]`` from the terminal spots."""
+        K   = tf.cast(tf.stack(list(strikes)), S_T.dtype)[:, None]
+        phi = tf.constant(phis, dtype=S_T.dtype)[:, None]
+        return tf.maximum(phi * (S_T - K), 0.0)
+
+    def _stream(self, t_grid: tf.Tensor, indices, strikes, phis) -> tuple:
+        """Simulate chunk by chunk, reducing the payoff moments as they come.
+
+        Returns:
+            The undiscounted prices and their standard errors ``[n_options]``.
+        """
+        source = self._random_source or PseudoRandomSource(self._seed)
+        accumulator = MomentAccumulator(self._antithetic)
+        control_means = None
+        for offset, n_draws in path_chunks(
+            self._n_paths, self._chunk_size, self._antithetic, accumulator.block_size
+        ):
+            dw = source.increments(n_draws, t_grid.numpy(), t_grid.dtype, offset)
+            if self._antithetic:
+                dw = antithetic_increments(dw)
+            paths = self._model.evolve(t_grid, dw)
+            S_T = tf.transpose(tf.gather(paths, indices, axis=1))
+            controls, control_means = self._controls(
+                S_T, dw, t_grid, indices, strikes, phis
+            )
+            accumulator.add(self._payoff(S_T, strikes, phis), controls)
+        return accumulator.estimate(control_means)
+
+    def _draw(self, t_grid: tf.Tensor, dtype) -> tf.Tensor:
+        """Draw the ``[n_paths, n_steps]`` Gaussian increments, in antithetic pairs if enabled."""
+        n_draws = self._n_paths // 2 if self._antithetic else self._n_paths
+        if self._random_source is None:
+            tf.random.set_seed(self._seed)
+            dw = tf.random.normal([n_draws, t_grid.shape[0]], dtype=dtype)
+        else:
+            dw = self._random_source.increments(n_draws, t_grid.numpy(), dtype)
+        if self._antithetic:
+            dw = antithetic_increments(dw)
+        return dw
+
+    def _controls(self, S_T, dw, t_grid, indices, strikes, phis):
+        """Build the path-wise control variates and their known means.
+
+        Returns:
+            Controls ``[n_options, n_paths, n_controls]`` and means
+            ``[n_options, n_controls]`` (float64), or ``(None, None)`` when no
+            control variate is requested.
+        """
+        if not self._control_variates:
+            return None, None
+        spot, drift = spot_drift(self._model)
+        t = t_grid.numpy().astype(np.float64)[indices]
+        controls, means = [], []
+        if "spot" in self._control_variates:
+            controls.append(tf.cast(S_T, tf.float64))
+            means.append(spot * np.exp(drift * t))
+        if "black" in self._control_variates:
+            control, mean = black_control(
+                self._model, self._control_volatility, dw, t_grid, indices, strikes, phis
+            )
+            controls.append(control)
+            means.append(mean)
+        return tf.stack(controls, axis=-1), tf.constant(np.stack(means, axis=-1))
+
     def _T_max(self, T: float) -> float:
         """Return the upper bound for the simulation time grid.
 
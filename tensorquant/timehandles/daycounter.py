@@ -1,6 +1,8 @@
-from .utils import DayCounterConvention
+from .utils import DayCounterConvention, date_ordinals, ordinals_to_datetime64
 from datetime import date
 
+import numpy
+
 
 class DayCounter:
 
@@ -72,5 +74,78 @@ class DayCounter:
                 360.0 * (d2.year - d1.year) + 30.0 * (d2.month - d1.month) + dd2 - dd1
             )
 
+    def day_count_array(self, d1, d2) -> numpy.ndarray:
+        """Vectorized :meth:`day_count` over arrays of dates.
+
+        Args:
+            d1: Start dates, as a sequence of dates, a ``datetime64`` array or day ordinals.
+            d2: End dates, in any of the same forms; broadcast against ``d1``.
+
+        Returns:
+            numpy.ndarray: The day counts as float64.
+        """
+        o1, o2 = numpy.broadcast_arrays(date_ordinals(d1), date_ordinals(d2))
+        if self.day_counter_convention == DayCounterConvention.Actual360:
+            days = o2 - o1 + self.include_last_day
+        elif self.day_counter_convention in (
+            DayCounterConvention.Actual365,
+            DayCounterConvention.ActualActual,
+        ):
+            days = o2 - o1
+        else:
+            y1, m1, dd1 = _ymd(o1)
+            y2, m2, dd2 = _ymd(o2)
+            dd1 = numpy.where(dd1 == 31, 30, dd1)
+            if self.day_counter_convention == DayCounterConvention.Thirty360:
+                dd2 = numpy.where((dd2 == 31) & (dd1 == 30), 30, dd2)
+            else:
+                dd2 = numpy.where(dd2 == 31, 30, dd2)
+            days = 360 * (y2 - y1) + 30 * (m2 - m1) + dd2 - dd1
+        return numpy.where(o1 == o2, 0.0, days).astype(numpy.float64)
+
+    def year_fraction_array(self, d1, d2) -> numpy.ndarray:
+        """Vectorized :meth:`year_fraction` over arrays of dates.
+
+        Args:
+            d1: Start dates, as a sequence of dates, a ``datetime64`` array or day ordinals.
+            d2: End dates, in any of the same forms; broadcast against ``d1``.
+
+        Returns:
+            numpy.ndarray: The year fractions as float64.
+        """
+        o1, o2 = numpy.broadcast_arrays(date_ordinals(d1), date_ordinals(d2))
+        if self.day_counter_convention == DayCounterConvention.ActualActual:
+            y1 = _ymd(o1)[0]
+            y2 = _ymd(o2)[0]
+            sum = y2 - y1 - 1.0
+            sum += (_new_year_ordinal(y1 + 1) - o1) / _year_days(y1)
+            sum += (o2 - _new_year_ordinal(y2)) / _year_days(y2)
+            return numpy.where(o1 == o2, 0.0, sum)
+        if self.day_counter_convention == DayCounterConvention.Actual365:
+            return self.day_count_array(o1, o2) / 365.0
+        return self.day_count_array(o1, o2) / 360.0
+
     def __str__(self) -> str:
         return self.day_counter_convention.name
+
+
+def _ymd(ordinals: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Year, month and day of month of day ordinals."""
+    days = ordinals_to_datetime64(ordinals)
+    months = days.astype("datetime64[M]")
+    years = months.astype("datetime64[Y]")
+    return (
+        years.astype(numpy.int64) + 1970,
+        (months - years).astype(numpy.int64) + 1,
+        (days - months).astype(numpy.int64) + 1,
+    )
+
+
+def _new_year_ordinal(years: numpy.ndarray) -> numpy.ndarray:
+    """Day ordinals of January 1st of the given years."""
+    return date_ordinals((numpy.asarray(years) - 1970).astype("datetime64[Y]"))
+
+
+def _year_days(years: numpy.ndarray) -> numpy.ndarray:
+    """Number of days in the given years, with the same rule as ``DayCounter.year_days``."""
+    return numpy.where(numpy.asarray(years) % 4 == 0, 366.0, 365.0)
@@ -9,7 +9,7 @@ class DateGrid:
         self._dates = dates
         self._daycounter_convention = daycounter_convention
         self._daycounter = DayCounter(daycounter_convention)
-        self._times = [self._daycounter.year_fraction(dates[0], d) for d in dates]
+        self._times = self._daycounter.year_fraction_array(dates[0], dates).tolist()
 
     @property
     def dates(self):
@@ -1,18 +1,114 @@
+from collections import OrderedDict
 from datetime import date
+from typing import Hashable, Optional, Tuple
 
 from .tqcalendar import Calendar
 from .targetcalendar import TARGET
 from .utils import TimeUnit, BusinessDayConvention
 
 
+class ScheduleCache:
+    """Bounded least-recently-used cache of generated schedules.
+
+    Args:
+        maxsize (int): maximum number of schedules kept; ``0`` disables caching.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[date, ...]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        if value < 0:
+            raise ValueError("maxsize must be non-negative")
+        self._maxsize = value
+        self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Tuple[date, ...]]:
+        """Returns the cached schedule for ``key`` or ``None``, updating the stats."""
+        schedule = self._entries.get(key)
+        if schedule is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return schedule
+
+    def put(self, key: Hashable, schedule: Tuple[date, ...]) -> None:
+        if self._maxsize == 0:
+            return
+        self._entries[key] = schedule
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def clear(self) -> None:
+        """Drops every cached schedule and resets the hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self._maxsize,
+        }
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
 class ScheduleGenerator:
+    """Generates rolled date schedules.
+
+    Schedules are memoized in the class-level :attr:`cache`, shared by every
+    generator, keyed on ``(start, end, tenor, time_unit, calendar,
+    business_day_convention)``. Cached schedules are returned as tuples so
+    that callers cannot corrupt them.
+    """
+
+    cache = ScheduleCache()
+
     def __init__(
         self, calendar: Calendar, business_day_convention: BusinessDayConvention
     ):
         self.calendar = calendar
         self.business_day_convention = business_day_convention
 
-    def generate(self, start: date, end: date, tenor: int, time_unit: TimeUnit):
+    def generate(
+        self, start: date, end: date, tenor: int, time_unit: TimeUnit
+    ) -> Tuple[date, ...]:
+        key = (
+            start,
+            end,
+            tenor,
+            time_unit,
+            self.calendar,
+            self.business_day_convention,
+        )
+        schedule = self.cache.get(key)
+        if schedule is None:
+            schedule = self._generate(start, end, tenor, time_unit)
+            self.cache.put(key, schedule)
+        return schedule
+
+    def _generate(
+        self, start: date, end: date, tenor: int, time_unit: TimeUnit
+    ) -> Tuple[date, ...]:
         schedule = []
         current_date = start
         schedule.append(current_date)
@@ -25,4 +121,4 @@ class ScheduleGenerator:
             else:
                 schedule.append(end)
                 break
-        return schedule
+        return tuple(schedule)
@@ -11,9 +11,16 @@ class TARGET(Calendar):
     def __init__(self) -> None:
         pass
 
-    def is_business_day(self, d: date) -> bool:
+    def __eq__(self, other: object) -> bool:
+        # TARGET holds no state, so every instance describes the same calendar
+        return type(other) is type(self)
+
+    def __hash__(self) -> int:
+        return hash(type(self))
+
+    def _is_business_day_rule(self, d: date) -> bool:
         """
-        Determine if a given date is a business day.
+        Determine if a given date is a business day from the TARGET holiday rules.
 
         Parameters:
         -------
@@ -25,9 +32,10 @@ class TARGET(Calendar):
         bool:
             True if the given date is a business day, False otherwise.
         """
+        easter_sunday = easter(d.year)
         ny = d.day == 1 and d.month == 1
-        em = d == easter(d.year) + timedelta(1)
-        gf = d == easter(d.year) - timedelta(2)
+        em = d == easter_sunday + timedelta(1)
+        gf = d == easter_sunday - timedelta(2)
         ld = d.day == 1 and d.month == 5
         c = d.day == 25 and d.month == 12
         cg = d.day == 26 and d.month == 12
@@ -1,9 +1,174 @@
 from abc import ABC, abstractmethod
 from datetime import date, timedelta
+from typing import Callable
 from dateutil.relativedelta import relativedelta
 from calendar import monthrange
 
-from .utils import TimeUnit, BusinessDayConvention
+import numpy
+
+from .utils import TimeUnit, BusinessDayConvention, date_ordinals, ordinals_to_datetime64
+
+
+class BusinessDayTable:
+    """
+    Precomputed business-day bitmap and cumulative business-day counts of a calendar.
+
+    The table covers a contiguous range of whole years, indexed by day ordinal
+    (``date.toordinal``). ``flags[i]`` tells whether day ``start + i`` is a business day
+    and ``counts[i]`` is the number of business days in ``[start, start + i]``, so that
+    business-day queries, adjustments and shifts become array lookups and
+    ``searchsorted`` calls. The range is extended one year at a time on demand.
+    """
+
+    def __init__(self, is_business_day: Callable[[date], bool]) -> None:
+        """
+        Initializes an empty table for the given business-day rule.
+
+        Parameters:
+        -------
+            is_business_day (Callable[[date], bool]): The rule used to fill the bitmap.
+        """
+        self._rule = is_business_day
+        self._first_year = None
+        self._last_year = None
+        self._start = 0
+        self._flags = numpy.zeros(0, dtype=bool)
+        self._counts = numpy.zeros(0, dtype=numpy.int64)
+
+    def _year_flags(self, year: int) -> numpy.ndarray:
+        first = date(year, 1, 1)
+        n_days = (date(year + 1, 1, 1) - first).days
+        return numpy.array(
+            [self._rule(first + timedelta(days=i)) for i in range(n_days)], dtype=bool
+        )
+
+    def _ensure(self, first_ordinal: int, last_ordinal: int) -> None:
+        """Extends the table so that it covers both ordinals with one year of margin."""
+        first_year = date.fromordinal(int(first_ordinal)).year - 1
+        last_year = date.fromordinal(int(last_ordinal)).year + 1
+        if self._first_year is None:
+            self._first_year = self._last_year = first_year
+            self._flags = self._year_flags(first_year)
+        if first_year >= self._first_year and last_year <= self._last_year:
+            return
+        before = [self._year_flags(y) for y in range(first_year, self._first_year)]
+        after = [self._year_flags(y) for y in range(self._last_year + 1, last_year + 1)]
+        self._flags = numpy.concatenate(before + [self._flags] + after)
+        self._first_year = min(first_year, self._first_year)
+        self._last_year = max(last_year, self._last_year)
+        self._start = date(self._first_year, 1, 1).toordinal()
+        self._counts = numpy.cumsum(self._flags, dtype=numpy.int64)
+
+    def _index(self, ordinals: numpy.ndarray) -> numpy.ndarray:
+        ordinals = numpy.asarray(ordinals, dtype=numpy.int64)
+        self._ensure(ordinals.min(), ordinals.max())
+        return ordinals - self._start
+
+    def _find(self, ordinals: numpy.ndarray, targets: Callable) -> numpy.ndarray:
+        """
+        Returns the ordinals of the business days whose cumulative count equals
+        ``targets(index)``, extending the table until every target falls inside it.
+        """
+        while True:
+            i = self._index(ordinals)
+            t = targets(i)
+            below, above = t.min() < 1, t.max() > self._counts[-1]
+            if not (below or above):
+                return numpy.searchsorted(self._counts, t, side="left") + self._start
+            end = self._start + len(self._flags)
+            self._ensure(self._start - 1 if below else self._start, end if above else end - 1)
+
+    def is_business_day(self, ordinals) -> numpy.ndarray:
+        """
+        Checks whether the given day ordinals are business days.
+
+        Parameters:
+        -------
+            ordinals: A day ordinal or an array of day ordinals.
+
+        Returns:
+        -------
+            numpy.ndarray: Boolean flags with the shape of ``ordinals``.
+        """
+        if isinstance(ordinals, int) and 0 <= ordinals - self._start < len(self._flags):
+            # scalar fast path for single-date queries inside the table
+            return self._flags[ordinals - self._start]
+        i = self._index(ordinals)
+        return self._flags[i]
+
+    def following(self, ordinals) -> numpy.ndarray:
+        """
+        Returns the first business day on or after each ordinal.
+
+        Parameters:
+        -------
+            ordinals: A day ordinal or an array of day ordinals.
+
+        Returns:
+        -------
+            numpy.ndarray: The adjusted ordinals.
+        """
+        return self._find(ordinals, lambda i: self._counts[i] - self._flags[i] + 1)
+
+    def preceding(self, ordinals) -> numpy.ndarray:
+        """
+        Returns the last business day on or before each ordinal.
+
+        Parameters:
+        -------
+            ordinals: A day ordinal or an array of day ordinals.
+
+        Returns:
+        -------
+            numpy.ndarray: The adjusted ordinals.
+        """
+        return self._find(ordinals, lambda i: self._counts[i])
+
+    def shift(self, ordinals, n) -> numpy.ndarray:
+        """
+        Moves each ordinal by ``n`` business days (backwards if ``n`` is negative).
+
+        As in ``Calendar.advance``, the starting day need not be a business day and a
+        shift of zero returns the starting day unchanged.
+
+        Parameters:
+        -------
+            ordinals: A day ordinal or an array of day ordinals.
+            n: The number of business days, as an integer or an array of integers.
+
+        Returns:
+        -------
+            numpy.ndarray: The shifted ordinals.
+        """
+        ordinals = numpy.asarray(ordinals, dtype=numpy.int64)
+        n = numpy.broadcast_to(numpy.asarray(n, dtype=numpy.int64), ordinals.shape)
+        shifted = self._find(
+            ordinals,
+            lambda i: numpy.where(
+                n > 0, self._counts[i] + n, self._counts[i] - self._flags[i] + n + 1
+            ),
+        )
+        return numpy.where(n == 0, ordinals, shifted)
+
+    def count(self, first_ordinals, last_ordinals) -> numpy.ndarray:
+        """
+        Counts the business days in ``[first, last)`` (negative if ``last < first``).
+
+        Parameters:
+        -------
+            first_ordinals: The first day ordinal(s), included in the count.
+            last_ordinals: The last day ordinal(s), excluded from the count.
+
+        Returns:
+        -------
+            numpy.ndarray: The number of business days between the ordinals.
+        """
+        first = numpy.asarray(first_ordinals, dtype=numpy.int64)
+        last = numpy.asarray(last_ordinals, dtype=numpy.int64)
+        self._ensure(min(first.min(), last.min()), max(first.max(), last.max()))
+        i1 = first - self._start
+        i2 = last - self._start
+        return (self._counts[i2] - self._flags[i2]) - (self._counts[i1] - self._flags[i1])
 
 
 class Calendar(ABC):
@@ -43,17 +208,9 @@ class Calendar(ABC):
         d1 = start_date
 
         if time_unit == TimeUnit.Days:
-            while period > 0:
-                d1 += timedelta(days=1)
-                while self.is_holiday(d1):
-                    d1 += timedelta(days=1)
-                period -= 1
-
-            while period < 0:
-                d1 -= timedelta(days=1)
-                while self.is_holiday(d1):
-                    d1 -= timedelta(days=1)
-                period += 1
+            return date.fromordinal(
+                int(self.business_day_table.shift(d1.toordinal(), period))
+            )
 
         elif time_unit == TimeUnit.Weeks:
             d1 += relativedelta(weeks=period)
@@ -100,8 +257,7 @@ class Calendar(ABC):
             BusinessDayConvention.ModifiedFollowing,
             BusinessDayConvention.HalfMonthModifiedFollowing,
         ]:
-            while self.is_holiday(d1):
-                d1 += timedelta(days=1)
+            d1 = date.fromordinal(int(self.business_day_table.following(d.toordinal())))
 
             if c in [
                 BusinessDayConvention.ModifiedFollowing,
@@ -121,8 +277,7 @@ class Calendar(ABC):
             BusinessDayConvention.Preceding,
             BusinessDayConvention.ModifiedPreceding,
         ]:
-            while self.is_holiday(d1):
-                d1 -= timedelta(days=1)
+            d1 = date.fromordinal(int(self.business_day_table.preceding(d.toordinal())))
 
             if c == BusinessDayConvention.ModifiedPreceding and d1.month != d.month:
                 return self.adjust(d, BusinessDayConvention.Following)
@@ -203,13 +358,157 @@ class Calendar(ABC):
         -------
             bool: True if the given date is a holiday, False otherwise.
         """
-        return not self.is_business_day(d)
+        return not self.business_day_table.is_business_day(d.toordinal())
 
-    @abstractmethod
-    def is_business_day(self, d: date):
+    @property
+    def business_day_table(self) -> BusinessDayTable:
+        """
+        Get the precomputed business-day table of the calendar, built lazily.
+
+        Returns:
+        -------
+            BusinessDayTable: The table backing holiday checks, adjustments and shifts.
+        """
+        # concrete calendars do not call Calendar.__init__, hence the lazy attribute
+        table = getattr(self, "_business_day_table", None)
+        if table is None:
+            table = self._business_day_table = BusinessDayTable(self._is_business_day_rule)
+        return table
+
+    def business_days_between(self, d1, d2):
+        """
+        Count the business days in ``[d1, d2)``, negative if ``d2`` precedes ``d1``.
+
+        Parameters:
+        -------
+            d1: The first date (included), or an array of dates.
+            d2: The last date (excluded), or an array of dates.
+
+        Returns:
+        -------
+            int or numpy.ndarray: The number of business days between the dates.
+        """
+        counts = self.business_day_table.count(date_ordinals(d1), date_ordinals(d2))
+        return int(counts) if counts.ndim == 0 else counts
+
+    def is_business_day_array(self, dates) -> numpy.ndarray:
+        """
+        Vectorized business-day check.
+
+        Parameters:
+        -------
+            dates: A sequence of dates or a ``datetime64`` array.
+
+        Returns:
+        -------
+            numpy.ndarray: Boolean flags, True for business days.
+        """
+        return self.business_day_table.is_business_day(date_ordinals(dates))
+
+    def adjust_array(self, dates, c: BusinessDayConvention) -> numpy.ndarray:
+        """
+        Vectorized version of :meth:`adjust`.
+
+        Parameters:
+        -------
+            dates: A sequence of dates or a ``datetime64`` array.
+            c (BusinessDayConvention): The business day convention.
+
+        Returns:
+        -------
+            numpy.ndarray: The adjusted dates as ``datetime64[D]``.
+        """
+        ordinals = date_ordinals(dates)
+        table = self.business_day_table
+        if c == BusinessDayConvention.Unadjusted:
+            adjusted = ordinals
+        elif c == BusinessDayConvention.Following:
+            adjusted = table.following(ordinals)
+        elif c == BusinessDayConvention.Preceding:
+            adjusted = table.preceding(ordinals)
+        elif c in [
+            BusinessDayConvention.ModifiedFollowing,
+            BusinessDayConvention.HalfMonthModifiedFollowing,
+        ]:
+            following = table.following(ordinals)
+            roll_back = _month(following) != _month(ordinals)
+            if c == BusinessDayConvention.HalfMonthModifiedFollowing:
+                roll_back |= (_day(ordinals) <= 15) & (_day(following) > 15)
+            adjusted = numpy.where(roll_back, table.preceding(ordinals), following)
+        elif c == BusinessDayConvention.ModifiedPreceding:
+            preceding = table.preceding(ordinals)
+            adjusted = numpy.where(
+                _month(preceding) != _month(ordinals),
+                table.following(ordinals),
+                preceding,
+            )
+        else:
+            adjusted = date_ordinals(
+                [self.adjust(date.fromordinal(int(o)), c) for o in ordinals.ravel()]
+            ).reshape(ordinals.shape)
+        return ordinals_to_datetime64(adjusted)
+
+    def advance_array(
+        self,
+        dates,
+        period: int,
+        time_unit: TimeUnit,
+        convention: BusinessDayConvention,
+        end_of_month: bool = False,
+    ) -> numpy.ndarray:
+        """
+        Vectorized version of :meth:`advance`.
+
+        Shifts by business days are evaluated in one table lookup; other time units
+        fall back to :meth:`advance` date by date.
+
+        Parameters:
+        -------
+            dates: A sequence of dates or a ``datetime64`` array.
+            period (int): The number of time units to advance the dates by.
+            time_unit (TimeUnit): The unit of time to use for advancing the dates.
+            convention (BusinessDayConvention): The business day convention.
+            end_of_month (bool, optional): Whether to apply the end-of-month rule. Defaults to False.
+
+        Returns:
+        -------
+            numpy.ndarray: The advanced dates as ``datetime64[D]``.
+        """
+        if period == 0:
+            return self.adjust_array(dates, convention)
+        ordinals = date_ordinals(dates)
+        if time_unit == TimeUnit.Days:
+            return ordinals_to_datetime64(self.business_day_table.shift(ordinals, period))
+        return ordinals_to_datetime64(
+            date_ordinals(
+                [
+                    self.advance(
+                        date.fromordinal(int(o)), period, time_unit, convention, end_of_month
+                    )
+                    for o in ordinals.ravel()
+                ]
+            ).reshape(ordinals.shape)
+        )
+
+    def is_business_day(self, d: date) -> bool:
         """
         Check if a given date is a business day.
 
+        Parameters:
+        -------
+            d (date): The date to check.
+
+        Returns:
+        -------
+            bool: True if the given date is a business day, False otherwise.
+        """
+        return bool(self.business_day_table.is_business_day(d.toordinal()))
+
+    @abstractmethod
+    def _is_business_day_rule(self, d: date) -> bool:
+        """
+        Evaluate the business-day rule of the calendar, used to fill its table.
+
         Parameters:
         -------
             d (date): The date to check.
@@ -219,3 +518,14 @@ class Calendar(ABC):
             bool: True if the given date is a business day, False otherwise.
         """
         pass
+
+
+def _month(ordinals: numpy.ndarray) -> numpy.ndarray:
+    """Months since the epoch of day ordinals, used to detect month changes."""
+    return ordinals_to_datetime64(ordinals).astype("datetime64[M]").astype(numpy.int64)
+
+
+def _day(ordinals: numpy.ndarray) -> numpy.ndarray:
+    """Day of the month of day ordinals."""
+    days = ordinals_to_datetime64(ordinals)
+    return (days - days.astype("datetime64[M]")).astype(numpy.int64) + 1
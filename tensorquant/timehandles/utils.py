@@ -2,6 +2,8 @@ from enum import Enum
 from datetime import date
 import re
 
+import numpy
+
 
 class Settings:
     """
@@ -45,6 +47,46 @@ def decode_term(term: str):
     return period, time_unit
 
 
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def date_ordinals(dates) -> numpy.ndarray:
+    """
+    Converts dates into proleptic Gregorian ordinals (``date.toordinal``).
+
+    Args:
+        dates: A date, a sequence of dates, a ``datetime64`` array, or an array of ordinals.
+
+    Returns:
+        numpy.ndarray: The ordinals as an int64 array (0-d for a single date).
+    """
+    if isinstance(dates, date):
+        return numpy.asarray(dates.toordinal(), dtype=numpy.int64)
+    array = numpy.asarray(dates)
+    if numpy.issubdtype(array.dtype, numpy.datetime64):
+        return array.astype("datetime64[D]").astype(numpy.int64) + _EPOCH_ORDINAL
+    if array.dtype == object:
+        return numpy.array([d.toordinal() for d in array.ravel()], dtype=numpy.int64).reshape(
+            array.shape
+        )
+    return array.astype(numpy.int64)
+
+
+def ordinals_to_datetime64(ordinals) -> numpy.ndarray:
+    """
+    Converts proleptic Gregorian ordinals into a ``datetime64[D]`` array.
+
+    Args:
+        ordinals: An ordinal or an array of ordinals.
+
+    Returns:
+        numpy.ndarray: The corresponding ``datetime64[D]`` values.
+    """
+    return (numpy.asarray(ordinals, dtype=numpy.int64) - _EPOCH_ORDINAL).astype(
+        "datetime64[D]"
+    )
+
+
 class DayCounterConvention(Enum):
     Actual360 = "Actual360"
     Actual365 = "Actual365"
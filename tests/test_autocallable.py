@@ -0,0 +1,99 @@
+import unittest
+from datetime import date
+
+import tensorquant as tq
+
+
+class TestAutocallableMCPricer(unittest.TestCase):
+    def setUp(self):
+        self.evaluation_date = date(2026, 1, 5)
+        tq.Settings.evaluation_date = self.evaluation_date
+        curve = tq.FlatCurve(self.evaluation_date, 0.02, tq.DayCounterConvention.Actual360)
+        self.market_env = tq.MarketEnvironment(market={"IR:EUR:ESTR:SPOT": curve})
+        schedule = tq.ScheduleGenerator(
+            tq.TARGET(), tq.BusinessDayConvention.ModifiedFollowing
+        ).generate(self.evaluation_date, date(2029, 1, 5), 6, tq.TimeUnit.Months)[1:]
+        self.option = tq.AutocallableOption(
+            ccy=tq.Currency.EUR,
+            notional=1.0,
+            start_date=self.evaluation_date,
+            end_date=schedule[-1],
+            strike=100.0,
+            coupon_fixing_dates=schedule,
+            coupon_payment_dates=schedule,
+            coupon_rates=[3.0],
+            coupon_barriers=[80.0],
+            memory=True,
+            autocall_fixing_dates=schedule[1:],
+            autocall_payment_dates=schedule[1:],
+            autocall_barrier=[100.0],
+            payoff_barrier=70.0,
+        )
+
+    def test_exact_models_simulate_fixing_dates_only(self):
+        gbm = tq.GeometricBrownianMotion(mu=0.02, sigma=0.25, x0=100.0)
+        exact = tq.AutocallableMCPricer(gbm, n_paths=20_000)
+        date_grid, _ = exact._build_date_grid(self.option, self.evaluation_date)
+        self.assertEqual(date_grid, self.option.coupon_fixing_dates)
+
+        class DenseGBM(tq.GeometricBrownianMotion):
+            supports_exact_steps = False
+
+        dense = tq.AutocallableMCPricer(DenseGBM(mu=0.02, sigma=0.25, x0=100.0), n_paths=20_000)
+        dense_grid, _ = dense._build_date_grid(self.option, self.evaluation_date)
+        self.assertGreater(len(dense_grid), 5 * len(date_grid))
+        # both grids sample the same law on the fixing dates
+        exact_price = float(exact.calculate_price(self.option, self.market_env))
+        dense_price = float(dense.calculate_price(self.option, self.market_env))
+        self.assertLess(abs(exact_price - dense_price), 4.0 * exact.std_error)
+
+    def test_payoff_kernel_traced_once_across_products(self):
+        from tensorquant.pricers.montecarlo import _autocallable_payoff
+
+        model = tq.GeometricBrownianMotion(mu=0.02, sigma=0.25, x0=100.0)
+        pricer = tq.AutocallableMCPricer(model, n_paths=1_000, barrier_smoothing=0.01)
+        pricer.calculate_price(self.option, self.market_env)
+        traces = _autocallable_payoff.trace_count
+        # different strike, smoothing width, memory flag and number of fixings
+        schedule = self.option.coupon_fixing_dates[:4]
+        other = tq.AutocallableOption(
+            ccy=tq.Currency.EUR,
+            notional=1.0,
+            start_date=self.evaluation_date,
+            end_date=schedule[-1],
+            strike=95.0,
+            coupon_fixing_dates=schedule,
+            coupon_payment_dates=schedule,
+            coupon_rates=[2.5],
+            coupon_barriers=[75.0],
+            memory=False,
+            autocall_fixing_dates=schedule[2:],
+            autocall_payment_dates=schedule[2:],
+            autocall_barrier=[105.0],
+            payoff_barrier=60.0,
+        )
+        pricer.calculate_price(other, self.market_env)
+        self.assertEqual(_autocallable_payoff.trace_count, traces)
+
+    def test_aad_sensitivities_match_finite_differences(self):
+        model = tq.GeometricBrownianMotion(mu=0.02, sigma=0.25, x0=100.0)
+        pricer = tq.AutocallableMCPricer(
+            model,
+            n_paths=20_000,
+            random_source=tq.PseudoRandomSource(seed=1),
+            barrier_smoothing=0.02,
+        )
+        pricer.price(self.option, self.market_env, autodiff=True)
+        delta, vega = pricer.tape.gradient(self.option.price, [model._x0, model._sigma])
+        for variable, aad, bump in ((model._x0, delta, 0.5), (model._sigma, vega, 0.005)):
+            value = float(variable)
+            variable.assign(value + bump)
+            up = float(pricer.calculate_price(self.option, self.market_env))
+            variable.assign(value - bump)
+            down = float(pricer.calculate_price(self.option, self.market_env))
+            variable.assign(value)
+            self.assertAlmostEqual(float(aad), (up - down) / (2.0 * bump), delta=0.02 * abs(float(aad)))
+
+
+if __name__ == "__main__":
+    unittest.main()
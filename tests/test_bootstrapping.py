@@ -0,0 +1,88 @@
+import unittest
+from datetime import date
+
+import numpy as np
+
+from tensorquant.markethandles.bootstrapping import CurveBootstrap
+from tensorquant.markethandles.marketenvironment import MarketEnvironment
+from tensorquant.markethandles.utils import Currency
+from tensorquant.timehandles.daycounter import DayCounterConvention
+from tensorquant.timehandles.utils import Settings
+
+
+class TestCurveBootstrap(unittest.TestCase):
+    def setUp(self):
+        self.evaluation_date = date(2026, 1, 5)
+        Settings.evaluation_date = self.evaluation_date
+        self.generators = ["Dp", "Os", "Os", "Os"]
+        self.maturities = ["1W", "1Y", "2Y", "5Y"]
+        self.quotes = [0.020, 0.021, 0.022, 0.024]
+
+    def _strip(self, **kwargs):
+        bootstrap = CurveBootstrap(
+            self.evaluation_date,
+            DayCounterConvention.ActualActual,
+            MarketEnvironment(market={}),
+        )
+        return bootstrap.strip(
+            self.generators,
+            self.maturities,
+            self.quotes,
+            "IR:EUR:ESTR:SPOT",
+            Currency.EUR,
+            **kwargs,
+        )
+
+    def test_sequential_matches_global(self):
+        global_curve = self._strip()
+        sequential_curve = self._strip(method="sequential")
+        np.testing.assert_allclose(
+            sequential_curve.rates, global_curve.rates, rtol=0, atol=1e-10
+        )
+        np.testing.assert_allclose(
+            sequential_curve.jacobian.values,
+            global_curve.jacobian.values,
+            rtol=0,
+            atol=1e-8,
+        )
+
+    def test_full_jacobian_matches_per_instrument_tapes(self):
+        global_curve = self._strip()
+        full_curve = self._strip(full_jacobian=True)
+        np.testing.assert_allclose(
+            full_curve.rates, global_curve.rates, rtol=0, atol=1e-10
+        )
+        np.testing.assert_allclose(
+            full_curve.jacobian.values,
+            global_curve.jacobian.values,
+            rtol=0,
+            atol=1e-10,
+        )
+
+    def test_broyden_warm_start_matches_cold_strip(self):
+        previous_curve = self._strip()
+        self.quotes = [q + 1e-4 for q in self.quotes]
+        cold_curve = self._strip()
+        warm_curve = self._strip(warm_start=previous_curve, broyden=True)
+        np.testing.assert_allclose(
+            warm_curve.rates, cold_curve.rates, rtol=0, atol=1e-10
+        )
+        # the stored Jacobian is the exact one, not the secant approximation
+        np.testing.assert_allclose(
+            warm_curve.jacobian.values, cold_curve.jacobian.values, rtol=1e-8, atol=1e-10
+        )
+        # hence repeated warm-started strips do not accumulate Jacobian errors
+        self.quotes = [q + 1e-4 for q in self.quotes]
+        cold_curve = self._strip()
+        warm_curve = self._strip(warm_start=warm_curve, broyden=True)
+        np.testing.assert_allclose(
+            warm_curve.jacobian.values, cold_curve.jacobian.values, rtol=1e-8, atol=1e-10
+        )
+
+    def test_unknown_method_raises(self):
+        with self.assertRaises(ValueError):
+            self._strip(method="bisection")
+
+
+if __name__ == "__main__":
+    unittest.main()
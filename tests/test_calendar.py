@@ -0,0 +1,85 @@
+import unittest
+from datetime import date, timedelta
+
+import numpy as np
+
+from tensorquant.timehandles.targetcalendar import TARGET
+from tensorquant.timehandles.utils import BusinessDayConvention, TimeUnit
+
+
+class TestTargetCalendar(unittest.TestCase):
+    def setUp(self):
+        self.calendar = TARGET()
+        self.dates = [date(2024, 1, 1) + timedelta(days=7 * i + i % 5) for i in range(150)]
+
+    def test_holidays(self):
+        self.assertFalse(self.calendar.is_business_day(date(2026, 4, 3)))  # Good Friday
+        self.assertFalse(self.calendar.is_business_day(date(2026, 4, 6)))  # Easter Monday
+        self.assertTrue(self.calendar.is_holiday(date(2026, 12, 26)))
+        self.assertFalse(self.calendar.is_holiday(date(2026, 4, 7)))
+
+    def test_advance_business_days(self):
+        # Thursday before Easter: Good Friday and Easter Monday are skipped
+        d = date(2026, 4, 2)
+        self.assertEqual(
+            self.calendar.advance(d, 1, TimeUnit.Days, BusinessDayConvention.Following),
+            date(2026, 4, 7),
+        )
+        self.assertEqual(
+            self.calendar.advance(
+                date(2026, 4, 7), -1, TimeUnit.Days, BusinessDayConvention.Following
+            ),
+            d,
+        )
+
+    def test_adjust(self):
+        self.assertEqual(
+            self.calendar.adjust(date(2026, 5, 30), BusinessDayConvention.ModifiedFollowing),
+            date(2026, 5, 29),
+        )
+        self.assertEqual(
+            self.calendar.adjust(date(2026, 5, 30), BusinessDayConvention.Following),
+            date(2026, 6, 1),
+        )
+
+    def test_business_days_between(self):
+        self.assertEqual(
+            self.calendar.business_days_between(date(2026, 1, 1), date(2026, 1, 10)), 6
+        )
+        self.assertEqual(
+            self.calendar.business_days_between(date(2026, 1, 10), date(2026, 1, 1)), -6
+        )
+
+    def test_array_variants_match_scalar(self):
+        for convention in BusinessDayConvention:
+            expected = np.array(
+                [self.calendar.adjust(d, convention) for d in self.dates],
+                dtype="datetime64[D]",
+            )
+            np.testing.assert_array_equal(
+                self.calendar.adjust_array(self.dates, convention), expected
+            )
+        expected = np.array(
+            [
+                self.calendar.advance(d, -3, TimeUnit.Days, BusinessDayConvention.Following)
+                for d in self.dates
+            ],
+            dtype="datetime64[D]",
+        )
+        np.testing.assert_array_equal(
+            self.calendar.advance_array(
+                np.array(self.dates, dtype="datetime64[D]"),
+                -3,
+                TimeUnit.Days,
+                BusinessDayConvention.Following,
+            ),
+            expected,
+        )
+        np.testing.assert_array_equal(
+            self.calendar.is_business_day_array(self.dates),
+            [self.calendar._is_business_day_rule(d) for d in self.dates],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from datetime import date, timedelta
+
+import numpy as np
+
+from tensorquant.timehandles.daycounter import DayCounter, DayCounterConvention
+
+
+class TestDayCounterArrays(unittest.TestCase):
+    def setUp(self):
+        self.start = [date(2023, 1, 31) + timedelta(days=37 * i) for i in range(60)]
+        self.end = [d + timedelta(days=29 * i + 1) for i, d in enumerate(self.start)]
+        self.start += [date(2024, 1, 31), date(2023, 12, 31), date(2024, 2, 29)]
+        self.end += [date(2024, 3, 31), date(2024, 12, 31), date(2024, 2, 29)]
+
+    def test_arrays_match_scalar(self):
+        end = np.array(self.end, dtype="datetime64[D]")
+        for convention in DayCounterConvention:
+            dc = DayCounter(convention)
+            np.testing.assert_allclose(
+                dc.year_fraction_array(self.start, end),
+                [dc.year_fraction(d1, d2) for d1, d2 in zip(self.start, self.end)],
+                rtol=0,
+                atol=1e-15,
+            )
+            np.testing.assert_array_equal(
+                dc.day_count_array(self.start, end),
+                [dc.day_count(d1, d2) for d1, d2 in zip(self.start, self.end)],
+            )
+
+    def test_scalar_start_broadcasts(self):
+        dc = DayCounter(DayCounterConvention.Actual365)
+        np.testing.assert_allclose(
+            dc.year_fraction_array(date(2026, 1, 1), [date(2026, 1, 1), date(2027, 1, 1)]),
+            [0.0, 1.0],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from datetime import date
+
+import numpy as np
+from scipy import optimize
+
+import tensorquant as tq
+from tensorquant.models.displaceddiffusion import (
+    DisplacedDiffusionModel,
+    _atm_vol_correction_np,
+    _dd_call_beta_grad_np,
+    _dd_call_np,
+)
+
+
+class TestDisplacedDiffusionCalibration(unittest.TestCase):
+    def setUp(self):
+        reference_date = date(2026, 1, 5)
+        self.curve = tq.FlatCurve(reference_date, 0.02, tq.DayCounterConvention.Actual365)
+        self.T = [0.25, 0.5, 1.0, 2.0, 5.0]
+        self.K = np.linspace(60.0, 140.0, 17)
+        # downward skew in the short maturities, upward in the long ones
+        skew = np.array([-0.06, -0.05, -0.04, 0.02, 0.03])
+        iv = 0.2 + skew[:, None] * np.log(self.K / 100.0)[None, :]
+        self.surface = tq.VolatilitySurface(reference_date, None, None, list(self.K), self.T, iv)
+
+    def test_beta_gradient_matches_finite_differences(self):
+        beta = np.array([0.3, 0.9, 1.4])[:, None]
+        price, grad = _dd_call_beta_grad_np(100.0, self.K, 2.0, beta, 0.25, 0.03, 0.01)
+        sigma = _atm_vol_correction_np(0.25, beta, 2.0)
+        np.testing.assert_allclose(
+            price, _dd_call_np(100.0, self.K, 2.0, beta, sigma, 0.03, 0.01), rtol=1e-12
+        )
+        h = 1e-6
+        up, _ = _dd_call_beta_grad_np(100.0, self.K, 2.0, beta + h, 0.25, 0.03, 0.01)
+        down, _ = _dd_call_beta_grad_np(100.0, self.K, 2.0, beta - h, 0.25, 0.03, 0.01)
+        np.testing.assert_allclose(grad, (up - down) / (2.0 * h), atol=1e-6)
+
+    def test_batched_calibration_matches_slice_by_slice_minimisation(self):
+        model = DisplacedDiffusionModel.from_implied_vol(100.0, self.surface, self.curve, q=0.01)
+        betas = model._spot_beta.numpy()
+        iv = np.asarray(self.surface.volatility_matrix)
+        for i, T in enumerate(self.T):
+            r = float(self.curve.zero_rate(T))
+            atm = np.interp(100.0, self.K, iv[i])
+            mkt = _dd_call_np(100.0, self.K, T, 1.0, iv[i], r, 0.01)
+
+            def objective(x):
+                sigma = _atm_vol_correction_np(atm, x[0], T)
+                return np.mean((_dd_call_np(100.0, self.K, T, x[0], sigma, r, 0.01) - mkt) ** 2)
+
+            res = optimize.minimize(
+                objective, x0=[betas[i] + 0.05], method="Nelder-Mead",
+                options={"xatol": 1e-9, "fatol": 1e-14},
+            )
+            self.assertAlmostEqual(betas[i], res.x[0], delta=1e-6)
+        self.assertTrue(np.all(betas[:2] < 1.0) and np.all(betas[-2:] > 1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import math
+import unittest
+from datetime import date
+
+import numpy as np
+import tensorflow as tf
+from dateutil.relativedelta import relativedelta
+
+import tensorquant as tq
+from tensorquant.models.stochasticprocess import StochasticProcess
+
+
+class TestHullWhitePaths(unittest.TestCase):
+    def setUp(self):
+        reference_date = date(2026, 1, 5)
+        self.curve = tq.RateCurve(
+            reference_date,
+            [0.5, 1.0, 2.0, 5.0, 10.0, 30.0],
+            [0.02, 0.022, 0.025, 0.028, 0.03, 0.031],
+            "LINEAR",
+            tq.DayCounterConvention.Actual365,
+        )
+        self.process = tq.HullWhiteProcess(self.curve, a=0.05, sigma=0.01)
+        dates = [reference_date + relativedelta(months=3 * i) for i in range(21)]
+        self.grid = tq.DateGrid(dates, tq.DayCounterConvention.Actual365)
+
+    def test_exact_paths_match_step_by_step_evolution(self):
+        times = self.grid.times
+        dw = tf.random.stateless_normal([200, len(times) - 1], seed=[1, 2], dtype=tf.float64)
+        x = tf.fill([200], tf.cast(self.process.initial_values(), tf.float64))
+        expected = []
+        for i in range(1, len(times)):
+            dt = times[i] - times[i - 1]
+            x = StochasticProcess.evolve(self.process, times[i - 1], x, dt, dw[:, i - 1])
+            expected.append(x)
+        paths = self.process.evolve_paths(times[1:], dw)
+        np.testing.assert_allclose(paths, tf.stack(expected, axis=1), atol=1e-7)
+
+    def test_generator_moments(self):
+        generator = tq.HullWhiteShortRateGenerator(
+            self.process, self.grid, tq.PseudoRandomSource(seed=7)
+        )
+        rates = generator.simulate(20_000).numpy()
+        self.assertEqual(rates.shape, (20_000, len(self.grid.times)))
+        a, sigma, t = 0.05, 0.01, self.grid.times[-1]
+        std = sigma * math.sqrt((1.0 - math.exp(-2.0 * a * t)) / (2.0 * a))
+        self.assertAlmostEqual(rates[:, -1].std(), std, delta=0.03 * std)
+        self.assertAlmostEqual(
+            rates[:, -1].mean(), float(self.process.alpha(t)), delta=4.0 * std / math.sqrt(20_000)
+        )
+
+    def test_simulated_curves_match_zero_bond(self):
+        generator = tq.HullWhiteShortRateGenerator(
+            self.process, self.grid, tq.PseudoRandomSource(seed=7)
+        )
+        curves = generator.simulate_curves(500)
+        tenors = generator.DEFAULT_TENORS
+        self.assertEqual(curves.discount_factors.shape, (21, len(tenors), 500))
+        times, rates = self.grid.times, generator.state_variable
+        for i, j in [(0, 0), (4, 17), (20, len(tenors) - 1)]:
+            expected = self.process.zero_bond(times[i], times[i] + tenors[j], rates[:, i])
+            # the scalar and vectorized curve evaluations differ by round-off
+            np.testing.assert_allclose(curves.discount([tenors[j]])[i, 0], expected, rtol=1e-7)
+        # off the knots the zero rates are linear; at time 0 they are today's curve
+        df = curves.discount([1.5, 2.5], date_index=0)
+        np.testing.assert_allclose(
+            df.numpy()[:, 0], self.curve.discount([1.5, 2.5]).numpy(), rtol=1e-7
+        )
+        fwd = curves.forward_rate([1.0], [2.0])
+        np.testing.assert_allclose(
+            fwd, (curves.discount(1.0) / curves.discount(2.0) - 1.0), rtol=1e-12
+        )
+
+
+class TestG2PlusPlusPaths(unittest.TestCase):
+    def setUp(self):
+        reference_date = date(2026, 1, 5)
+        self.curve = tq.RateCurve(
+            reference_date,
+            [0.5, 1.0, 2.0, 5.0, 10.0, 30.0],
+            [0.02, 0.022, 0.025, 0.028, 0.03, 0.031],
+            "LINEAR",
+            tq.DayCounterConvention.Actual365,
+        )
+        self.process = tq.G2PlusPlusProcess(
+            self.curve, a=0.1, b=0.5, sigma=0.01, eta=0.008, rho=-0.7
+        )
+        dates = [reference_date + relativedelta(months=3 * i) for i in range(21)]
+        self.grid = tq.DateGrid(dates, tq.DayCounterConvention.Actual365)
+
+    def test_joint_moments_and_curves(self):
+        generator = tq.G2PlusPlusShortRateGenerator(
+            self.process, self.grid, tq.SobolRandomSource()
+        )
+        curves = generator.simulate_curves(8_192)
+        factors = generator.state_variable.numpy()
+        self.assertEqual(factors.shape, (8_192, 21, 2))
+        t = self.grid.times[-1]
+        x, y = factors[:, -1, 0], factors[:, -1, 1]
+        self.assertAlmostEqual(x.var(), float(self.process.variance_x(t)), delta=1e-5)
+        self.assertAlmostEqual(y.var(), float(self.process.variance_y(t)), delta=1e-6)
+        self.assertAlmostEqual(np.mean(x * y), float(self.process.covariance(t)), delta=2e-6)
+        np.testing.assert_allclose(
+            curves.discount([1.5, 7.0], date_index=0).numpy()[:, 0],
+            self.curve.discount([1.5, 7.0]).numpy(),
+            rtol=1e-7,
+        )
+        i, times = 12, self.grid.times
+        expected = self.process.zero_bond(
+            times[i], times[i] + 5.0, factors[:, i, 0], factors[:, i, 1]
+        )
+        np.testing.assert_allclose(curves.discount(5.0)[i, 0], expected, rtol=1e-7)
+
+
+if __name__ == "__main__":
+    unittest.main()
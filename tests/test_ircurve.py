@@ -0,0 +1,153 @@
+import unittest
+from datetime import date, timedelta
+
+import numpy as np
+import tensorflow as tf
+
+from tensorquant.markethandles.ircurve import RateCurve
+from tensorquant.numericalhandles.interpolation import LinearInterp
+from tensorquant.timehandles.daycounter import DayCounterConvention
+
+
+class TestRateCurveVectorized(unittest.TestCase):
+    def setUp(self):
+        self.reference_date = date(2026, 1, 2)
+        self.curve = RateCurve(
+            reference_date=self.reference_date,
+            pillars=[0.25, 1.0, 2.0, 5.0],
+            rates=[0.02, 0.022, 0.023, 0.025],
+            interp="LINEAR",
+            daycounter_convention=DayCounterConvention.Actual365,
+        )
+        self.times = [0.1, 0.25, 0.7, 1.0, 3.3, 5.0, 7.0]
+        self.dates = [
+            self.reference_date + timedelta(days=100 * i) for i in range(1, 20)
+        ]
+
+    def test_discount_matches_scalar(self):
+        vector = self.curve.discount(np.array(self.times)).numpy()
+        scalar = [float(self.curve.discount(t)) for t in self.times]
+        np.testing.assert_allclose(vector, scalar, rtol=0, atol=1e-14)
+
+    def test_discount_dates_matches_scalar(self):
+        vector = self.curve.discount(self.dates).numpy()
+        scalar = [float(self.curve.discount(d)) for d in self.dates]
+        np.testing.assert_allclose(vector, scalar, rtol=0, atol=1e-14)
+
+    def test_forward_and_zero_rates_match_scalar(self):
+        fwd = self.curve.forward_rate(self.dates[:-1], self.dates[1:]).numpy()
+        fwd_scalar = [
+            float(self.curve.forward_rate(d1, d2))
+            for d1, d2 in zip(self.dates[:-1], self.dates[1:])
+        ]
+        np.testing.assert_allclose(fwd, fwd_scalar, rtol=0, atol=1e-12)
+        zero = self.curve.zero_rate(self.times).numpy()
+        zero_scalar = [float(self.curve.zero_rate(t)) for t in self.times]
+        np.testing.assert_allclose(zero, zero_scalar, rtol=0, atol=1e-12)
+
+    def test_vectorized_discount_is_differentiable(self):
+        with tf.GradientTape() as tape:
+            npv = tf.reduce_sum(
+                self.curve.discount(tf.constant(self.times, dtype=tf.float64))
+            )
+        gradients = tape.gradient(npv, self.curve._rates)
+        self.assertTrue(all(g is not None for g in gradients))
+        self.assertTrue(all(float(g) < 0.0 for g in gradients))
+
+    def test_set_rates_updates_variable_in_place(self):
+        handle = self.curve._rates
+        self.curve._set_rates([0.03, 0.031, 0.032, 0.033])
+        self.assertIs(self.curve._rates, handle)
+        self.assertEqual(self.curve.rates, [0.03, 0.031, 0.032, 0.033])
+        self.assertAlmostEqual(self.curve.nodes[0][1], 0.03)
+        with self.assertRaises(ValueError):
+            self.curve._set_rates([0.03, 0.031])
+
+    def test_grid_maps_follow_rate_updates(self):
+        grid = np.array([[0.0, 0.1, 0.7], [1.0, 3.3, 7.0]])
+        for rates in ([0.02, 0.022, 0.023, 0.025], [0.03, 0.028, 0.031, 0.035]):
+            self.curve._set_rates(rates)
+            np.testing.assert_allclose(
+                self.curve.discount_on_grid(grid),
+                self.curve.discount(grid.ravel()).numpy().reshape(grid.shape),
+                rtol=1e-14,
+            )
+            np.testing.assert_allclose(
+                self.curve.inst_fwd_on_grid(grid),
+                self.curve.inst_fwd(grid.ravel()).numpy().reshape(grid.shape),
+                atol=1e-12,
+            )
+        self.assertEqual(len(self.curve._grid_maps_cache), 1)
+        with tf.GradientTape() as tape:
+            npv = tf.reduce_sum(self.curve.discount_on_grid(grid))
+        with tf.GradientTape() as reference:
+            expected = tf.reduce_sum(self.curve.discount(grid.ravel()))
+        np.testing.assert_allclose(
+            tape.gradient(npv, self.curve._rates),
+            reference.gradient(expected, self.curve._rates),
+            rtol=1e-10,
+        )
+
+
+class TestFlatForwardCurve(unittest.TestCase):
+    def setUp(self):
+        self.pillars = [0.25, 1.0, 2.0, 5.0]
+        self.rates = [0.02, 0.022, 0.023, 0.025]
+        self.curve = RateCurve(
+            reference_date=date(2026, 1, 2),
+            pillars=self.pillars,
+            rates=self.rates,
+            interp="FLAT_FORWARD",
+            daycounter_convention=DayCounterConvention.Actual365,
+        )
+
+    def test_discount_reprices_pillars_and_is_log_linear(self):
+        pillar_dfs = self.curve.discount(self.pillars).numpy()
+        np.testing.assert_allclose(
+            pillar_dfs, np.exp(-np.multiply(self.pillars, self.rates)), rtol=1e-15
+        )
+        mid = float(self.curve.discount(1.5))
+        self.assertAlmostEqual(mid, np.sqrt(pillar_dfs[1] * pillar_dfs[2]), places=15)
+
+    def test_inst_fwd_is_analytic(self):
+        times = [0.1, 0.5, 1.5, 3.0, 7.0]
+        forwards = self.curve.inst_fwd(times).numpy()
+        integrals = np.multiply(self.pillars, self.rates)
+        segment = np.diff(integrals) / np.diff(self.pillars)
+        expected = [self.rates[0], segment[0], segment[1], segment[2], segment[2]]
+        np.testing.assert_allclose(forwards, expected, rtol=1e-14)
+        self.assertAlmostEqual(float(self.curve.inst_fwd(1.5)), segment[1], places=15)
+
+    def test_log_linear_is_flat_forward(self):
+        curve = RateCurve(
+            date(2026, 1, 2),
+            self.pillars,
+            self.rates,
+            "LOG_LINEAR",
+            DayCounterConvention.Actual365,
+        )
+        times = np.linspace(0.0, 8.0, 17)
+        np.testing.assert_array_equal(
+            curve.discount(times).numpy(), self.curve.discount(times).numpy()
+        )
+
+
+
+class TestLinearInterpBatch(unittest.TestCase):
+    def test_batch_matches_row_by_row(self):
+        x = [0.25, 1.0, 2.0, 5.0]
+        y = tf.random.stateless_uniform([3, 4, 6], seed=[1, 2], dtype=tf.float64)
+        # inside, on and outside the pillars, different per row
+        terms = tf.constant(
+            [[0.1, 0.25, 1.5, 7.0], [1.0, 3.0, 4.9, 5.0], [0.0, 0.5, 2.0, 2.5]],
+            dtype=tf.float64,
+        )
+        batch = LinearInterp(x, y).interpolate_batch(terms)
+        self.assertEqual(batch.shape, (3, 4, 6))
+        for i in range(3):
+            for p in range(6):
+                expected = LinearInterp(x, y[i, :, p]).interpolate_tensor(terms[i])
+                np.testing.assert_allclose(batch[i, :, p], expected, rtol=1e-14)
+
+if __name__ == "__main__":
+    unittest.main()
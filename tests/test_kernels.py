@@ -0,0 +1,46 @@
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from tensorquant.models.kernels import SimulationKernel
+from tensorquant.models.localvolatility import LocalVolatilityModel, _local_vol_paths
+
+
+class TestSimulationKernel(unittest.TestCase):
+    def setUp(self):
+        self.jit_compile = SimulationKernel.jit_compile
+        T = tf.constant([0.25, 0.5, 1.0, 2.0])
+        K = tf.linspace(50.0, 150.0, 21)
+        TT, KK = tf.meshgrid(T, K, indexing="ij")
+        iv = 0.2 - 0.1 * tf.math.log(KK / 100.0) + 0.02 * TT
+        self.models = [
+            LocalVolatilityModel.from_implied_vol(iv + shift, T, K, 100.0, r=0.02)
+            for shift in (0.0, 0.05)
+        ]
+
+    def tearDown(self):
+        SimulationKernel.jit_compile = self.jit_compile
+
+    def test_trace_is_shared_across_models_and_shapes(self):
+        SimulationKernel.jit_compile = False
+        self.models[0].evolve(tf.linspace(0.0, 1.0, 11)[1:], tf.zeros([8, 10]))
+        traces = _local_vol_paths.trace_count
+        for model, (n_paths, n_steps) in zip(self.models, ((100, 12), (50, 30))):
+            t_grid = tf.linspace(0.0, 1.0, n_steps + 1)[1:]
+            model.evolve(t_grid, tf.random.stateless_normal([n_paths, n_steps], seed=[1, 2]))
+        self.assertEqual(_local_vol_paths.trace_count, traces)
+        self.assertEqual(SimulationKernel.trace_counts()[_local_vol_paths.name], traces)
+
+    def test_xla_kernel_matches_graph_kernel(self):
+        t_grid = tf.linspace(0.0, 2.0, 51)[1:]
+        dw = tf.random.stateless_normal([1000, 50], seed=[3, 4])
+        SimulationKernel.jit_compile = False
+        expected = self.models[1].evolve(t_grid, dw)
+        SimulationKernel.jit_compile = True
+        paths = self.models[1].evolve(t_grid, dw)
+        np.testing.assert_allclose(paths.numpy(), expected.numpy(), rtol=1e-4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from tensorquant.models.localvolatility import (
+    _bilinear_interp,
+    _strike_interp,
+    _time_slices,
+)
+
+
+class TestLocalVolatilityInterpolation(unittest.TestCase):
+    def test_time_slices_match_bilinear_interpolation(self):
+        T_grid = tf.constant([0.25, 0.5, 1.0, 2.0])
+        K_grid = tf.linspace(50.0, 150.0, 21)
+        sigma_TK = tf.random.stateless_uniform([4, 21], seed=[1, 2], minval=0.1, maxval=0.5)
+        S = tf.random.stateless_uniform([1000], seed=[3, 4], minval=30.0, maxval=170.0)
+        # includes times before, between, on and after the grid nodes
+        for t in (0.0, 0.3, 0.5, 1.7, 2.5):
+            expected = _bilinear_interp(sigma_TK, T_grid, K_grid, tf.fill([1000], t), S)
+            sigma_K = _time_slices(sigma_TK, T_grid, tf.constant([t]))[0]
+            np.testing.assert_allclose(
+                _strike_interp(sigma_K, K_grid, S).numpy(), expected.numpy(), rtol=1e-6
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
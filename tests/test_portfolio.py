@@ -0,0 +1,113 @@
+import unittest
+from datetime import date
+
+import numpy as np
+
+import tensorquant as tq
+from tensorquant.timehandles.utils import Settings
+
+
+class TestPortfolioPricer(unittest.TestCase):
+    def setUp(self):
+        self.evaluation_date = date(2026, 1, 5)
+        Settings.evaluation_date = self.evaluation_date
+        estr = tq.RateCurve(
+            self.evaluation_date,
+            [0.5, 1.0, 2.0, 5.0, 10.0],
+            [0.0180, 0.0190, 0.0205, 0.0220, 0.0230],
+            "LINEAR",
+            tq.DayCounterConvention.Actual360,
+        )
+        eur6m = tq.RateCurve(
+            self.evaluation_date,
+            [0.5, 1.0, 2.0, 5.0, 10.0],
+            [0.0200, 0.0210, 0.0225, 0.0240, 0.0250],
+            "LINEAR",
+            tq.DayCounterConvention.Actual360,
+        )
+        self.market_env = tq.MarketEnvironment(
+            market={"IR:EUR:ESTR:SPOT": estr, "IR:EUR:6M:SPOT": eur6m}
+        )
+        calendar = tq.TARGET()
+        index = tq.IborIndex(
+            calendar, 6, tq.TimeUnit.Months, tq.Currency.EUR, fixing_days=2
+        )
+        index.add_fixing(date(2025, 10, 2), 0.0215)
+        index.add_fixing(date(2026, 1, 5), 0.0205)
+        swaps = tq.SwapGenerator(
+            tq.Currency.EUR,
+            2,
+            "1Y",
+            "6M",
+            tq.BusinessDayConvention.ModifiedFollowing,
+            1e6,
+            tq.DayCounterConvention.Actual360,
+            tq.DayCounterConvention.Actual360,
+            calendar,
+            index,
+        )
+        ois = tq.OisGenerator(
+            tq.Currency.EUR,
+            2,
+            "1Y",
+            "1Y",
+            tq.BusinessDayConvention.ModifiedFollowing,
+            1e6,
+            tq.DayCounterConvention.Actual360,
+            tq.DayCounterConvention.Actual360,
+            calendar,
+            tq.OvernightIndex(calendar, tq.Currency.EUR),
+        )
+        self.products = [
+            swaps.build(self.evaluation_date, 0.022, "5Y"),
+            swaps.build(self.evaluation_date, 0.021, "2Y"),
+            # seasoned swap with a running coupon fixed in the past
+            swaps.build(date(2025, 10, 2), 0.023, "7Y"),
+            ois.build(self.evaluation_date, 0.019, "3Y"),
+        ]
+        self.products[1]._swap_type = tq.SwapType.Receiver
+
+    def test_matches_single_pricers(self):
+        expected = []
+        for product in self.products:
+            pricer = tq.SwapPricer() if type(product) == tq.Swap else tq.OisPricer()
+            expected.append(float(pricer.calculate_price(product, self.market_env)))
+        npvs = tq.PortfolioPricer().price(self.products, self.market_env)
+        np.testing.assert_allclose(npvs, expected, rtol=0, atol=1e-6)
+        self.assertAlmostEqual(self.products[0].price, expected[0], places=6)
+
+    def test_jacobians_match_tape(self):
+        pricer = tq.PortfolioPricer()
+        pricer.price(self.products, self.market_env, autodiff=True)
+        for i, product in enumerate(self.products):
+            single = tq.SwapPricer() if type(product) == tq.Swap else tq.OisPricer()
+            single.price(product, self.market_env, autodiff=True)
+            names = list(pricer.jacobians)
+            gradients = single.tape.gradient(
+                product.price,
+                [self.market_env._market[name].rate_variable for name in names],
+                unconnected_gradients="zero",
+            )
+            for name, gradient in zip(names, gradients):
+                np.testing.assert_allclose(
+                    pricer.jacobians[name][i], gradient.numpy(), rtol=1e-10, atol=1e-8
+                )
+
+    def test_replaced_curve_repacks_the_book(self):
+        pricer = tq.PortfolioPricer()
+        before = pricer.price(self.products, self.market_env)
+        # a re-strip registers a new curve object under the same name
+        self.market_env._market["IR:EUR:6M:SPOT"] = tq.RateCurve(
+            self.evaluation_date,
+            [0.5, 1.0, 2.0, 5.0, 10.0],
+            [0.0250, 0.0260, 0.0275, 0.0290, 0.0300],
+            "LINEAR",
+            tq.DayCounterConvention.Actual360,
+        )
+        npvs = pricer.price(self.products, self.market_env)
+        expected = tq.PortfolioPricer().price(self.products, self.market_env)
+        np.testing.assert_allclose(npvs, expected, rtol=0, atol=1e-6)
+        self.assertGreater(np.abs(npvs - before).max(), 1.0)
+
+if __name__ == "__main__":
+    unittest.main()
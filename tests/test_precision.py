@@ -0,0 +1,71 @@
+import unittest
+from datetime import date
+
+import numpy as np
+import tensorflow as tf
+
+import tensorquant as tq
+from tensorquant.models.brownian import GeometricBrownianMotion
+from tensorquant.models.localvolatility import LocalVolatilityModel, _local_vol_paths
+
+
+class TestPrecision(unittest.TestCase):
+    def test_scope_sets_the_default_dtype(self):
+        self.assertEqual(tq.Precision.resolve(), tf.float64)
+        with tq.Precision.scope("float32"):
+            self.assertEqual(GeometricBrownianMotion(0.0, 0.2, 100.0).dtype, tf.float32)
+        self.assertEqual(GeometricBrownianMotion(0.0, 0.2, 100.0).dtype, tf.float64)
+        self.assertEqual(tq.Precision.resolve(tf.float32), tf.float32)
+        with self.assertRaises(ValueError):
+            tq.Precision.resolve(tf.float16)
+
+    def test_local_vol_simulates_in_model_dtype(self):
+        T = [0.5, 1.0, 2.0]
+        K = np.linspace(50.0, 150.0, 21)
+        iv = np.full((3, 21), 0.2)
+        t_grid = np.linspace(0.0, 1.0, 11)[1:]
+        dw = tf.random.stateless_normal([500, 10], seed=[1, 2], dtype=tf.float64)
+        paths = {}
+        for dtype in (tf.float32, tf.float64):
+            model = LocalVolatilityModel.from_implied_vol(iv, T, K, 100.0, dtype=dtype)
+            traces = _local_vol_paths.trace_count
+            paths[dtype] = model.evolve(t_grid, dw)
+            model.evolve(t_grid, dw[:100])
+            self.assertLessEqual(_local_vol_paths.trace_count - traces, 1)
+            self.assertEqual(paths[dtype].dtype, dtype)
+        # float32 finite differences of the call prices are noisy in the wings
+        np.testing.assert_allclose(
+            np.mean(paths[tf.float32], axis=0), np.mean(paths[tf.float64], axis=0), rtol=1e-3
+        )
+
+    def test_vanilla_mc_price_in_model_dtype(self):
+        evaluation_date = date(2026, 1, 5)
+        tq.Settings.evaluation_date = evaluation_date
+        curve = tq.FlatCurve(evaluation_date, 0.02, tq.DayCounterConvention.Actual365)
+        market_env = tq.MarketEnvironment(market={"IR:EUR:ESTR:SPOT": curve})
+        with tq.Precision.scope(tf.float32):
+            option = tq.VanillaOption(
+                tq.Currency.EUR, evaluation_date, date(2027, 1, 5), tq.OptionType.Call, 100.0
+            )
+        self.assertEqual(option.strike.dtype, tf.float64)
+        prices, errors = {}, {}
+        for dtype in (tf.float32, tf.float64):
+            pricer = tq.VanillaMCPricer(
+                GeometricBrownianMotion(0.02, 0.2, 100.0, dtype=dtype),
+                n_paths=4096,
+                n_steps=4,
+                chunk_size=2048,
+            )
+            prices[dtype] = pricer.calculate_price(option, market_env)
+            errors[dtype] = float(pricer.std_error)
+            self.assertEqual(prices[dtype].dtype, dtype)
+        # the increments are drawn in each dtype, hence are different samples
+        self.assertAlmostEqual(
+            float(prices[tf.float32]),
+            float(prices[tf.float64]),
+            delta=4.0 * np.hypot(errors[tf.float32], errors[tf.float64]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import math
+import unittest
+from datetime import date
+
+import numpy as np
+import tensorflow as tf
+
+import tensorquant as tq
+from tensorquant.models.brownian import GeometricBrownianMotion
+from tensorquant.numericalhandles.randomsource import (
+    PseudoRandomSource,
+    SobolRandomSource,
+    brownian_bridge_matrix,
+)
+
+
+class TestRandomSource(unittest.TestCase):
+    def test_brownian_bridge_increments_are_independent(self):
+        times = np.array([0.0, 0.1, 0.35, 0.5, 0.5, 1.2, 2.0])
+        matrix = brownian_bridge_matrix(times)
+        # zero-length steps get zero increments, all others unit variance
+        expected = np.diag((np.diff(np.concatenate([[0.0], times])) > 0) * 1.0)
+        np.testing.assert_allclose(matrix.T @ matrix, expected, atol=1e-14)
+
+    def test_sobol_increments_are_standard_normal(self):
+        z = SobolRandomSource(seed=7).increments(4096, np.linspace(0.1, 1.0, 10))
+        np.testing.assert_allclose(z.numpy().mean(axis=0), 0.0, atol=5e-3)
+        np.testing.assert_allclose(z.numpy().std(axis=0), 1.0, atol=5e-3)
+
+    def test_sobol_factors_have_one_bridge_each(self):
+        times = np.linspace(0.25, 3.0, 12)
+        source = SobolRandomSource(seed=7)
+        z = source.increments(4096, times, factors=2).numpy()
+        self.assertEqual(z.shape, (4096, 12, 2))
+        # step-major dimensions: factor f is bridged from dimensions f, f + 2, ...
+        normals = tf.math.ndtri(source.uniforms(4096, 24)).numpy()
+        bridge = brownian_bridge_matrix(times)
+        for f in range(2):
+            np.testing.assert_allclose(z[..., f], normals[:, f::2] @ bridge, atol=1e-12)
+        terminal = z.sum(axis=1)
+        self.assertLess(abs(np.corrcoef(terminal[:, 0], terminal[:, 1])[0, 1]), 0.01)
+        self.assertEqual(PseudoRandomSource().increments(10, times, factors=2).shape, (10, 12, 2))
+
+    def test_sobol_vanilla_price_beats_pseudo_random(self):
+        evaluation_date = date(2026, 1, 5)
+        tq.Settings.evaluation_date = evaluation_date
+        rate, vol, spot, strike = 0.02, 0.2, 100.0, 105.0
+        curve = tq.FlatCurve(evaluation_date, rate, tq.DayCounterConvention.Actual365)
+        market_env = tq.MarketEnvironment(market={"IR:EUR:ESTR:SPOT": curve})
+        option = tq.VanillaOption(
+            tq.Currency.EUR, evaluation_date, date(2027, 1, 5), tq.OptionType.Call, strike
+        )
+        T = 1.0
+        d1 = (math.log(spot / strike) + (rate + 0.5 * vol**2) * T) / (vol * math.sqrt(T))
+        d2 = d1 - vol * math.sqrt(T)
+        cdf = lambda x: 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+        black = spot * cdf(d1) - strike * math.exp(-rate * T) * cdf(d2)
+
+        def mc_price(random_source):
+            pricer = tq.VanillaMCPricer(
+                GeometricBrownianMotion(rate, vol, spot),
+                n_paths=4096,
+                n_steps=16,
+                random_source=random_source,
+            )
+            return float(pricer.calculate_price(option, market_env))
+
+        sobol_errors = [abs(mc_price(SobolRandomSource(seed=s)) - black) for s in range(4)]
+        pseudo_errors = [abs(mc_price(PseudoRandomSource(seed=s)) - black) for s in range(4)]
+        self.assertLess(np.sqrt(np.mean(np.square(sobol_errors))), 0.02)
+        self.assertLess(np.mean(sobol_errors), np.mean(pseudo_errors))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from datetime import date
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+import tensorquant as tq
+from tensorquant.timehandles.utils import Settings
+
+
+class TestSwapExposure(unittest.TestCase):
+    def setUp(self):
+        self.evaluation_date = date(2026, 1, 5)
+        Settings.evaluation_date = self.evaluation_date
+        curve = tq.RateCurve(
+            self.evaluation_date,
+            [0.5, 1.0, 2.0, 5.0, 10.0, 30.0],
+            [0.02, 0.022, 0.025, 0.028, 0.03, 0.031],
+            "LINEAR",
+            tq.DayCounterConvention.Actual365,
+        )
+        self.market_env = tq.MarketEnvironment(
+            market={"IR:EUR:ESTR:SPOT": curve, "IR:EUR:6M:SPOT": curve}
+        )
+        calendar = tq.TARGET()
+        index = tq.IborIndex(
+            calendar, 6, tq.TimeUnit.Months, tq.Currency.EUR, fixing_days=2
+        )
+        index.add_fixing(date(2025, 10, 2), 0.0215)
+        swaps = tq.SwapGenerator(
+            tq.Currency.EUR,
+            2,
+            "1Y",
+            "6M",
+            tq.BusinessDayConvention.ModifiedFollowing,
+            1e6,
+            tq.DayCounterConvention.Actual365,
+            tq.DayCounterConvention.Actual365,
+            calendar,
+            index,
+        )
+        # seasoned swap with a running coupon fixed in the past
+        self.swap = swaps.build(date(2025, 10, 2), 0.026, "5Y")
+        dates = [self.evaluation_date + relativedelta(months=i) for i in range(62)]
+        self.exposure = tq.SwapExposureGenerator(
+            tq.HullWhiteProcess(curve, a=0.05, sigma=0.01),
+            tq.DateGrid(dates, tq.DayCounterConvention.Actual365),
+            tq.PseudoRandomSource(seed=3),
+        )
+
+    def test_exposure_profiles(self):
+        npv = float(tq.SwapPricer().calculate_price(self.swap, self.market_env))
+        self.exposure.simulate(5_000, self.swap)
+        exposure = self.exposure.exposure.numpy()
+        self.assertEqual(exposure.shape, (62, 5_000))
+        np.testing.assert_allclose(exposure[0], npv, atol=1e-2)
+        np.testing.assert_array_equal(exposure[-2:], 0.0)
+        ee = self.exposure.expected_exposure.numpy()
+        epe = self.exposure.expected_positive_exposure.numpy()
+        ene = self.exposure.expected_negative_exposure.numpy()
+        pfe = self.exposure.potential_future_exposure(0.95).numpy()
+        np.testing.assert_allclose(epe + ene, ee, atol=1e-8)
+        self.assertTrue(np.all(epe >= 0.0) and np.all(ene <= 0.0))
+        self.assertTrue(np.all(pfe >= epe - 1e-8))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from datetime import date
+
+from tensorquant.timehandles.schedule import ScheduleCache, ScheduleGenerator
+from tensorquant.timehandles.targetcalendar import TARGET
+from tensorquant.timehandles.utils import BusinessDayConvention, TimeUnit
+
+
+class TestScheduleGenerator(unittest.TestCase):
+    def setUp(self):
+        self._cache = ScheduleGenerator.cache
+        ScheduleGenerator.cache = ScheduleCache(maxsize=2)
+
+    def tearDown(self):
+        ScheduleGenerator.cache = self._cache
+
+    def test_cache_hits_across_generators(self):
+        start, end = date(2024, 1, 15), date(2026, 1, 15)
+        first = ScheduleGenerator(
+            TARGET(), BusinessDayConvention.ModifiedFollowing
+        ).generate(start, end, 6, TimeUnit.Months)
+        second = ScheduleGenerator(
+            TARGET(), BusinessDayConvention.ModifiedFollowing
+        ).generate(start, end, 6, TimeUnit.Months)
+        self.assertIs(first, second)
+        self.assertIsInstance(first, tuple)
+        self.assertEqual(first[0], start)
+        self.assertEqual(first[-1], end)
+        self.assertEqual(ScheduleGenerator.cache.stats()["hits"], 1)
+        self.assertEqual(ScheduleGenerator.cache.stats()["misses"], 1)
+
+    def test_lru_eviction(self):
+        generator = ScheduleGenerator(TARGET(), BusinessDayConvention.Following)
+        start = date(2024, 1, 15)
+        for years in (1, 2, 3):
+            generator.generate(start, date(2024 + years, 1, 15), 3, TimeUnit.Months)
+        self.assertEqual(len(ScheduleGenerator.cache), 2)
+        generator.generate(start, date(2025, 1, 15), 3, TimeUnit.Months)
+        self.assertEqual(ScheduleGenerator.cache.stats()["misses"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
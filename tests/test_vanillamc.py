@@ -0,0 +1,47 @@
+import math
+import unittest
+from datetime import date
+
+import tensorquant as tq
+from tensorquant.models.brownian import GeometricBrownianMotion
+
+
+def black_scholes(spot, strike, rate, vol, T, phi):
+    d1 = (math.log(spot / strike) + (rate + 0.5 * vol**2) * T) / (vol * math.sqrt(T))
+    d2 = d1 - vol * math.sqrt(T)
+    cdf = lambda x: 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+    return phi * (spot * cdf(phi * d1) - strike * math.exp(-rate * T) * cdf(phi * d2))
+
+
+class TestVanillaMCBook(unittest.TestCase):
+    def test_book_matches_black_scholes(self):
+        evaluation_date = date(2026, 1, 5)
+        tq.Settings.evaluation_date = evaluation_date
+        rate, vol, spot = 0.02, 0.2, 100.0
+        curve = tq.FlatCurve(evaluation_date, rate, tq.DayCounterConvention.Actual365)
+        market_env = tq.MarketEnvironment(market={"IR:EUR:ESTR:SPOT": curve})
+        book = [
+            tq.VanillaOption(tq.Currency.EUR, evaluation_date, end_date, option_type, strike)
+            for end_date in (date(2026, 7, 6), date(2027, 1, 5), date(2028, 1, 5))
+            for option_type in (tq.OptionType.Call, tq.OptionType.Put)
+            for strike in (80.0, 100.0, 120.0)
+        ]
+        pricer = tq.VanillaMCPricer(
+            GeometricBrownianMotion(rate, vol, spot),
+            n_paths=20_000,
+            n_steps=24,
+            antithetic=True,
+            control_variates=("spot",),
+        )
+        npvs, std_errors = pricer.calculate_book(book, market_env)
+        self.assertEqual(npvs.shape, (len(book),))
+        for option, npv, std_error in zip(book, npvs.numpy(), std_errors.numpy()):
+            T = (option.end_date - evaluation_date).days / 365.0
+            expected = black_scholes(
+                spot, float(option.strike), rate, vol, T, option.option_type.value
+            )
+            self.assertLess(abs(npv - expected), 4.0 * std_error + 1e-4)
+
+
+if __name__ == "__main__":
+    unittest.main()
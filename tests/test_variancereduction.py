@@ -0,0 +1,102 @@
+import math
+import unittest
+from datetime import date
+
+import numpy as np
+import tensorflow as tf
+
+import tensorquant as tq
+from tensorquant.models.brownian import GeometricBrownianMotion
+from tensorquant.numericalhandles.randomsource import PseudoRandomSource
+from tensorquant.numericalhandles.variancereduction import (
+    MomentAccumulator,
+    antithetic_increments,
+    mc_estimate,
+)
+
+
+class TestVarianceReduction(unittest.TestCase):
+    def test_control_variate_removes_linear_noise(self):
+        x = tf.random.stateless_normal([1000], seed=[1, 2], dtype=tf.float64)
+        noise = tf.random.stateless_normal([1000], seed=[3, 4], dtype=tf.float64)
+        y = 2.0 + 3.0 * x + 0.01 * noise
+        estimate, std_error = mc_estimate(y, x[:, None], tf.constant([0.0], tf.float64))
+        self.assertAlmostEqual(float(estimate), 2.0, delta=3e-3)
+        self.assertLess(float(std_error), 1e-3)
+
+    def test_antithetic_pairs_cancel_odd_payoffs(self):
+        dw = antithetic_increments(
+            tf.random.stateless_normal([500, 3], seed=[5, 6], dtype=tf.float64)
+        )
+        estimate, std_error = mc_estimate(tf.reduce_sum(dw, axis=1), antithetic=True)
+        self.assertEqual(float(estimate), 0.0)
+        self.assertEqual(float(std_error), 0.0)
+
+    def test_accumulator_matches_batch_estimate(self):
+        y = tf.random.stateless_normal([5000], seed=[7, 8], dtype=tf.float64)
+        x = tf.stack([y + tf.sin(y), tf.exp(0.1 * y)], axis=1)
+        accumulator = MomentAccumulator(antithetic=True, block_size=256)
+        # chunks of 1024 antithetic pairs
+        for start in range(0, 2500, 1024):
+            stop = min(start + 1024, 2500)
+            chunk = tf.concat([y[start:stop], y[2500 + start : 2500 + stop]], axis=0)
+            controls = tf.concat([x[start:stop], x[2500 + start : 2500 + stop]], axis=0)
+            accumulator.add(chunk, controls)
+        means = tf.constant([0.0, 1.0], tf.float64)
+        expected = mc_estimate(y, x, means, antithetic=True)
+        np.testing.assert_allclose(accumulator.estimate(means), expected, rtol=1e-10)
+
+    def test_pseudo_random_increments_do_not_depend_on_chunks(self):
+        source = PseudoRandomSource(seed=3, block_size=100)
+        times = np.linspace(0.1, 1.0, 4)
+        full = source.increments(450, times)
+        chunks = [source.increments(150, times, offset=o) for o in (0, 150, 300)]
+        np.testing.assert_array_equal(full.numpy(), tf.concat(chunks, axis=0).numpy())
+
+    def test_vanilla_price_with_variance_reduction(self):
+        evaluation_date = date(2026, 1, 5)
+        tq.Settings.evaluation_date = evaluation_date
+        rate, vol, spot, strike = 0.02, 0.2, 100.0, 105.0
+        curve = tq.FlatCurve(evaluation_date, rate, tq.DayCounterConvention.Actual365)
+        market_env = tq.MarketEnvironment(market={"IR:EUR:ESTR:SPOT": curve})
+        option = tq.VanillaOption(
+            tq.Currency.EUR, evaluation_date, date(2027, 1, 5), tq.OptionType.Call, strike
+        )
+        T = 1.0
+        d1 = (math.log(spot / strike) + (rate + 0.5 * vol**2) * T) / (vol * math.sqrt(T))
+        d2 = d1 - vol * math.sqrt(T)
+        cdf = lambda x: 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+        black = spot * cdf(d1) - strike * math.exp(-rate * T) * cdf(d2)
+
+        def mc_price(**kwargs):
+            pricer = tq.VanillaMCPricer(
+                GeometricBrownianMotion(rate, vol, spot),
+                n_paths=8192,
+                n_steps=16,
+                **kwargs,
+            )
+            price = float(pricer.calculate_price(option, market_env))
+            return price, float(pricer.std_error)
+
+        _, plain_error = mc_price()
+        price, error = mc_price(antithetic=True, control_variates=("spot",))
+        self.assertLess(error, plain_error / 3.0)
+        self.assertLess(abs(price - black), 4.0 * error)
+        # a companion GBM with a different volatility is still a strong control
+        price, error = mc_price(control_variates=("black",), control_volatility=0.25)
+        self.assertLess(error, plain_error / 10.0)
+        self.assertLess(abs(price - black), 4.0 * error)
+        # streamed prices do not depend on the chunk size
+        streamed = [
+            mc_price(antithetic=True, control_variates=("spot",), chunk_size=chunk_size)
+            for chunk_size in (2048, 5000, 8192)
+        ]
+        self.assertEqual(streamed[0], streamed[1])
+        self.assertEqual(streamed[0], streamed[2])
+        self.assertLess(abs(streamed[0][0] - black), 4.0 * streamed[0][1])
+        with self.assertRaises(ValueError):
+            tq.VanillaMCPricer(GeometricBrownianMotion(rate, vol, spot), control_variates=("delta",))
+
+
+if __name__ == "__main__":
+    unittest.main()